@@ -1,6 +1,11 @@
 """OAuth2 authentication with PKCE support"""
 
-from .oauth import OAuth2Manager
-from .token_manager import TokenManager
+from ..utils.lazy import lazy_exports
+
+# Importing TokenManager does not pull in the OAuth HTTP stack
+__getattr__ = lazy_exports(__name__, {
+    'OAuth2Manager': '.oauth',
+    'TokenManager': '.token_manager',
+})
 
 __all__ = ['OAuth2Manager', 'TokenManager']
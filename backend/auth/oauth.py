@@ -4,12 +4,10 @@ import secrets
 import hashlib
 import base64
 import json
-import urllib.request
-import urllib.parse
-import urllib.error
-import ssl
 from typing import Dict, Tuple, Optional
 
+from ..utils.ssl_context import get_ssl_context
+
 
 class OAuth2Manager:
     """
@@ -30,10 +28,10 @@ class OAuth2Manager:
         self.client_id = client_id
         self.logger = logger
 
-        # SSL context for Steam Deck (certificates may not be properly configured)
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
+    @property
+    def ssl_context(self):
+        """Shared SSL context (certificates may not be properly configured on Steam Deck)."""
+        return get_ssl_context()
 
     def generate_pkce_pair(self) -> Tuple[str, str]:
         """
@@ -79,6 +77,12 @@ class OAuth2Manager:
         if self.logger:
             self.logger.info("Discord Lite: Exchanging authorization code for token (PKCE)...")
 
+        # Imported here: urllib.request pulls in http.client and email (~10 ms),
+        # and most sessions log in with a saved token and never get here
+        import urllib.error
+        import urllib.parse
+        import urllib.request
+
         # Build request payload (no client_secret needed for PKCE)
         data_dict = {
             "grant_type": "authorization_code",
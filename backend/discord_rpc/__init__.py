@@ -3,5 +3,8 @@
 from .client import DiscordRPCClient
 from .protocol import RPCOpcode, encode_message, decode_message
 from .events import EventType
+from .metrics import RPCMetrics
+from .recorder import FrameRecorder, read_recording
 
-__all__ = ['DiscordRPCClient', 'RPCOpcode', 'encode_message', 'decode_message', 'EventType']
+__all__ = ['DiscordRPCClient', 'RPCOpcode', 'encode_message', 'decode_message', 'EventType', 'RPCMetrics',
+           'FrameRecorder', 'read_recording']
@@ -1,12 +1,21 @@
 """Discord RPC client with IPC socket communication"""
 
+import select
 import socket
 import secrets
-from typing import Optional, Dict, Any, List
+import logging
+import struct
+import threading
+import time
+from typing import Optional, Dict, Any, List, Set, Callable
 
 from .protocol import RPCOpcode, encode_message, decode_message
 from .events import SpeakingTracker, process_event
-from ..utils.socket_finder import find_discord_ipc_socket
+from .metrics import RPCMetrics, OUTCOME_OK, OUTCOME_ERROR, OUTCOME_TIMEOUT, OUTCOME_FAILED
+from .recorder import FrameRecorder, DIRECTION_SENT, DIRECTION_RECEIVED
+from ..utils.socket_finder import find_discord_ipc_socket, get_socket_finder
+from ..utils.log import trace, log_limited
+from ..utils.tracing import tracer
 
 
 class DiscordRPCClient:
@@ -16,25 +25,48 @@ class DiscordRPCClient:
     Handles socket connection, authentication, and command execution.
     """
 
-    def __init__(self, client_id: str, logger=None):
+    def __init__(self, client_id: str, logger=None, metrics: Optional[RPCMetrics] = None,
+                 ipc_path: Optional[str] = None, recorder: Optional[FrameRecorder] = None):
         """
         Initialize Discord RPC client.
 
         Args:
             client_id: Discord application client ID
             logger: Logger instance for logging operations
+            metrics: Shared RPCMetrics (a private instance is created if None)
+            ipc_path: IPC socket to use instead of auto-detection
+                      (e.g., tools/fake_ipc_server.py)
+            recorder: Traffic recorder (opt-in; None = no recording)
         """
         self.client_id = client_id
         self.logger = logger
+        self.ipc_path = ipc_path
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.authenticated = False
         self.access_token: Optional[str] = None
         self.user: Optional[Dict[str, Any]] = None
 
+        # Events with an active subscription on this connection
+        self.subscriptions: Set[str] = set()
+
         # Speaking tracker for voice events
         self.speaking_tracker = SpeakingTracker()
 
+        # Serializes socket round trips between the event loop and the
+        # background poller thread (re-entrant for nested commands)
+        self._lock = threading.RLock()
+
+        # Callbacks invoked for every DISPATCH event received
+        self._event_listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+        # Command latency / reply size / reconnect metrics
+        self.metrics = metrics if metrics is not None else RPCMetrics()
+        self._last_frame_size = 0
+
+        # Every frame in both directions goes here while set (see recorder.py)
+        self.recorder = recorder
+
     def connect(self) -> bool:
         """
         Connect to Discord IPC socket and perform handshake.
@@ -42,12 +74,17 @@ class DiscordRPCClient:
         Returns:
             True if connection successful, False otherwise
         """
-        ipc_path = find_discord_ipc_socket(self.logger)
+        ipc_path = self.ipc_path or find_discord_ipc_socket(self.logger)
         if not ipc_path:
             if self.logger:
                 self.logger.error("Discord Lite: Discord IPC socket not found")
             return False
 
+        with self._lock:
+            return self._connect(ipc_path)
+
+    def _connect(self, ipc_path: str) -> bool:
+        """Open socket and perform handshake (caller holds the lock)."""
         try:
             self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self.socket.settimeout(60.0)
@@ -55,38 +92,45 @@ class DiscordRPCClient:
 
             # Send handshake
             handshake_payload = {"v": 1, "client_id": self.client_id}
-            self.socket.send(encode_message(RPCOpcode.HANDSHAKE, handshake_payload))
+            self._send_frame(RPCOpcode.HANDSHAKE, handshake_payload)
 
             # Wait for READY response
-            response_data = self.socket.recv(4096)
-            opcode, payload = decode_message(response_data, self.logger)
+            opcode, payload = self._recv_frame()
 
             if payload and payload.get("cmd") == "DISPATCH" and payload.get("evt") == "READY":
                 self.connected = True
+                self.metrics.record_connect(True)
                 if self.logger:
                     self.logger.info("Discord Lite: Connected to Discord IPC")
                 return True
             else:
+                self.metrics.record_connect(False)
                 if self.logger:
                     self.logger.error(f"Discord Lite: Unexpected handshake response: {payload}")
                 return False
 
         except Exception as e:
+            self.metrics.record_connect(False)
+            if isinstance(e, ConnectionRefusedError):
+                # Socket file left behind by a Discord that is gone; skip it from now on
+                get_socket_finder().mark_dead(ipc_path)
             if self.logger:
                 self.logger.error(f"Discord Lite: Connection error: {e}")
             return False
 
     def disconnect(self) -> None:
         """Close socket connection and reset state."""
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
+        with self._lock:
+            if self.socket:
+                try:
+                    self.socket.close()
+                except:
+                    pass
+                self.socket = None
 
         self.connected = False
         self.authenticated = False
+        self.subscriptions.clear()
         self.speaking_tracker.clear()
 
     def send_command(self, cmd: str, args: Optional[Dict[str, Any]] = None, nonce: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -106,8 +150,8 @@ class DiscordRPCClient:
             {"cmd": "SET_VOICE_SETTINGS", "data": {...}}
         """
         if not self.socket:
-            if self.logger:
-                self.logger.error("Discord Lite: Cannot send command - not connected")
+            log_limited(self.logger, "rpc.not_connected", logging.ERROR,
+                        "Discord Lite: Cannot send command - not connected")
             return None
 
         if nonce is None:
@@ -118,17 +162,15 @@ class DiscordRPCClient:
             payload["args"] = args
 
         try:
-            self.socket.send(encode_message(RPCOpcode.FRAME, payload))
-            response_data = self.socket.recv(8192)
-            opcode, result = decode_message(response_data, self.logger)
+            result = self._request(payload)
 
-            if self.logger:
-                self.logger.info(f"Discord Lite: Command {cmd} response: {result}")
+            # Full bodies only reach the log in verbose/debug mode
+            trace(self.logger, "Discord Lite: Command %s response: %s", cmd, result)
             return result
 
         except Exception as e:
-            if self.logger:
-                self.logger.error(f"Discord Lite: Error sending command {cmd}: {e}")
+            log_limited(self.logger, f"rpc.send_error.{cmd}", logging.ERROR,
+                        "Discord Lite: Error sending command %s: %s", cmd, e)
             return None
 
     def authorize(self, scopes: List[str], code_challenge: Optional[str] = None) -> Optional[str]:
@@ -173,7 +215,8 @@ class DiscordRPCClient:
         """
         result = self.send_command("AUTHENTICATE", {"access_token": access_token})
 
-        if result and result.get("data"):
+        # Rejected tokens get an ERROR reply, which also carries data (code, message)
+        if result and result.get("evt") != "ERROR" and result.get("data"):
             self.authenticated = True
             self.user = result["data"].get("user")
             self.access_token = access_token
@@ -206,55 +249,255 @@ class DiscordRPCClient:
         if args:
             payload["args"] = args
 
+        if not self.socket:
+            return False
+
         try:
-            self.socket.send(encode_message(RPCOpcode.FRAME, payload))
-            response_data = self.socket.recv(4096)
-            opcode, result = decode_message(response_data, self.logger)
+            result = self._request(payload)
+            trace(self.logger, "Discord Lite: SUBSCRIBE %s reply: %s", event, result)
+
+            success = result is not None and result.get("evt") == event
+            if success:
+                self.subscriptions.add(event)
+            return success
 
+        except Exception as e:
             if self.logger:
-                self.logger.info(f"Discord Lite: Subscribed to {event}: {result}")
+                self.logger.error(f"Discord Lite: Error subscribing to {event}: {e}")
+            return False
+
+    def unsubscribe(self, event: str, args: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Unsubscribe from Discord RPC event.
+
+        Args:
+            event: Event name (e.g., "VOICE_STATE_CREATE")
+            args: Same filter arguments used to subscribe
+
+        Returns:
+            True if unsubscription successful, False otherwise
+        """
+        self.subscriptions.discard(event)
+
+        if not self.socket:
+            return False
+
+        payload = {
+            "cmd": "UNSUBSCRIBE",
+            "evt": event,
+            "nonce": secrets.token_hex(16)
+        }
+
+        if args:
+            payload["args"] = args
+
+        try:
+            result = self._request(payload)
             return result is not None and result.get("evt") == event
 
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Discord Lite: Error subscribing to {event}: {e}")
+                self.logger.error(f"Discord Lite: Error unsubscribing from {event}: {e}")
             return False
 
+    def is_subscribed(self, event: str) -> bool:
+        """
+        Check if an event subscription is live on this connection.
+
+        Args:
+            event: Event name (e.g., "VOICE_STATE_CREATE")
+
+        Returns:
+            True if subscribed
+        """
+        return self.connected and event in self.subscriptions
+
     def receive_event(self, timeout: float = 0.1) -> Optional[Dict[str, Any]]:
         """
         Receive event from Discord (non-blocking).
 
         Args:
-            timeout: Socket timeout in seconds
+            timeout: Seconds to wait for an event
+
+        A closed or broken socket marks the connection lost (connected
+        off, subscriptions and speaking state cleared), so the poller stops pumping and
+        member polling takes over until the next connect.
 
         Returns:
             Event payload or None if no event available
         """
-        if not self.socket:
+        if not self.socket or not self.connected:
             return None
 
         try:
-            old_timeout = self.socket.gettimeout()
-            self.socket.settimeout(timeout)
+            with self._lock:
+                readable, _, _ = select.select([self.socket], [], [], timeout)
+                if not readable:
+                    return None
 
-            response_data = self.socket.recv(4096)
-            self.socket.settimeout(old_timeout)
-
-            opcode, payload = decode_message(response_data, self.logger)
+                opcode, payload = self._recv_frame()
 
             # Process event through event system
-            if payload:
-                process_event(payload, self.speaking_tracker, self.logger)
+            if payload and payload.get("cmd") == "DISPATCH":
+                self._dispatch(payload)
 
             return payload
 
         except socket.timeout:
             return None
+        except OSError as e:
+            self.connected = False
+            self.subscriptions.clear()
+            self.speaking_tracker.clear()
+            log_limited(self.logger, "rpc.connection_lost", logging.ERROR,
+                        "Discord Lite: Connection lost while receiving events: %s", e)
+            return None
         except Exception as e:
-            if self.logger:
-                self.logger.error(f"Discord Lite: Error receiving event: {e}")
+            log_limited(self.logger, "rpc.receive_error", logging.ERROR,
+                        "Discord Lite: Error receiving event: %s", e)
             return None
 
+    def pump_events(self, max_events: int = 100) -> int:
+        """
+        Dispatch all events already waiting on the socket (never blocks).
+
+        Args:
+            max_events: Upper bound on events handled per call
+
+        Returns:
+            Number of events dispatched
+        """
+        count = 0
+        while count < max_events and self.receive_event(timeout=0) is not None:
+            count += 1
+        return count
+
+    def add_event_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Register callback for DISPATCH events.
+
+        Callbacks run on whichever thread read the event (including inside
+        send_command), so they must only update state and never issue RPC
+        commands themselves.
+
+        Args:
+            callback: Function receiving the raw event payload
+        """
+        self._event_listeners.append(callback)
+
+    def _dispatch(self, payload: Dict[str, Any]) -> None:
+        """Route an incoming DISPATCH event to trackers and listeners."""
+        self.metrics.record_event(payload.get("evt"))
+        process_event(payload, self.speaking_tracker, self.logger)
+
+        for callback in self._event_listeners:
+            try:
+                callback(payload)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Discord Lite: Error in event listener: {e}")
+
+    def _recv_exact(self, size: int) -> bytes:
+        """Read exactly size bytes from the socket."""
+        chunks = []
+        remaining = size
+
+        while remaining:
+            chunk = self.socket.recv(remaining)
+            if not chunk:
+                raise ConnectionError("Discord closed the IPC socket")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        return b"".join(chunks)
+
+    def _recv_frame(self):
+        """
+        Read one complete frame (caller holds the lock).
+
+        Returns:
+            Tuple of (opcode, payload) as from decode_message
+        """
+        with tracer.span("recv", "rpc"):
+            header = self._recv_exact(8)
+            _, length = struct.unpack('<II', header)
+            body = self._recv_exact(length) if length else b""
+        self._last_frame_size = length
+
+        with tracer.span("decode", "rpc"):
+            opcode, payload = decode_message(header + body, self.logger)
+
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.record(DIRECTION_RECEIVED, opcode, payload)
+
+        return opcode, payload
+
+    def _send_frame(self, opcode: int, payload: Dict[str, Any]) -> None:
+        """Encode and send one frame (caller holds the lock)."""
+        self.socket.send(encode_message(opcode, payload))
+
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.record(DIRECTION_SENT, opcode, payload)
+
+    def _request(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Send a frame and wait for the reply with the same nonce.
+
+        DISPATCH events that arrive first are dispatched; replies to
+        earlier requests that already gave up are discarded. Latency
+        (including time spent waiting for the socket lock), reply size and
+        outcome are recorded per command when metrics are enabled.
+        """
+        metrics = self.metrics
+        if not metrics.enabled:
+            return self._request_locked(payload)[0]
+
+        cmd = payload.get("cmd", "UNKNOWN")
+        start = time.perf_counter()
+
+        try:
+            result, reply_bytes = self._request_locked(payload)
+        except socket.timeout:
+            metrics.record_command(cmd, time.perf_counter() - start, 0, OUTCOME_TIMEOUT)
+            raise
+        except Exception:
+            metrics.record_command(cmd, time.perf_counter() - start, 0, OUTCOME_FAILED)
+            raise
+
+        outcome = OUTCOME_ERROR if not result or result.get("evt") == "ERROR" else OUTCOME_OK
+        metrics.record_command(cmd, time.perf_counter() - start, reply_bytes, outcome)
+        return result
+
+    def _request_locked(self, payload: Dict[str, Any]):
+        """
+        Send a frame and read frames until the matching reply.
+
+        Returns:
+            Tuple of (reply payload or None, reply body size in bytes)
+        """
+        nonce = payload.get("nonce")
+
+        # Span covers lock wait, send, Discord's reply time and decoding
+        with tracer.span(payload.get("cmd", "UNKNOWN"), "rpc"), self._lock:
+            with tracer.span("send", "rpc"):
+                self._send_frame(RPCOpcode.FRAME, payload)
+
+            while True:
+                opcode, result = self._recv_frame()
+
+                if result is None or opcode == RPCOpcode.CLOSE:
+                    return result, self._last_frame_size
+
+                if result.get("nonce") == nonce:
+                    return result, self._last_frame_size
+
+                if result.get("cmd") == "DISPATCH":
+                    self._dispatch(result)
+                elif self.logger:
+                    self.logger.debug("Discord Lite: Discarding stale reply for %s", result.get("cmd"))
+
     def get_speaking_users(self) -> List[str]:
         """
         Get list of users currently speaking in voice channel.
@@ -264,6 +507,15 @@ class DiscordRPCClient:
         """
         return self.speaking_tracker.get_speaking_users()
 
+    def get_speaking_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-user speaking statistics (total talk time, last spoke).
+
+        Returns:
+            Dictionary mapping user ID to stats dictionary
+        """
+        return self.speaking_tracker.get_stats()
+
     def subscribe_speaking_events(self, channel_id: str) -> bool:
         """
         Subscribe to speaking events for a voice channel.
@@ -289,6 +541,53 @@ class DiscordRPCClient:
                 self.logger.error(f"Discord Lite: Error subscribing to speaking events: {e}")
             return False
 
+    def unsubscribe_speaking_events(self, channel_id: str) -> None:
+        """
+        Drop speaking event subscriptions for a voice channel.
+
+        Args:
+            channel_id: Voice channel ID used when subscribing
+        """
+        self.unsubscribe("SPEAKING_START", {"channel_id": channel_id})
+        self.unsubscribe("SPEAKING_STOP", {"channel_id": channel_id})
+
+    VOICE_STATE_EVENTS = ("VOICE_STATE_CREATE", "VOICE_STATE_UPDATE", "VOICE_STATE_DELETE")
+
+    def subscribe_voice_state_events(self, channel_id: str) -> bool:
+        """
+        Subscribe to member join/update/leave events for a voice channel.
+
+        Args:
+            channel_id: Voice channel ID
+
+        Returns:
+            True if all subscriptions succeeded
+        """
+        try:
+            success = True
+            for event in self.VOICE_STATE_EVENTS:
+                success &= self.subscribe(event, {"channel_id": channel_id})
+
+            if success and self.logger:
+                self.logger.info(f"Discord Lite: Subscribed to voice state events for channel {channel_id}")
+
+            return success
+
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Discord Lite: Error subscribing to voice state events: {e}")
+            return False
+
+    def unsubscribe_voice_state_events(self, channel_id: str) -> None:
+        """
+        Drop member event subscriptions for a voice channel.
+
+        Args:
+            channel_id: Voice channel ID used when subscribing
+        """
+        for event in self.VOICE_STATE_EVENTS:
+            self.unsubscribe(event, {"channel_id": channel_id})
+
     def close(self) -> None:
         """Alias for disconnect() for compatibility."""
         self.disconnect()
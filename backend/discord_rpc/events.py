@@ -1,8 +1,10 @@
 """Discord RPC event system"""
 
-from enum import Enum
-from typing import Dict, Any, Optional
+import heapq
+import threading
 import time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 class EventType(str, Enum):
@@ -14,22 +16,63 @@ class EventType(str, Enum):
     VOICE_STATE_UPDATE = "VOICE_STATE_UPDATE"
 
 
+_CLOCK_ID = getattr(time, "CLOCK_BOOTTIME", time.CLOCK_MONOTONIC)
+
+
+def _clock() -> float:
+    """
+    Monotonic seconds that keep counting during suspend.
+
+    CLOCK_BOOTTIME never jumps on NTP adjustments like time.time(), and
+    unlike CLOCK_MONOTONIC it includes time spent asleep, so entries
+    expire correctly after the Deck resumes. Falls back to time.monotonic().
+    """
+    return time.clock_gettime(_CLOCK_ID)
+
+
+class SpeakerStats:
+    """Per-user speaking statistics, updated incrementally"""
+
+    __slots__ = ("total_seconds", "last_spoke", "started")
+
+    def __init__(self):
+        self.total_seconds = 0.0
+        self.last_spoke: Optional[float] = None
+        self.started: Optional[float] = None  # Start of the current speaking spurt
+
+
 class SpeakingTracker:
     """
     Tracks which users are currently speaking in voice channel.
 
-    Uses timestamp-based tracking to automatically expire stale entries.
+    Each SPEAKING_START sets an expiry deadline; deadlines live in a
+    min-heap with lazy deletion (superseded entries are skipped when
+    popped), so expiring is O(log n) per event instead of rebuilding the
+    whole dict on every read. The current speakers are the keys of a
+    dict, so membership and listing never scan stale entries.
+
+    Statistics cover the current voice channel only: set_channel() with
+    a different channel drops them, so they stay bounded by the people
+    met in one channel rather than everyone ever heard.
     """
 
-    def __init__(self, expiry_seconds: float = 2.0):
+    def __init__(self, expiry_seconds: float = 2.0, clock: Callable[[], float] = _clock):
         """
         Initialize speaking tracker.
 
         Args:
             expiry_seconds: How long to keep users as "speaking" without updates
+            clock: Monotonic time source in seconds
         """
         self.expiry_seconds = expiry_seconds
-        self._speaking_users: Dict[str, float] = {}  # user_id -> timestamp
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._deadlines: Dict[str, float] = {}  # user_id -> expiry deadline (current speakers)
+        self._heap: List[Tuple[float, str]] = []
+        self._stats: Dict[str, SpeakerStats] = {}
+        self._version = 0  # Bumped whenever the speaker set changes
+        self.channel_id: Optional[str] = None  # Channel the statistics belong to
 
     def mark_speaking(self, user_id: str) -> None:
         """
@@ -38,7 +81,21 @@ class SpeakingTracker:
         Args:
             user_id: Discord user ID
         """
-        self._speaking_users[user_id] = time.time()
+        now = self.clock()
+        deadline = now + self.expiry_seconds
+
+        with self._lock:
+            self._expire(now)
+
+            if user_id not in self._deadlines:
+                stats = self._stats.get(user_id)
+                if stats is None:
+                    stats = self._stats[user_id] = SpeakerStats()
+                stats.started = now
+                self._version += 1
+
+            self._deadlines[user_id] = deadline
+            heapq.heappush(self._heap, (deadline, user_id))
 
     def mark_stopped(self, user_id: str) -> None:
         """
@@ -47,28 +104,26 @@ class SpeakingTracker:
         Args:
             user_id: Discord user ID
         """
-        if user_id in self._speaking_users:
-            del self._speaking_users[user_id]
+        now = self.clock()
+
+        with self._lock:
+            if self._deadlines.pop(user_id, None) is not None:
+                self._end_spurt(user_id, now)
+                self._version += 1
+            self._expire(now)
 
     def get_speaking_users(self) -> list[str]:
         """
         Get list of users currently speaking.
 
-        Automatically removes stale entries (older than expiry_seconds).
+        Expired entries are removed from the heap top first.
 
         Returns:
             List of user IDs currently speaking
         """
-        now = time.time()
-
-        # Clean up stale entries
-        self._speaking_users = {
-            user_id: timestamp
-            for user_id, timestamp in self._speaking_users.items()
-            if now - timestamp < self.expiry_seconds
-        }
-
-        return list(self._speaking_users.keys())
+        with self._lock:
+            self._expire(self.clock())
+            return list(self._deadlines)
 
     def is_speaking(self, user_id: str) -> bool:
         """
@@ -80,21 +135,95 @@ class SpeakingTracker:
         Returns:
             True if user is speaking, False otherwise
         """
-        if user_id not in self._speaking_users:
-            return False
+        with self._lock:
+            self._expire(self.clock())
+            return user_id in self._deadlines
+
+    def get_version(self) -> int:
+        """
+        Get a counter that changes whenever the speaker set changes.
 
-        timestamp = self._speaking_users[user_id]
-        is_active = time.time() - timestamp < self.expiry_seconds
+        Returns:
+            Version number (after expiring stale speakers)
+        """
+        with self._lock:
+            self._expire(self.clock())
+            return self._version
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-user speaking statistics.
 
-        # Clean up if expired
-        if not is_active:
-            del self._speaking_users[user_id]
+        Returns:
+            Dictionary mapping user ID to total_seconds (including an
+            ongoing spurt), last_spoke_seconds_ago and speaking flag
+        """
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+
+            result = {}
+            for user_id, stats in self._stats.items():
+                speaking = user_id in self._deadlines
+                total = stats.total_seconds
+                if speaking and stats.started is not None:
+                    total += now - stats.started
+
+                result[user_id] = {
+                    "total_seconds": round(total, 2),
+                    "last_spoke_seconds_ago": 0.0 if speaking else (
+                        round(now - stats.last_spoke, 2) if stats.last_spoke is not None else None
+                    ),
+                    "speaking": speaking,
+                }
+            return result
+
+    def set_channel(self, channel_id: Optional[str]) -> bool:
+        """
+        Record the current voice channel, clearing everything if it changed.
+
+        Args:
+            channel_id: Voice channel ID (None when not in voice)
+
+        Returns:
+            True if the channel changed and the tracker was cleared
+        """
+        with self._lock:
+            if channel_id == self.channel_id:
+                return False
+            self.channel_id = channel_id
 
-        return is_active
+        self.clear()
+        return True
 
     def clear(self) -> None:
-        """Clear all speaking users."""
-        self._speaking_users.clear()
+        """Clear all speaking users and statistics."""
+        with self._lock:
+            self._deadlines.clear()
+            self._heap.clear()
+            self._stats.clear()
+            self._version += 1
+
+    def _expire(self, now: float) -> None:
+        """Pop due deadlines, skipping superseded heap entries (lock held)."""
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, user_id = heapq.heappop(heap)
+            if self._deadlines.get(user_id) == deadline:
+                del self._deadlines[user_id]
+                # Shown as speaking until the deadline, so count until then
+                self._end_spurt(user_id, deadline)
+                self._version += 1
+
+    def _end_spurt(self, user_id: str, end: float) -> None:
+        """Fold the current spurt into the user's totals (lock held)."""
+        stats = self._stats.get(user_id)
+        if stats is None or stats.started is None:
+            return
+
+        stats.total_seconds += max(0.0, end - stats.started)
+        stats.last_spoke = end
+        stats.started = None
 
 
 def process_event(event_payload: Dict[str, Any], speaking_tracker: SpeakingTracker, logger=None) -> Optional[EventType]:
@@ -117,7 +246,7 @@ def process_event(event_payload: Dict[str, Any], speaking_tracker: SpeakingTrack
         if user_id:
             speaking_tracker.mark_speaking(user_id)
             if logger:
-                logger.debug(f"Discord Lite: User {user_id} started speaking")
+                logger.debug("Discord Lite: User %s started speaking", user_id)
         return EventType.SPEAKING_START
 
     elif event_name == "SPEAKING_STOP":
@@ -126,13 +255,15 @@ def process_event(event_payload: Dict[str, Any], speaking_tracker: SpeakingTrack
         if user_id:
             speaking_tracker.mark_stopped(user_id)
             if logger:
-                logger.debug(f"Discord Lite: User {user_id} stopped speaking")
+                logger.debug("Discord Lite: User %s stopped speaking", user_id)
         return EventType.SPEAKING_STOP
 
     elif event_name == "VOICE_SETTINGS_UPDATE":
         return EventType.VOICE_SETTINGS_UPDATE
 
     elif event_name == "VOICE_CHANNEL_SELECT":
+        data = event_payload.get("data") or {}
+        speaking_tracker.set_channel(data.get("channel_id"))
         return EventType.VOICE_CHANNEL_SELECT
 
     elif event_name == "VOICE_STATE_UPDATE":
@@ -0,0 +1,154 @@
+"""RPC command metrics (latency, reply size, timeouts, reconnects)"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ..utils.histogram import Histogram
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"      # Discord replied with evt=ERROR
+OUTCOME_TIMEOUT = "timeout"  # Socket timed out waiting for the reply
+OUTCOME_FAILED = "failed"    # Any other exception (broken pipe, closed socket, ...)
+
+
+class CommandStats:
+    """Counters and latency histogram for one RPC command"""
+
+    __slots__ = ("outcomes", "latency", "reply_bytes", "max_reply_bytes")
+
+    def __init__(self):
+        self.outcomes: Dict[str, int] = {}
+        self.latency = Histogram()
+        self.reply_bytes = 0
+        self.max_reply_bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for diagnostics."""
+        count = self.latency.total
+        return {
+            "count": count,
+            "outcomes": dict(self.outcomes),
+            "latency": self.latency.to_dict(),
+            "reply_bytes_mean": round(self.reply_bytes / count) if count else None,
+            "reply_bytes_max": self.max_reply_bytes,
+        }
+
+
+class RPCMetrics:
+    """
+    Per-command metrics for DiscordRPCClient.
+
+    One instance is shared across reconnects (the Plugin passes it to
+    every client it creates), so reconnect counts and history survive a
+    new client. When disabled, the client skips timing entirely and
+    record calls return immediately: the only cost is one attribute check
+    per command.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize metrics.
+
+        Args:
+            enabled: Start collecting immediately
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all collected metrics."""
+        with self._lock:
+            self.commands: Dict[str, CommandStats] = {}
+            self.events: Dict[str, int] = {}
+            self.connects = 0
+            self.connect_failures = 0
+            self.started_at = time.monotonic()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable collection (collected data is kept).
+
+        Args:
+            enabled: True to collect
+        """
+        self.enabled = bool(enabled)
+
+    def record_command(self, cmd: str, seconds: float, reply_bytes: int, outcome: str) -> None:
+        """
+        Record one command round trip.
+
+        Args:
+            cmd: Command name
+            seconds: Round-trip time including waiting for the socket lock
+            reply_bytes: Size of the reply frame body
+            outcome: One of the OUTCOME_* constants
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            stats = self.commands.get(cmd)
+            if stats is None:
+                stats = self.commands[cmd] = CommandStats()
+
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+            stats.latency.record(seconds * 1000)
+            stats.reply_bytes += reply_bytes
+            if reply_bytes > stats.max_reply_bytes:
+                stats.max_reply_bytes = reply_bytes
+
+    def record_event(self, evt: Optional[str]) -> None:
+        """
+        Count one DISPATCH event.
+
+        Args:
+            evt: Event name
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            key = evt or "UNKNOWN"
+            self.events[key] = self.events.get(key, 0) + 1
+
+    def record_connect(self, success: bool) -> None:
+        """
+        Count a connection attempt.
+
+        Args:
+            success: True if the handshake completed
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if success:
+                self.connects += 1
+            else:
+                self.connect_failures += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all metrics as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with per-command stats, totals, event counts and
+            connection counters
+        """
+        with self._lock:
+            commands = {cmd: stats.to_dict() for cmd, stats in self.commands.items()}
+            timeouts = sum(stats.outcomes.get(OUTCOME_TIMEOUT, 0) for stats in self.commands.values())
+
+            return {
+                "enabled": self.enabled,
+                "window_seconds": round(time.monotonic() - self.started_at, 1),
+                "commands": commands,
+                "total_commands": sum(c["count"] for c in commands.values()),
+                "timeouts": timeouts,
+                "events": dict(self.events),
+                "connects": self.connects,
+                "reconnects": max(0, self.connects - 1),
+                "connect_failures": self.connect_failures,
+            }
@@ -0,0 +1,175 @@
+"""IPC traffic recording to a compact binary log"""
+
+import json
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+MAGIC = b"DLREC\x01"
+
+DIRECTION_SENT = 0      # Plugin -> Discord
+DIRECTION_RECEIVED = 1  # Discord -> plugin
+
+_FLAG_RECEIVED = 0x01
+_FLAG_COMPRESSED = 0x02
+
+# flags, opcode, microseconds since start, body length
+_RECORD = struct.Struct('<BBQI')
+
+# Bodies at least this large are zlib-compressed (guild/member lists shrink ~10x)
+COMPRESS_THRESHOLD = 256
+
+# Keys whose string values never reach the log
+REDACTED_KEYS = frozenset({
+    "access_token", "refresh_token", "token", "code", "code_verifier", "code_challenge", "client_secret",
+})
+REDACTED = "<redacted>"
+
+
+def redact(value: Any) -> Any:
+    """
+    Copy a payload with credential strings replaced.
+
+    Only string values are replaced, so numeric fields sharing a key name
+    (e.g., the "code" of an ERROR reply) are kept.
+
+    Args:
+        value: Decoded JSON payload
+
+    Returns:
+        Redacted copy (unchanged objects are shared)
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in REDACTED_KEYS and isinstance(item, str) else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+class FrameRecorder:
+    """
+    Appends timestamped RPC frames to a binary log.
+
+    Each record is a 14-byte header (direction/compression flags, opcode,
+    microseconds since recording started, body length) followed by the
+    compact JSON body, zlib-compressed when large. Payloads are redacted
+    before they are written. Records are flushed as they are written, so
+    a crash loses at most the frame being written.
+
+    One recorder can be shared by successive clients (reconnects append
+    to the same log).
+    """
+
+    def __init__(self, path: str, clock=time.monotonic):
+        """
+        Open a new log file.
+
+        Args:
+            path: Output file (overwritten)
+            clock: Monotonic time source
+        """
+        self.path = path
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._started = clock()
+
+        # Stats
+        self.frames = 0
+        self.bytes_written = len(MAGIC)
+
+    @property
+    def closed(self) -> bool:
+        """True once close() was called."""
+        return self._file is None
+
+    def record(self, direction: int, opcode: Optional[int], payload: Optional[Dict[str, Any]]) -> None:
+        """
+        Append one frame.
+
+        Args:
+            direction: DIRECTION_SENT or DIRECTION_RECEIVED
+            opcode: Frame opcode
+            payload: Decoded payload (None for undecodable frames)
+        """
+        elapsed_us = int((self.clock() - self._started) * 1_000_000)
+        body = json.dumps(redact(payload), separators=(',', ':')).encode('utf-8')
+
+        flags = _FLAG_RECEIVED if direction == DIRECTION_RECEIVED else 0
+        if len(body) >= COMPRESS_THRESHOLD:
+            body = zlib.compress(body, 6)
+            flags |= _FLAG_COMPRESSED
+
+        record = _RECORD.pack(flags, opcode if opcode is not None else 0xFF, elapsed_us, len(body)) + body
+
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(record)
+            self._file.flush()
+            self.frames += 1
+            self.bytes_written += len(record)
+
+    def close(self) -> None:
+        """Finish the log."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recording path, frame count and size."""
+        return {
+            "path": self.path,
+            "frames": self.frames,
+            "bytes": self.bytes_written,
+            "seconds": round(self.clock() - self._started, 1),
+            "active": not self.closed,
+        }
+
+
+def read_recording(path: str) -> Iterator[Tuple[float, int, Optional[int], Optional[Dict[str, Any]]]]:
+    """
+    Read a log written by FrameRecorder.
+
+    A truncated last record (recording interrupted mid-write) is ignored.
+
+    Args:
+        path: Log file
+
+    Yields:
+        Tuples of (seconds since start, direction, opcode, payload)
+
+    Raises:
+        ValueError: If the file is not a recording
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a Discord Lite IPC recording: {path}")
+
+        while True:
+            header = f.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return
+
+            flags, opcode, elapsed_us, length = _RECORD.unpack(header)
+            body = f.read(length)
+            if len(body) < length:
+                return
+
+            if flags & _FLAG_COMPRESSED:
+                body = zlib.decompress(body)
+
+            direction = DIRECTION_RECEIVED if flags & _FLAG_RECEIVED else DIRECTION_SENT
+            yield (
+                elapsed_us / 1_000_000,
+                direction,
+                None if opcode == 0xFF else opcode,
+                json.loads(body.decode('utf-8')),
+            )
@@ -1,5 +1,8 @@
 """Background polling system for voice and game state"""
 
 from .voice_poller import VoicePoller
+from .scheduler import Job, JobScheduler
+from .policy import PollingPolicy, PolicyEngine
+from .event_log import EventLog
 
-__all__ = ['VoicePoller']
+__all__ = ['VoicePoller', 'Job', 'JobScheduler', 'PollingPolicy', 'PolicyEngine', 'EventLog']
@@ -0,0 +1,100 @@
+"""Bounded, cursor-based event log for frontend consumers"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+
+class EventLog:
+    """
+    Fixed-capacity ring buffer of events with sequence numbers.
+
+    Every event gets a monotonically increasing sequence number. Readers
+    keep their own cursor and call get_events_since(seq), so several UI
+    surfaces can consume the same stream without stealing events from
+    each other. When the buffer is full the oldest entry is dropped in
+    O(1); a reader whose cursor fell behind is told how many it missed.
+    """
+
+    DEFAULT_CAPACITY = 256
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize event log.
+
+        Args:
+            capacity: Maximum number of retained events
+        """
+        self.capacity = capacity
+        self._entries: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._last_seq = 0
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """
+        Add an event.
+
+        Args:
+            event: Event dictionary
+
+        Returns:
+            Sequence number assigned to the event
+        """
+        with self._lock:
+            self._last_seq += 1
+            self._entries.append((self._last_seq, event))
+            return self._last_seq
+
+    def get_events_since(self, seq: int = 0) -> Dict[str, Any]:
+        """
+        Get events newer than a cursor.
+
+        Args:
+            seq: Last sequence number the reader has seen (0 = from the start)
+
+        Returns:
+            Dictionary with 'events' (each carrying its 'seq'), 'last_seq'
+            (the reader's next cursor), 'overflow' and 'dropped' (events the
+            reader missed because they were evicted) and 'reset' (cursor was
+            ahead of the log, e.g. after a plugin reload)
+        """
+        with self._lock:
+            last_seq = self._last_seq
+
+            # Cursor from a previous plugin run: start over
+            reset = seq > last_seq
+            if reset:
+                seq = 0
+
+            if not self._entries or seq >= last_seq:
+                return {"events": [], "last_seq": last_seq, "overflow": False, "dropped": 0, "reset": reset}
+
+            first_seq = self._entries[0][0]
+            dropped = max(0, first_seq - seq - 1)
+
+            # Sequence numbers are contiguous, so the start index is direct
+            start = max(0, seq + 1 - first_seq)
+            entries = list(self._entries)[start:] if start else list(self._entries)
+
+        return {
+            "events": [{**event, "seq": entry_seq} for entry_seq, event in entries],
+            "last_seq": last_seq,
+            "overflow": dropped > 0,
+            "dropped": dropped,
+            "reset": reset,
+        }
+
+    def last_seq(self) -> int:
+        """Get the sequence number of the newest event (0 if none yet)."""
+        return self._last_seq
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get buffer usage for diagnostics."""
+        return {
+            "capacity": self.capacity,
+            "size": len(self._entries),
+            "last_seq": self._last_seq,
+        }
@@ -0,0 +1,235 @@
+"""Power- and context-aware polling interval policies"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Any
+
+
+@dataclass
+class PowerState:
+    """Battery / AC snapshot read from sysfs"""
+    on_ac: bool = True
+    battery_percent: Optional[int] = None
+    discharging: bool = False
+
+
+@dataclass
+class PollingContext:
+    """Everything a policy may base its decision on"""
+    power: PowerState
+    qam_visible: bool = False
+    game_running: bool = False
+    in_voice: bool = False
+    member_events_live: bool = False
+    events_live: bool = False
+    speaking_stream: bool = False
+
+
+def read_power_state(root: str = "/sys/class/power_supply") -> PowerState:
+    """
+    Read AC and battery state from sysfs.
+
+    On the Steam Deck this finds ACAD (type Mains) and BAT1 (type Battery).
+    Systems without a battery are reported as on AC.
+
+    Args:
+        root: power_supply sysfs directory
+
+    Returns:
+        PowerState snapshot
+    """
+    state = PowerState()
+    mains_seen = False
+    mains_online = False
+
+    try:
+        entries = os.listdir(root)
+    except OSError:
+        return state
+
+    for name in entries:
+        path = os.path.join(root, name)
+        supply_type = _read_sysfs(path, "type")
+
+        if supply_type in ("Mains", "USB", "USB_C", "USB_PD"):
+            mains_seen = True
+            if _read_sysfs(path, "online") == "1":
+                mains_online = True
+
+        elif supply_type == "Battery":
+            capacity = _read_sysfs(path, "capacity")
+            if capacity and capacity.isdigit():
+                state.battery_percent = int(capacity)
+            state.discharging = _read_sysfs(path, "status") == "Discharging"
+
+    # Without an AC adapter entry, trust the battery status
+    state.on_ac = mains_online if mains_seen else not state.discharging
+    return state
+
+
+def _read_sysfs(path: str, attribute: str) -> Optional[str]:
+    """Read a single sysfs attribute, None if missing."""
+    try:
+        with open(os.path.join(path, attribute), 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class PollingPolicy:
+    """
+    Default polling policy.
+
+    Subclass and override interval() to plug in a different strategy.
+
+    Rules:
+    - member_check is suspended while Discord pushes member events,
+      tightened while the QAM is open, and stretched on battery in-game
+    - event_pump only runs while event subscriptions are live, runs at
+      10 Hz while the speaking stream is on, and slows down when only
+      channel-switch events are expected
+    - game_sync is stretched on battery while a game runs (exits are
+      still noticed, just later)
+    - cache_refresh waits for AC power when possible
+    - everything is stretched further when the battery is low
+    """
+
+    QAM_MEMBER_INTERVAL = 5.0
+    IDLE_EVENT_PUMP_INTERVAL = 5.0
+    SPEAKING_PUMP_INTERVAL = 0.1  # Matches the speaking stream's 10 Hz default
+    LOW_BATTERY_PERCENT = 20
+
+    def interval(self, job_name: str, base: float, ctx: PollingContext) -> Optional[float]:
+        """
+        Compute effective interval for a job.
+
+        Args:
+            job_name: Scheduler job name
+            base: Interval the job would use without a policy
+            ctx: Current polling context
+
+        Returns:
+            Interval in seconds, or None to suspend the job
+        """
+        on_battery = not ctx.power.on_ac
+        low_battery = (
+            on_battery and ctx.power.battery_percent is not None
+            and ctx.power.battery_percent <= self.LOW_BATTERY_PERCENT
+        )
+
+        if job_name == "member_check":
+            if ctx.member_events_live:
+                return None
+            if ctx.qam_visible:
+                return min(base, self.QAM_MEMBER_INTERVAL)
+            if on_battery and ctx.game_running:
+                base *= 2
+
+        elif job_name == "event_pump":
+            if not ctx.events_live:
+                return None
+            if ctx.speaking_stream:
+                return min(base, self.SPEAKING_PUMP_INTERVAL)
+            if not ctx.member_events_live:
+                base = max(base, self.IDLE_EVENT_PUMP_INTERVAL)
+            if on_battery and ctx.game_running and not ctx.qam_visible:
+                base *= 2
+
+        elif job_name == "game_sync":
+            if on_battery and ctx.game_running:
+                base *= 2
+
+        elif job_name == "cache_refresh":
+            if on_battery:
+                base *= 4
+
+        if low_battery and not ctx.qam_visible:
+            base *= 2
+
+        return base
+
+
+class PolicyEngine:
+    """
+    Combines a polling policy with live context.
+
+    Power state is read from sysfs at most once per POWER_CACHE_SECONDS;
+    QAM visibility is pushed by the frontend; game/voice/subscription
+    state is pulled from a context callback.
+    """
+
+    POWER_CACHE_SECONDS = 30.0
+
+    def __init__(self, policy: Optional[PollingPolicy] = None,
+                 power_reader: Callable[[], PowerState] = read_power_state, logger=None):
+        """
+        Initialize policy engine.
+
+        Args:
+            policy: Policy to apply (defaults to PollingPolicy)
+            power_reader: Function returning current PowerState
+            logger: Logger instance for logging operations
+        """
+        self.policy = policy or PollingPolicy()
+        self.power_reader = power_reader
+        self.logger = logger
+
+        self.qam_visible = False
+        self.context_callback: Optional[Callable[[], Dict[str, Any]]] = None
+
+        self._power = PowerState()
+        self._power_read_at = 0.0
+
+    def set_qam_visible(self, visible: bool) -> bool:
+        """
+        Record QAM visibility.
+
+        Args:
+            visible: True when the plugin panel is open
+
+        Returns:
+            True if the value changed
+        """
+        changed = self.qam_visible != visible
+        self.qam_visible = visible
+        return changed
+
+    def power_state(self) -> PowerState:
+        """Get (cached) power state."""
+        now = time.monotonic()
+        if now - self._power_read_at >= self.POWER_CACHE_SECONDS:
+            try:
+                self._power = self.power_reader()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Discord Lite: Error reading power state: {e}")
+            self._power_read_at = now
+        return self._power
+
+    def context(self) -> PollingContext:
+        """Build current polling context."""
+        ctx = PollingContext(power=self.power_state(), qam_visible=self.qam_visible)
+
+        if self.context_callback:
+            try:
+                for key, value in self.context_callback().items():
+                    setattr(ctx, key, bool(value))
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Discord Lite: Error in polling context callback: {e}")
+
+        return ctx
+
+    def interval_for(self, job_name: str, base: float) -> Optional[float]:
+        """
+        Get effective interval for a job.
+
+        Args:
+            job_name: Scheduler job name
+            base: Interval without policy
+
+        Returns:
+            Interval in seconds, or None to suspend
+        """
+        return self.policy.interval(job_name, base, self.context())
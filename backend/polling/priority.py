@@ -0,0 +1,101 @@
+"""CPU and I/O priority control for the background worker thread"""
+
+import os
+import ctypes
+import ctypes.util
+import threading
+
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+PRIORITY_IDLE = "idle"
+PRIORITY_MODES = (PRIORITY_NORMAL, PRIORITY_LOW, PRIORITY_IDLE)
+
+LOW_NICE = 10
+IDLE_NICE = 19
+
+# ioprio_set(2) constants
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_CLASS_BE = 2
+IOPRIO_CLASS_IDLE = 3
+IOPRIO_CLASS_SHIFT = 13
+
+_IOPRIO_SET_SYSCALL = {
+    "x86_64": 251,
+    "aarch64": 30,
+    "i686": 289,
+    "i386": 289,
+}.get(os.uname().machine)  # platform.machine() without importing platform
+
+
+def _load_libc():
+    """Load libc for the raw ioprio_set syscall, or None if unavailable."""
+    try:
+        return ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+
+
+_libc = _load_libc()
+
+
+def _set_ioprio(tid: int, io_class: int, level: int) -> bool:
+    """Set I/O priority of a thread. Returns True on success."""
+    if _libc is None or _IOPRIO_SET_SYSCALL is None:
+        return False
+
+    value = (io_class << IOPRIO_CLASS_SHIFT) | level
+    return _libc.syscall(_IOPRIO_SET_SYSCALL, IOPRIO_WHO_PROCESS, tid, value) == 0
+
+
+def apply_thread_priority(mode: str, logger=None) -> bool:
+    """
+    Apply a priority mode to the calling thread.
+
+    On Linux, nice values, scheduling policy and I/O priority are per
+    thread, so this only affects the thread it is called from (addressed
+    by its native thread id).
+
+    - normal: default scheduling, nice 0, default best-effort I/O
+    - low: nice 10, best-effort I/O at the lowest level
+    - idle: nice 19, idle I/O class
+
+    The worker takes the RPC socket lock, so it is never put under
+    SCHED_IDLE: a thread that only runs when a core would otherwise idle
+    can hold the lock indefinitely on a busy Deck while an interactive
+    call waits for it. Nice values still guarantee it a small CPU share.
+    Lowering nice again needs CAP_SYS_NICE, so priority cannot be raised
+    just while the lock is held; interactive callables wait for the lock
+    on an executor thread instead of the event loop.
+
+    Args:
+        mode: One of PRIORITY_MODES
+        logger: Logger instance for logging operations
+
+    Returns:
+        True if the mode was fully applied
+    """
+    tid = threading.get_native_id()
+    ok = True
+
+    try:
+        if mode == PRIORITY_NORMAL:
+            # Undo a previous low/idle mode (needs CAP_SYS_NICE)
+            os.setpriority(os.PRIO_PROCESS, tid, 0)
+            ok &= _set_ioprio(tid, IOPRIO_CLASS_BE, 4)
+        elif mode == PRIORITY_IDLE:
+            os.setpriority(os.PRIO_PROCESS, tid, IDLE_NICE)
+            ok &= _set_ioprio(tid, IOPRIO_CLASS_IDLE, 0)
+        elif mode == PRIORITY_LOW:
+            os.setpriority(os.PRIO_PROCESS, tid, LOW_NICE)
+            ok &= _set_ioprio(tid, IOPRIO_CLASS_BE, 7)
+        else:
+            return False
+
+    except (OSError, AttributeError) as e:
+        if logger:
+            logger.warning(f"Discord Lite: Could not apply {mode} priority to worker thread {tid}: {e}")
+        return False
+
+    if logger:
+        logger.info(f"Discord Lite: Worker thread {tid} running at {mode} priority")
+    return ok
@@ -0,0 +1,363 @@
+"""Asyncio job scheduler for background polling work"""
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Union
+
+from .priority import PRIORITY_NORMAL, PRIORITY_MODES, apply_thread_priority
+from ..utils.histogram import Histogram
+from ..utils.log import log_limited
+from ..utils.tracing import tracer
+
+
+class Job:
+    """
+    A periodic background job.
+
+    The job body is a plain (blocking) callable; the scheduler runs it on a
+    dedicated worker thread so the Decky event loop is never blocked.
+    """
+
+    def __init__(self, name: str, func: Callable[[], None],
+                 interval: Union[float, Callable[[], Optional[float]]],
+                 jitter: float = 0.1, initial_delay: float = 0.0):
+        """
+        Initialize job.
+
+        Args:
+            name: Unique job name (e.g., "member_check")
+            func: Callable executed on each tick
+            interval: Seconds between runs, or callable returning seconds
+                      (None from the callable suspends the job until next check)
+            jitter: Random spread applied to each interval (0.1 = ±10%)
+            initial_delay: Delay before first run in seconds
+        """
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.initial_delay = initial_delay
+
+        # Stats
+        self.runs = 0
+        self.errors = 0
+        self.overruns = 0
+        self.last_duration = 0.0
+        self.last_run: Optional[float] = None
+        self.running = False
+        # Worker-side run behind `running` (outlives a cancelled job task)
+        self._future: Optional[Future] = None
+
+        # Tick cost distributions (wall clock and worker thread CPU time)
+        self.wall_histogram = Histogram()
+        self.cpu_histogram = Histogram()
+
+    def next_interval(self) -> Optional[float]:
+        """
+        Compute delay until next run including jitter.
+
+        Returns:
+            Delay in seconds, or None if the job is currently suspended
+        """
+        base = self.interval() if callable(self.interval) else self.interval
+        if base is None:
+            return None
+
+        if self.jitter:
+            base *= 1.0 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, base)
+
+    def base_interval(self) -> Optional[float]:
+        """Get current interval without jitter."""
+        return self.interval() if callable(self.interval) else self.interval
+
+
+class JobScheduler:
+    """
+    Runs periodic jobs as asyncio tasks on the plugin's event loop.
+
+    Each job has its own cadence and task, so cancelling or retuning one
+    never affects the others. A job never overlaps with itself: the next
+    run is scheduled only after the previous one finished, and a run that
+    took longer than its interval is counted as an overrun instead of
+    triggering catch-up runs.
+    """
+
+    SUSPENDED_RECHECK_SECONDS = 5.0  # How often a suspended job re-evaluates its interval
+    ERROR_BACKOFF_SECONDS = 20.0
+
+    def __init__(self, logger=None, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Initialize scheduler.
+
+        Args:
+            logger: Logger instance for logging operations
+            executor: Executor for job bodies (defaults to one dedicated worker
+                      thread, so background jobs run one at a time)
+        """
+        self.logger = logger
+        self.executor = executor
+        self.jobs: Dict[str, Job] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Worker thread priority; applied lazily by the worker itself
+        self.worker_priority = PRIORITY_NORMAL
+        self._applied_priority = PRIORITY_NORMAL
+
+    # ==================== JOB MANAGEMENT ====================
+
+    def add_job(self, job: Job) -> Job:
+        """
+        Register a job (started immediately if the scheduler is running).
+
+        Args:
+            job: Job to add; replaces any job with the same name
+
+        Returns:
+            The registered job
+        """
+        self.remove_job(job.name)
+        self.jobs[job.name] = job
+
+        if self._loop is not None:
+            self._spawn(job)
+
+        return job
+
+    def remove_job(self, name: str) -> None:
+        """
+        Cancel and unregister a job.
+
+        Args:
+            name: Job name
+        """
+        task = self._tasks.pop(name, None)
+        if task:
+            task.cancel()
+        self.jobs.pop(name, None)
+
+    def wake(self, name: str) -> None:
+        """
+        Re-evaluate a job's interval now (e.g., after a policy change).
+
+        Restarts the job's sleep; a run in progress is not interrupted.
+
+        Args:
+            name: Job name
+        """
+        job = self.jobs.get(name)
+        if not job or self._loop is None or job.running:
+            return
+
+        task = self._tasks.pop(name, None)
+        if task:
+            task.cancel()
+        self._spawn(job)
+
+    def trigger(self, name: str) -> None:
+        """
+        Run a job as soon as possible (thread-safe).
+
+        Args:
+            name: Job name
+        """
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._trigger, name)
+
+    def _trigger(self, name: str) -> None:
+        """Restart a job's task with no delay (event loop thread)."""
+        job = self.jobs.get(name)
+        if not job or self._loop is None or job.running:
+            return
+
+        task = self._tasks.pop(name, None)
+        if task:
+            task.cancel()
+        self._spawn(job, delay=0.0)
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> None:
+        """
+        Start all registered jobs on the running event loop.
+
+        Must be called from within the loop. Calling start() again first
+        cancels the existing tasks, so restarts never multiply jobs.
+        """
+        self.stop()
+
+        self._loop = asyncio.get_running_loop()
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="discord-lite-poller")
+            self._applied_priority = PRIORITY_NORMAL  # Fresh worker thread
+
+        for job in self.jobs.values():
+            self._spawn(job)
+
+    def stop(self) -> None:
+        """Cancel all job tasks (safe to call when not running)."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._loop = None
+
+    async def shutdown(self) -> None:
+        """Cancel all jobs, wait for them to finish and release the worker thread."""
+        tasks = list(self._tasks.values())
+        self.stop()
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def is_running(self) -> bool:
+        """Check if the scheduler has live job tasks."""
+        return self._loop is not None
+
+    def set_worker_priority(self, mode: str) -> bool:
+        """
+        Set CPU/I/O priority for the worker thread.
+
+        Takes effect at the start of the next job run, on the worker
+        thread itself. Tick histograms are reset so costs before and
+        after the change can be compared.
+
+        Args:
+            mode: "normal", "low" or "idle"
+
+        Returns:
+            True if the mode is valid
+        """
+        if mode not in PRIORITY_MODES:
+            return False
+
+        if mode != self.worker_priority:
+            self.worker_priority = mode
+            self.reset_stats()
+        return True
+
+    def reset_stats(self) -> None:
+        """Reset per-job tick histograms."""
+        for job in self.jobs.values():
+            job.wall_histogram = Histogram()
+            job.cpu_histogram = Histogram()
+
+    # ==================== EXECUTION ====================
+
+    def _spawn(self, job: Job, delay: Optional[float] = None) -> None:
+        """Create the asyncio task driving a job."""
+        self._tasks[job.name] = self._loop.create_task(self._job_loop(job, delay), name=f"discord-lite:{job.name}")
+
+    async def _job_loop(self, job: Job, delay: Optional[float] = None) -> None:
+        """Sleep/run cycle for a single job."""
+        if delay is None:
+            delay = job.initial_delay if job.last_run is None else job.next_interval()
+
+        while True:
+            if delay is None:
+                # Suspended: re-check the interval periodically
+                await asyncio.sleep(self.SUSPENDED_RECHECK_SECONDS)
+                delay = job.next_interval()
+                continue
+
+            await asyncio.sleep(delay)
+
+            if not await self._run_once(job):
+                delay = self.ERROR_BACKOFF_SECONDS
+                continue
+
+            delay = job.next_interval()
+
+    async def _run_once(self, job: Job) -> bool:
+        """
+        Execute a job body on the worker thread.
+
+        Returns:
+            True if the job succeeded, False if it raised
+        """
+        start = time.monotonic()
+
+        # Cancelling the task does not stop a body already on the worker,
+        # so `running` is cleared when the body itself finishes
+        future = self.executor.submit(self._execute, job)
+        job._future = future
+        job.running = True
+        future.add_done_callback(lambda done: self._body_finished(job, done))
+
+        try:
+            cpu_seconds = await asyncio.wrap_future(future)
+            job.cpu_histogram.record(cpu_seconds * 1000)
+            return True
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            job.errors += 1
+            log_limited(self.logger, f"job.{job.name}.error", logging.ERROR,
+                        "Discord Lite: Error in %s job: %s", job.name, e)
+            return False
+
+        finally:
+            job.runs += 1
+            job.last_run = time.monotonic()
+            job.last_duration = job.last_run - start
+            job.wall_histogram.record(job.last_duration * 1000)
+
+            interval = job.base_interval()
+            if interval is not None and job.last_duration > interval:
+                job.overruns += 1
+                log_limited(self.logger, f"job.{job.name}.overrun", logging.WARNING,
+                            "Discord Lite: %s job overran its interval (%.1fs > %.1fs)",
+                            job.name, job.last_duration, interval)
+
+    @staticmethod
+    def _body_finished(job: Job, future: Future) -> None:
+        """Clear a job's running flag once its latest body is done (any thread)."""
+        if job._future is future:
+            job.running = False
+            job._future = None
+
+    def _execute(self, job: Job) -> float:
+        """
+        Run a job body on the worker thread.
+
+        Returns:
+            CPU time consumed by the worker thread in seconds
+        """
+        if self._applied_priority != self.worker_priority:
+            apply_thread_priority(self.worker_priority, self.logger)
+            self._applied_priority = self.worker_priority
+
+        cpu_start = time.thread_time()
+        with tracer.span(job.name, "poller"):
+            job.func()
+        return time.thread_time() - cpu_start
+
+    def get_stats(self) -> Dict[str, Dict[str, object]]:
+        """
+        Get per-job run statistics.
+
+        Returns:
+            Dictionary mapping job name to stats dictionary
+        """
+        return {
+            name: {
+                "runs": job.runs,
+                "errors": job.errors,
+                "overruns": job.overruns,
+                "last_duration_ms": round(job.last_duration * 1000, 2),
+                "interval": job.base_interval(),
+                "wall": job.wall_histogram.to_dict(),
+                "cpu": job.cpu_histogram.to_dict(),
+            }
+            for name, job in self.jobs.items()
+        }
@@ -1,19 +1,28 @@
-"""Background polling thread for voice channel events"""
+"""Background polling jobs for voice channel events"""
 
-import threading
-import time
-from queue import Queue
-from typing import Optional
+from .event_log import EventLog
+from .scheduler import Job, JobScheduler
+from .policy import PolicyEngine
+from ..voice.event_coalescer import MemberEventCoalescer
 
 
 class VoicePoller:
     """
     Background polling system for voice channel member changes and game sync.
 
-    Runs in separate thread to avoid blocking the main plugin thread.
-    Uses adaptive polling intervals to save battery when idle.
+    Runs each kind of background work as its own job on an asyncio
+    scheduler bound to the Decky event loop. Job bodies run on a single
+    dedicated worker thread, so background work never runs concurrently
+    with itself and never blocks the loop.
+    Uses adaptive polling intervals to save battery when idle, further
+    adjusted per job by a power- and context-aware policy.
     """
 
+    ACTIVE_INTERVAL = 15.0
+    IDLE_INTERVAL = 60.0
+    EVENT_PUMP_INTERVAL = 1.0
+    CACHE_REFRESH_INTERVAL = 3600.0
+
     def __init__(self, logger=None):
         """
         Initialize voice poller with default settings.
@@ -23,130 +32,234 @@ class VoicePoller:
         """
         self.logger = logger
         self.active = False
-        self.thread: Optional[threading.Thread] = None
-        self.event_queue = Queue()
+        self.scheduler = JobScheduler(logger)
+        self.policy_engine = PolicyEngine(logger=logger)
+        self.event_log = EventLog()
+        self._legacy_cursor = 0  # Cursor for get_pending_events()
+        self.member_events = MemberEventCoalescer()
 
         # Callbacks
         self.check_members_callback = None
         self.sync_game_callback = None
+        self.refresh_cache_callback = None
         self.is_active_callback = None  # Returns True if user is in voice or game running
 
-    def start(self, check_members_callback, sync_game_callback, is_active_callback) -> None:
+    def start(self, check_members_callback, sync_game_callback, is_active_callback,
+              refresh_cache_callback=None, context_callback=None, pump_events_callback=None) -> None:
         """
-        Start background polling thread.
+        Start background polling jobs.
+
+        Must be called from the event loop. Restarting replaces the previous
+        jobs instead of adding a second set.
 
         Args:
             check_members_callback: Function to check voice member changes
             sync_game_callback: Function to sync game status
             is_active_callback: Function returning True if user is active (in voice or game)
+            refresh_cache_callback: Function refreshing slow-changing caches (optional)
+            context_callback: Function returning policy context fields such as
+                              game_running, in_voice, member_events_live (optional)
+            pump_events_callback: Function dispatching pending RPC events (optional)
         """
         if self.active:
             if self.logger:
-                self.logger.warning("Discord Lite: Polling already active")
-            return
+                self.logger.info("Discord Lite: Restarting voice polling")
+            self.scheduler.stop()
 
         self.check_members_callback = check_members_callback
         self.sync_game_callback = sync_game_callback
         self.is_active_callback = is_active_callback
-
+        self.refresh_cache_callback = refresh_cache_callback
+        self.policy_engine.context_callback = context_callback
+
+        self.scheduler.add_job(Job(
+            "member_check",
+            check_members_callback,
+            lambda: self.policy_engine.interval_for("member_check", self._adaptive_interval())
+        ))
+        self.scheduler.add_job(Job(
+            "game_sync",
+            sync_game_callback,
+            lambda: self.policy_engine.interval_for("game_sync", self._adaptive_interval())
+        ))
+
+        if refresh_cache_callback:
+            self.scheduler.add_job(Job(
+                "cache_refresh",
+                refresh_cache_callback,
+                lambda: self.policy_engine.interval_for("cache_refresh", self.CACHE_REFRESH_INTERVAL),
+                initial_delay=self.ACTIVE_INTERVAL
+            ))
+        else:
+            self.scheduler.remove_job("cache_refresh")
+
+        if pump_events_callback:
+            self.scheduler.add_job(Job(
+                "event_pump",
+                pump_events_callback,
+                lambda: self.policy_engine.interval_for("event_pump", self.EVENT_PUMP_INTERVAL),
+                jitter=0.0
+            ))
+        else:
+            self.scheduler.remove_job("event_pump")
+
+        self.scheduler.start()
         self.active = True
-        self.thread = threading.Thread(target=self._polling_loop, daemon=True)
-        self.thread.start()
 
         if self.logger:
             self.logger.info("Discord Lite: Voice polling started")
 
     def stop(self) -> None:
-        """Stop background polling thread."""
+        """Stop background polling jobs."""
         self.active = False
-
-        if self.thread:
-            self.thread = None
+        self.scheduler.stop()
 
         if self.logger:
             self.logger.info("Discord Lite: Voice polling stopped")
 
-    def _polling_loop(self) -> None:
+    async def shutdown(self) -> None:
+        """Stop polling and wait for in-flight jobs to be cancelled."""
+        self.active = False
+        await self.scheduler.shutdown()
+
+        if self.logger:
+            self.logger.info("Discord Lite: Voice polling shut down")
+
+    def set_background_priority(self, mode: str) -> bool:
+        """
+        Set CPU/I/O priority of the worker thread running job bodies.
+
+        Args:
+            mode: "normal", "low" (nice 10) or "idle" (nice 19 + idle I/O)
+
+        Returns:
+            True if the mode is valid
+        """
+        return self.scheduler.set_worker_priority(mode)
+
+    def set_qam_visible(self, visible: bool) -> None:
+        """
+        Update QAM visibility and re-plan jobs if it changed.
+
+        Args:
+            visible: True when the plugin panel is open
+        """
+        if self.policy_engine.set_qam_visible(visible):
+            for name in list(self.scheduler.jobs):
+                self.scheduler.wake(name)
+
+    def trigger(self, job_name: str) -> None:
         """
-        Main polling loop with adaptive intervals.
+        Run a job as soon as possible (thread-safe).
+
+        Args:
+            job_name: Job name (e.g., "member_check")
+        """
+        self.scheduler.trigger(job_name)
+
+    def _adaptive_interval(self) -> float:
+        """
+        Get polling interval based on user activity.
 
         Uses 15-second intervals when active (in voice or game running),
         60-second intervals when idle to save battery.
         """
-        while self.active:
+        is_active = False
+        if self.is_active_callback:
             try:
-                loop_start_time = time.time()
-
-                # Execute callbacks
-                if self.check_members_callback:
-                    try:
-                        self.check_members_callback()
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.error(f"Discord Lite: Error in check_members callback: {e}")
-
-                if self.sync_game_callback:
-                    try:
-                        self.sync_game_callback()
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.error(f"Discord Lite: Error in sync_game callback: {e}")
-
-                # Determine polling interval based on activity
-                is_active = False
-                if self.is_active_callback:
-                    try:
-                        is_active = self.is_active_callback()
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.error(f"Discord Lite: Error in is_active callback: {e}")
-
-                # Adaptive interval: 15s when active, 60s when idle
-                target_interval = 15.0 if is_active else 60.0
-
-                # Calculate sleep time accounting for work done
-                elapsed = time.time() - loop_start_time
-                sleep_time = max(1.0, target_interval - elapsed)
-
-                time.sleep(sleep_time)
-
+                is_active = self.is_active_callback()
             except Exception as e:
                 if self.logger:
-                    self.logger.error(f"Discord Lite: Error in polling loop: {e}")
-                time.sleep(20.0)  # Error recovery delay
+                    self.logger.error(f"Discord Lite: Error in is_active callback: {e}")
+
+        return self.ACTIVE_INTERVAL if is_active else self.IDLE_INTERVAL
 
     def enqueue_event(self, event_type: str, **event_data) -> None:
         """
-        Add event to queue for frontend consumption.
+        Add event to the log for frontend consumption.
 
         Args:
             event_type: Event type string (e.g., "VOICE_JOIN")
             **event_data: Additional event data as keyword arguments
         """
         event = {"type": event_type, **event_data}
-        self.event_queue.put(event)
+        self.event_log.append(event)
+
+    def enqueue_member_event(self, event_type: str, member: dict) -> None:
+        """
+        Add a join/leave through the coalescing stage.
+
+        Flaps are merged and bursts collapsed before the event reaches
+        the frontend queue (see MemberEventCoalescer).
+
+        Args:
+            event_type: "VOICE_JOIN" or "VOICE_LEAVE"
+            member: Member dictionary (user_id, username, avatar)
+        """
+        self.member_events.add(event_type, member)
+
+    def flush_member_events(self, force: bool = False) -> int:
+        """
+        Move coalesced member events whose window has passed to the log.
+
+        Args:
+            force: Release everything pending
+
+        Returns:
+            Number of events queued
+        """
+        events = self.member_events.flush(force)
+        for event in events:
+            self.event_log.append(event)
+        return len(events)
+
+    def get_events_since(self, seq: int = 0) -> dict:
+        """
+        Get events newer than a reader's cursor (non-destructive).
+
+        Args:
+            seq: Last sequence number the reader has seen
+
+        Returns:
+            Dictionary with events, last_seq, overflow, dropped and reset
+            (see EventLog.get_events_since)
+        """
+        self.flush_member_events()
+        return self.event_log.get_events_since(seq)
 
     def get_pending_events(self) -> list[dict]:
         """
-        Get all pending events from queue (non-blocking).
+        Get events not yet returned by this method.
+
+        Kept for single-consumer callers; reads the shared log through
+        an internal cursor instead of draining it.
 
         Returns:
             List of event dictionaries
         """
-        events = []
+        result = self.get_events_since(self._legacy_cursor)
+        self._legacy_cursor = result["last_seq"]
+        return result["events"]
 
-        while not self.event_queue.empty():
-            try:
-                event = self.event_queue.get_nowait()
-                events.append(event)
-            except:
-                break
+    def get_stats(self) -> dict:
+        """
+        Get per-job scheduler statistics.
 
-        return events
+        Returns:
+            Dictionary with worker priority, per-job run stats
+            (including wall/CPU tick-cost histograms), coalescing counters
+            and event log usage
+        """
+        return {
+            "worker_priority": self.scheduler.worker_priority,
+            "jobs": self.scheduler.get_stats(),
+            "member_events": self.member_events.get_stats(),
+            "event_log": self.event_log.get_stats(),
+        }
 
     def is_running(self) -> bool:
         """
-        Check if polling thread is running.
+        Check if polling jobs are running.
 
         Returns:
             True if active, False otherwise
@@ -1,6 +1,12 @@
 """Steam game detection and Discord activity sync"""
 
-from .game_detector import SteamGameDetector
-from .activity_sync import ActivitySyncManager
+from ..utils.lazy import lazy_exports
 
-__all__ = ['SteamGameDetector', 'ActivitySyncManager']
+# Detection and sync are only imported once game sync needs them
+__getattr__ = lazy_exports(__name__, {
+    'SteamGameDetector': '.game_detector',
+    'ActivitySyncManager': '.activity_sync',
+    'SteamLibraryWatcher': '.library_watcher',
+})
+
+__all__ = ['SteamGameDetector', 'ActivitySyncManager', 'SteamLibraryWatcher']
@@ -3,14 +3,12 @@
 import os
 import time
 import json
-import ssl
-import urllib.request
-import urllib.error
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from .game_detector import SteamGameDetector
 from ..utils.cache import LRUCache
 from ..discord_rpc.client import DiscordRPCClient
+from ..utils.ssl_context import get_ssl_context
 
 
 class ActivitySyncManager:
@@ -24,7 +22,8 @@ class ActivitySyncManager:
     DISCORD_DETECTABLE_APPS_URL = "https://discord.com/api/v10/applications/detectable"
     CACHE_DURATION_SECONDS = 86400  # 24 hours
 
-    def __init__(self, settings_dir: str, main_rpc_client: DiscordRPCClient, logger=None):
+    def __init__(self, settings_dir: str, main_rpc_client: DiscordRPCClient, logger=None,
+                 game_detector: Optional[SteamGameDetector] = None):
         """
         Initialize activity sync manager.
 
@@ -32,13 +31,14 @@ class ActivitySyncManager:
             settings_dir: Directory for cache storage
             main_rpc_client: Main Discord RPC client (fallback)
             logger: Logger instance for logging operations
+            game_detector: Shared game detector (created if None)
         """
         self.settings_dir = settings_dir
         self.main_rpc = main_rpc_client
         self.logger = logger
 
         # Game detection
-        self.game_detector = SteamGameDetector(logger)
+        self.game_detector = game_detector or SteamGameDetector(logger)
 
         # Current game state
         self.current_game_appid: Optional[str] = None
@@ -53,10 +53,15 @@ class ActivitySyncManager:
         self.discord_apps_last_fetch: float = 0.0
         self.discord_appid_cache = LRUCache(max_size=100)
 
-        # SSL context for API requests
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
+        # Name lookup built from discord_apps on first game launch
+        self._apps_index: Optional[Dict[str, str]] = None  # Lowercase name -> app ID (first wins)
+        self._apps_names: List[Tuple[str, str]] = []  # (lowercase name, app ID) in list order
+        self._apps_index_source: Optional[list] = None  # discord_apps list the index was built from
+
+    @property
+    def ssl_context(self):
+        """Shared SSL context for API requests."""
+        return get_ssl_context()
 
     def sync(self) -> None:
         """
@@ -164,15 +169,20 @@ class ActivitySyncManager:
             details = game_info["name"]
             state = "Playing on Steam Deck"
 
+        assets = {
+            "large_text": game_info["name"],
+            "small_image": "https://steamcdn-a.akamaihd.net/steamcommunity/public/images/avatars/8d/8dd66ce1b9590825cebdce861c372cc3f5187f2e_full.jpg",
+            "small_text": "Steam Deck"
+        }
+
+        # Non-Steam shortcuts have no store header image
+        if game_info.get("image_url"):
+            assets["large_image"] = game_info["image_url"]
+
         activity = {
             "details": details,
             "timestamps": {"start": self.game_start_time},
-            "assets": {
-                "large_image": game_info["image_url"],
-                "large_text": game_info["name"],
-                "small_image": "https://steamcdn-a.akamaihd.net/steamcommunity/public/images/avatars/8d/8dd66ce1b9590825cebdce861c372cc3f5187f2e_full.jpg",
-                "small_text": "Steam Deck"
-            }
+            "assets": assets
         }
 
         if state:
@@ -270,22 +280,20 @@ class ActivitySyncManager:
         if not apps:
             return None
 
+        index = self._get_apps_index(apps)
         target_name = game_name.lower()
 
         # Try exact match first
-        for app in apps:
-            if app.get("name", "").lower() == target_name:
-                app_id = app.get("id")
-                self.discord_appid_cache.set(game_name, app_id)
-                if self.logger:
-                    self.logger.info(f"Discord Lite: Exact match - {game_name} -> {app_id}")
-                return app_id
+        if target_name in index:
+            app_id = index[target_name]
+            self.discord_appid_cache.set(game_name, app_id)
+            if self.logger:
+                self.logger.info(f"Discord Lite: Exact match - {game_name} -> {app_id}")
+            return app_id
 
         # Try partial match
-        for app in apps:
-            app_name = app.get("name", "").lower()
+        for app_name, app_id in self._apps_names:
             if target_name in app_name or app_name in target_name:
-                app_id = app.get("id")
                 self.discord_appid_cache.set(game_name, app_id)
                 if self.logger:
                     self.logger.info(f"Discord Lite: Partial match - {game_name} -> {app_id}")
@@ -295,6 +303,31 @@ class ActivitySyncManager:
         self.discord_appid_cache.set(game_name, None)
         return None
 
+    def _get_apps_index(self, apps: list[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Get the name index for a detectable apps list, building it if needed.
+
+        Built once per downloaded list (tens of thousands of entries)
+        instead of lowercasing every name on each game launch.
+
+        Args:
+            apps: Current detectable apps list
+
+        Returns:
+            Lowercase name -> app ID
+        """
+        if self._apps_index is None or self._apps_index_source is not apps:
+            names = [(app.get("name", "").lower(), app.get("id")) for app in apps]
+            index: Dict[str, str] = {}
+            for app_name, app_id in names:
+                index.setdefault(app_name, app_id)
+
+            self._apps_names = names
+            self._apps_index = index
+            self._apps_index_source = apps
+
+        return self._apps_index
+
     def _load_discord_detectable_apps(self) -> list[Dict[str, Any]]:
         """
         Load Discord detectable applications list.
@@ -347,6 +380,9 @@ class ActivitySyncManager:
             if self.logger:
                 self.logger.info("Discord Lite: Fetching detectable apps from Discord API...")
 
+            # Imported here: pulls in http.client and email, only needed for this download
+            import urllib.request
+
             request = urllib.request.Request(
                 self.DISCORD_DETECTABLE_APPS_URL,
                 headers={"User-Agent": "DiscordLite/1.0"}
@@ -379,6 +415,33 @@ class ActivitySyncManager:
                 self.logger.error(f"Discord Lite: Error fetching detectable apps: {e}")
             return self.discord_apps  # Return stale cache if available
 
+    def refresh_caches(self) -> None:
+        """
+        Refresh slow-changing caches in the background.
+
+        Re-downloads the detectable apps list once it is older than 24h
+        and applies pending Steam library changes, so a game launch does
+        not pay for either. A list not loaded yet is only kept fresh on
+        disk; it is parsed on the first game launch that needs it.
+        """
+        if self.discord_apps:
+            self._load_discord_detectable_apps()
+        else:
+            self._refresh_disk_cache()
+        self.game_detector.sync_library_index()
+
+    def _refresh_disk_cache(self) -> None:
+        """Download the detectable apps list if the disk cache is missing or older than 24h."""
+        cache_path = os.path.join(self.settings_dir, "discord_apps_cache.json")
+
+        try:
+            age = time.time() - os.stat(cache_path).st_mtime
+        except OSError:
+            age = None
+
+        if age is None or age >= self.CACHE_DURATION_SECONDS:
+            self._fetch_discord_apps_from_api(cache_path)
+
     def clear(self) -> None:
         """Clear all game state and disconnect game-specific RPC."""
         self._handle_game_stop()
@@ -2,10 +2,12 @@
 
 import os
 import re
-import glob
 from typing import Optional, Dict
 
 from ..utils.cache import LRUCache
+from ..utils.tracing import traced
+from .library_watcher import SteamLibraryWatcher
+from .shortcuts import ShortcutIndex
 
 
 class SteamGameDetector:
@@ -14,33 +16,62 @@ class SteamGameDetector:
 
     Uses /proc inspection to find Steam game processes and manifest files
     to resolve game names.
+
+    Not thread-safe: the library index is mutated on every lookup, so the
+    plugin calls it only from the poller's worker thread (game_sync and
+    cache_refresh jobs).
     """
 
     # Pre-compiled regex for performance (regex is expensive)
     GAME_ID_REGEX = re.compile(r'SteamLaunch.*?AppId=(\d+)')
+    MANIFEST_NAME_REGEX = re.compile(r'"name"\s+"([^"]+)"')
+
+    # Steam locations relative to the user's home directory
+    STEAMAPPS_SUBPATHS = (".local/share/Steam/steamapps", ".steam/steam/steamapps")
+    USERDATA_SUBPATH = ".local/share/Steam/userdata"
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, proc_root: str = "/proc", home: str = "/home/deck",
+                 media_root: str = "/run/media", use_inotify: bool = True):
         """
         Initialize game detector with caches.
 
+        Filesystem roots can be pointed at synthetic trees (see
+        tools/steam_fixtures.py) to measure detection off-device.
+
         Args:
             logger: Logger instance for logging operations
+            proc_root: procfs mount point
+            home: Home directory holding the Steam install
+            media_root: Root under which SD cards and USB drives are mounted
+            use_inotify: Watch libraries with inotify when available
         """
         self.logger = logger
+        self.proc_root = proc_root
         self.game_name_cache = LRUCache(max_size=50)
 
         # Steam library paths
-        self.steam_paths = [
-            "/home/deck/.local/share/Steam/steamapps",
-            "/home/deck/.steam/steam/steamapps"
-        ]
+        self.steam_paths = [os.path.join(home, subpath) for subpath in self.STEAMAPPS_SUBPATHS]
 
+        # Manifest index over internal and external libraries (built on first use)
+        self.library_watcher = SteamLibraryWatcher(
+            self.steam_paths,
+            media_root=media_root,
+            mounts_path=os.path.join(proc_root, "self", "mounts"),
+            use_inotify=use_inotify,
+            logger=logger
+        )
+
+        # Non-Steam shortcuts (emulators, Heroic, Lutris) have no appmanifest
+        self.shortcut_index = ShortcutIndex(os.path.join(home, self.USERDATA_SUBPATH), logger)
+
+    @traced("steam")
     def detect_running_game(self) -> Optional[Dict[str, str]]:
         """
         Detect currently running Steam game.
 
         Returns:
-            Dictionary with 'appid', 'name', 'image_url' or None if no game running
+            Dictionary with 'appid', 'name', 'image_url' or None if no game running.
+            'image_url' is None for non-Steam shortcuts.
 
         Example:
             >>> detector.detect_running_game()
@@ -52,11 +83,12 @@ class SteamGameDetector:
         """
         try:
             # List all numeric PIDs in /proc (much faster than glob)
-            pids = [pid for pid in os.listdir('/proc') if pid.isdigit()]
+            proc_root = self.proc_root
+            pids = [pid for pid in os.listdir(proc_root) if pid.isdigit()]
 
             for pid in pids:
                 try:
-                    cmdline_path = f'/proc/{pid}/cmdline'
+                    cmdline_path = f'{proc_root}/{pid}/cmdline'
 
                     # Read command line (errors='ignore' handles binary data)
                     with open(cmdline_path, 'r', errors='ignore') as f:
@@ -78,13 +110,22 @@ class SteamGameDetector:
 
                         # Get game name
                         game_name = self._get_game_name(appid)
+                        image_url = f"https://steamcdn-a.akamaihd.net/steam/apps/{appid}/header.jpg"
+
+                        # Fall back to non-Steam shortcuts (no store artwork)
+                        if not game_name:
+                            shortcut = self.shortcut_index.lookup(appid)
+                            if shortcut:
+                                game_name = shortcut["name"]
+                                image_url = None
+
                         if not game_name:
                             game_name = f"Game {appid}"
 
                         return {
                             "appid": appid,
                             "name": game_name,
-                            "image_url": f"https://steamcdn-a.akamaihd.net/steam/apps/{appid}/header.jpg"
+                            "image_url": image_url
                         }
 
                 except (IOError, PermissionError, FileNotFoundError):
@@ -108,36 +149,28 @@ class SteamGameDetector:
         Returns:
             Game name or None if not found
         """
-        # Check cache first
+        # Apply library changes first so stale names are never served
+        self.sync_library_index()
+
         cached_name = self.game_name_cache.get(appid)
         if cached_name:
             return cached_name
 
-        try:
-            # Add external libraries (SD card, USB drives)
-            all_steam_paths = self.steam_paths.copy()
-            external_paths = glob.glob("/run/media/*/steamapps")
-            all_steam_paths.extend(external_paths)
-
-            # Search for manifest file
-            for base_path in all_steam_paths:
-                manifest_path = f"{base_path}/appmanifest_{appid}.acf"
+        manifest_path = self.library_watcher.find_manifest(appid)
+        if not manifest_path:
+            return None
 
-                if os.path.exists(manifest_path):
-                    try:
-                        with open(manifest_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
+        try:
+            with open(manifest_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
 
-                        # Extract name from ACF file
-                        match = re.search(r'"name"\s+"([^"]+)"', content)
+            # Extract name from ACF file
+            match = self.MANIFEST_NAME_REGEX.search(content)
 
-                        if match:
-                            name = match.group(1)
-                            self.game_name_cache.set(appid, name)
-                            return name
-
-                    except Exception:
-                        continue
+            if match:
+                name = match.group(1)
+                self.game_name_cache.set(appid, name)
+                return name
 
             return None
 
@@ -146,19 +179,28 @@ class SteamGameDetector:
                 self.logger.error(f"Discord Lite: Error getting game name for appid {appid}: {e}")
             return None
 
+    def sync_library_index(self) -> None:
+        """Apply pending library changes and drop cached names they affect."""
+        try:
+            for appid in self.library_watcher.poll():
+                self.game_name_cache.delete(appid)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Discord Lite: Error updating Steam library index: {e}")
+
     def refresh_library_paths(self) -> None:
         """
-        Refresh list of Steam library paths.
+        Rebuild the Steam library index from scratch.
 
-        Call this if the user adds/removes external storage.
+        Normally not needed: the index follows manifest and mount changes
+        on its own. Use this to force a full rescan.
         """
-        self.steam_paths = [
-            "/home/deck/.local/share/Steam/steamapps",
-            "/home/deck/.steam/steam/steamapps"
-        ]
-
-        external_paths = glob.glob("/run/media/*/steamapps")
-        self.steam_paths.extend(external_paths)
+        for appid in self.library_watcher.rescan():
+            self.game_name_cache.delete(appid)
 
         if self.logger:
-            self.logger.info(f"Discord Lite: Refreshed Steam library paths: {len(self.steam_paths)} locations")
+            self.logger.info(f"Discord Lite: Refreshed Steam library paths: {len(self.library_watcher.library_paths())} locations")
+
+    def close(self) -> None:
+        """Release filesystem watches."""
+        self.library_watcher.close()
@@ -0,0 +1,481 @@
+"""Steam library index kept current by filesystem watching"""
+
+import os
+import re
+import select
+import stat
+from typing import Optional, Dict, List, Set, Tuple
+
+from ..utils import inotify
+from ..utils.inotify import InotifyWatcher
+
+
+class SteamLibraryWatcher:
+    """
+    Maintains an appid -> manifest index over all Steam libraries.
+
+    Internal libraries are watched with inotify for appmanifest changes.
+    External libraries (SD card, USB drives) are discovered under the media
+    root and re-discovered only when the mount table changes. When inotify
+    is unavailable, directory mtimes are compared on each poll instead.
+
+    Internal libraries that do not exist yet (Steam not run before) or
+    are deleted later are indexed as soon as they appear: their nearest
+    existing parent directory is watched for the missing component, the
+    way IPCSocketFinder waits for Discord's socket directory. Without
+    inotify, missing ones cost one stat per poll.
+
+    Paths naming the same directory (on the Deck, ~/.steam/steam is a
+    symlink to ~/.local/share/Steam) are indexed and watched once, under
+    the first name seen.
+    """
+
+    MANIFEST_REGEX = re.compile(r'^appmanifest_(\d+)\.acf$')
+
+    LIBRARY_EVENTS = (
+        inotify.IN_CREATE | inotify.IN_DELETE | inotify.IN_MOVED_FROM |
+        inotify.IN_MOVED_TO | inotify.IN_CLOSE_WRITE | inotify.IN_DELETE_SELF |
+        inotify.IN_MOVE_SELF | inotify.IN_UNMOUNT
+    )
+    MEDIA_EVENTS = inotify.IN_CREATE | inotify.IN_DELETE | inotify.IN_MOVED_FROM | inotify.IN_MOVED_TO
+    PARENT_EVENTS = inotify.IN_CREATE | inotify.IN_MOVED_TO | inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF
+    GONE_EVENTS = inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF | inotify.IN_UNMOUNT | inotify.IN_IGNORED
+
+    def __init__(self, base_paths: List[str], media_root: str = "/run/media",
+                 mounts_path: str = "/proc/self/mounts", use_inotify: bool = True, logger=None):
+        """
+        Initialize library watcher (nothing is scanned until first poll).
+
+        Args:
+            base_paths: Internal steamapps directories
+            media_root: Root under which removable media is mounted
+            mounts_path: Mount table used to detect card insert/removal
+            use_inotify: Use inotify when available (False forces mtime checks)
+            logger: Logger instance for logging operations
+        """
+        self.base_paths = list(base_paths)
+        self.media_root = media_root
+        self.mounts_path = mounts_path
+        self.use_inotify = use_inotify
+        self.logger = logger
+
+        # steamapps dir -> {appid: manifest_path}
+        self.libraries: Dict[str, Dict[str, str]] = {}
+        self._library_inodes: Dict[str, Tuple[int, int]] = {}  # path -> (st_dev, st_ino)
+
+        self._started = False
+        self._inotify: Optional[InotifyWatcher] = None
+        self._mounts_file = None
+        self._dir_mtimes: Dict[str, int] = {}  # Fallback: path -> st_mtime_ns
+
+        # Missing base paths: nearest existing parents and the entry names awaited there
+        self._parent_dirs: Set[str] = set()
+        self._parent_watches: Set[str] = set()  # Subset watched only for this purpose
+        self._watch_names: Set[str] = set()
+
+    # ==================== PUBLIC API ====================
+
+    def poll(self) -> Set[str]:
+        """
+        Apply pending filesystem changes to the index (non-blocking).
+
+        Returns:
+            Set of appids whose index entries were added, removed or rewritten
+        """
+        if not self._started:
+            self._start()
+            return set()
+
+        changed: Set[str] = set()
+
+        if self._mounts_changed():
+            changed |= self._rediscover_external()
+
+        if self._inotify:
+            changed |= self._apply_inotify_events()
+        else:
+            changed |= self._apply_mtime_changes()
+
+        return changed
+
+    def find_manifest(self, appid: str) -> Optional[str]:
+        """
+        Find manifest path for an appid.
+
+        Args:
+            appid: Steam application ID
+
+        Returns:
+            Path to appmanifest file or None if not installed
+        """
+        for manifests in self.libraries.values():
+            path = manifests.get(appid)
+            if path:
+                return path
+        return None
+
+    def library_paths(self) -> List[str]:
+        """Get list of currently indexed steamapps directories."""
+        return list(self.libraries.keys())
+
+    def rescan(self) -> Set[str]:
+        """
+        Drop and rebuild the whole index.
+
+        Returns:
+            Set of all appids that were or are now indexed
+        """
+        previous = {appid for manifests in self.libraries.values() for appid in manifests}
+        self.close()
+        self._start()
+        current = {appid for manifests in self.libraries.values() for appid in manifests}
+        return previous | current
+
+    def close(self) -> None:
+        """Release inotify and mount table handles."""
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+
+        if self._mounts_file:
+            try:
+                self._mounts_file.close()
+            except OSError:
+                pass
+            self._mounts_file = None
+
+        self.libraries = {}
+        self._library_inodes = {}
+        self._dir_mtimes = {}
+        self._parent_dirs = set()
+        self._parent_watches = set()
+        self._watch_names = set()
+        self._started = False
+
+    # ==================== INDEX BUILDING ====================
+
+    def _start(self) -> None:
+        """Build the initial index and set up change notification."""
+        self._started = True
+
+        if self.use_inotify and inotify.is_available():
+            try:
+                self._inotify = InotifyWatcher()
+            except OSError as e:
+                if self.logger:
+                    self.logger.warning(f"Discord Lite: inotify unavailable, using mtime checks: {e}")
+                self._inotify = None
+
+        try:
+            self._mounts_file = open(self.mounts_path, 'rb')
+            self._mounts_file.read()
+        except OSError:
+            self._mounts_file = None
+
+        for path in self.base_paths + self._discover_external_paths():
+            self._add_library(path)
+
+        self._watch_media_dirs()
+        self._watch_missing_bases()
+
+        if self.logger:
+            total = sum(len(m) for m in self.libraries.values())
+            mode = "inotify" if self._inotify else "mtime"
+            self.logger.info(f"Discord Lite: Indexed {total} manifests in {len(self.libraries)} Steam libraries ({mode})")
+
+    def _scan_library(self, path: str) -> Dict[str, str]:
+        """Scan a steamapps directory once for appmanifest files."""
+        manifests = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    match = self.MANIFEST_REGEX.match(entry.name)
+                    if match:
+                        manifests[match.group(1)] = entry.path
+        except OSError:
+            pass
+        return manifests
+
+    def _add_library(self, path: str) -> Set[str]:
+        """Index and watch a library. Returns appids it contributed."""
+        if path in self.libraries:
+            return set()
+
+        inode = self._inode(path)
+        if inode is None or inode in self._library_inodes.values():
+            return set()  # Missing, or an alias of an indexed library
+
+        self.libraries[path] = self._scan_library(path)
+        self._library_inodes[path] = inode
+
+        if self._inotify:
+            self._inotify.add_watch(path, self.LIBRARY_EVENTS)
+        else:
+            self._dir_mtimes[path] = self._mtime(path)
+
+        return set(self.libraries[path].keys())
+
+    def _remove_library(self, path: str) -> Set[str]:
+        """Drop a library from the index. Returns appids it contained."""
+        manifests = self.libraries.pop(path, None)
+        self._library_inodes.pop(path, None)
+        self._dir_mtimes.pop(path, None)
+
+        if self._inotify:
+            self._inotify.remove_watch(path)
+
+        return set(manifests.keys()) if manifests else set()
+
+    def _watch_missing_bases(self) -> Set[str]:
+        """
+        Index base libraries that appeared and watch for the rest.
+
+        Each still-missing base path is covered by a watch on its nearest
+        existing parent (e.g., ~/.local/share before Steam's first run).
+
+        Returns:
+            Appids contributed by libraries that appeared
+        """
+        changed = self._add_appeared_bases()
+
+        if not self._inotify:
+            return changed
+
+        for parent in self._parent_watches - set(self.libraries):
+            self._inotify.remove_watch(parent)
+        self._parent_dirs = set()
+        self._parent_watches = set()
+        self._watch_names = set()
+
+        watched = set(self._inotify.watched_paths())
+
+        # Repeat until no directory appeared between the walk and its watch
+        while True:
+            parents: Set[str] = set()
+            for path in self.base_paths:
+                if not self._is_indexed(path):
+                    parent = self._nearest_existing_parent(path)
+                    if parent:
+                        parents.add(parent)
+
+            if parents <= self._parent_dirs:
+                break
+
+            for parent in parents - self._parent_dirs:
+                # An existing watch (library or media) already reports creations
+                if parent not in watched and self._inotify.add_watch(parent, self.PARENT_EVENTS) is not None:
+                    self._parent_watches.add(parent)
+                    watched.add(parent)
+            self._parent_dirs |= parents
+
+            changed |= self._add_appeared_bases()
+
+        return changed
+
+    def _add_appeared_bases(self) -> Set[str]:
+        """Index base paths that exist now and are not aliases of indexed ones."""
+        changed: Set[str] = set()
+        for path in self.base_paths:
+            if not self._is_indexed(path) and os.path.isdir(path):
+                changed |= self._add_library(path)
+                if self.logger:
+                    self.logger.info(f"Discord Lite: Steam library added: {path}")
+        return changed
+
+    def _is_indexed(self, path: str) -> bool:
+        """True if path, or another name for the same directory, is indexed."""
+        if path in self.libraries:
+            return True
+        inode = self._inode(path)
+        return inode is not None and inode in self._library_inodes.values()
+
+    def _nearest_existing_parent(self, path: str) -> Optional[str]:
+        """Find the closest existing ancestor (resolved), noting the missing names below it."""
+        while not os.path.isdir(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            self._watch_names.add(os.path.basename(path))
+            path = parent
+        # Watched under its real name, so symlinked bases share one watch
+        return os.path.realpath(path)
+
+    # ==================== EXTERNAL MEDIA ====================
+
+    def _discover_external_paths(self) -> List[str]:
+        """
+        Find steamapps directories on mounted media.
+
+        Handles both /run/media/<label>/steamapps and the newer
+        /run/media/<user>/<label>/steamapps layouts.
+        """
+        found = []
+        try:
+            with os.scandir(self.media_root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+
+                    candidate = os.path.join(entry.path, "steamapps")
+                    if os.path.isdir(candidate):
+                        found.append(candidate)
+                        continue
+
+                    try:
+                        with os.scandir(entry.path) as sub_entries:
+                            for sub in sub_entries:
+                                candidate = os.path.join(sub.path, "steamapps")
+                                if sub.is_dir() and os.path.isdir(candidate):
+                                    found.append(candidate)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return found
+
+    def _external_libraries(self) -> Set[str]:
+        """Get indexed libraries that live on removable media."""
+        base = set(self.base_paths)
+        return {path for path in self.libraries if path not in base}
+
+    def _rediscover_external(self) -> Set[str]:
+        """Diff mounted libraries against the index and apply the difference."""
+        changed: Set[str] = set()
+        current = set(self._discover_external_paths())
+        known = self._external_libraries()
+
+        for path in known - current:
+            changed |= self._remove_library(path)
+            if self.logger:
+                self.logger.info(f"Discord Lite: Steam library removed: {path}")
+
+        for path in current - known:
+            changed |= self._add_library(path)
+            if self.logger:
+                self.logger.info(f"Discord Lite: Steam library added: {path}")
+
+        self._watch_media_dirs()
+        return changed
+
+    def _watch_media_dirs(self) -> None:
+        """Watch media root and its first level for mount point changes."""
+        if self._inotify:
+            self._inotify.add_watch(self.media_root, self.MEDIA_EVENTS)
+            try:
+                with os.scandir(self.media_root) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            self._inotify.add_watch(entry.path, self.MEDIA_EVENTS)
+            except OSError:
+                pass
+        else:
+            self._dir_mtimes[self.media_root] = self._mtime(self.media_root)
+
+    def _mounts_changed(self) -> bool:
+        """
+        Check mount table for changes with a zero-timeout select.
+
+        The kernel flags /proc/self/mounts as exceptional when a filesystem
+        is mounted or unmounted; re-reading it clears the flag.
+        """
+        if not self._mounts_file:
+            return False
+
+        try:
+            _, _, exceptional = select.select([], [], [self._mounts_file], 0)
+            if not exceptional:
+                return False
+
+            self._mounts_file.seek(0)
+            self._mounts_file.read()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    # ==================== CHANGE APPLICATION ====================
+
+    def _apply_inotify_events(self) -> Set[str]:
+        """Apply queued inotify events to the index."""
+        changed: Set[str] = set()
+        media_changed = False
+        bases_changed = False
+
+        for path, mask, name in self._inotify.read_events():
+            if mask & inotify.IN_Q_OVERFLOW:
+                # Events were dropped - only a full rescan is safe
+                return changed | self.rescan()
+
+            if path in self._parent_dirs and (name in self._watch_names or mask & self.GONE_EVENTS):
+                bases_changed = True
+
+            if path in self.libraries:
+                if mask & self.GONE_EVENTS:
+                    changed |= self._remove_library(path)
+                    bases_changed |= path in self.base_paths
+                    continue
+
+                match = self.MANIFEST_REGEX.match(name)
+                if not match:
+                    continue
+
+                appid = match.group(1)
+                if mask & (inotify.IN_DELETE | inotify.IN_MOVED_FROM):
+                    self.libraries[path].pop(appid, None)
+                else:
+                    self.libraries[path][appid] = os.path.join(path, name)
+                changed.add(appid)
+
+            elif path and (path == self.media_root or os.path.dirname(path) == self.media_root):
+                media_changed = True
+
+        if media_changed:
+            changed |= self._rediscover_external()
+
+        if bases_changed:
+            changed |= self._watch_missing_bases()
+
+        return changed
+
+    def _apply_mtime_changes(self) -> Set[str]:
+        """Fallback: rescan only directories whose mtime changed."""
+        changed: Set[str] = set()
+
+        if self._mtime(self.media_root) != self._dir_mtimes.get(self.media_root):
+            changed |= self._rediscover_external()
+
+        changed |= self._watch_missing_bases()
+
+        for path in list(self.libraries.keys()):
+            mtime = self._mtime(path)
+            if mtime == self._dir_mtimes.get(path):
+                continue
+
+            if mtime == 0:
+                changed |= self._remove_library(path)
+                continue
+
+            self._dir_mtimes[path] = mtime
+            old = self.libraries[path]
+            new = self._scan_library(path)
+            self.libraries[path] = new
+
+            changed |= old.keys() ^ new.keys()
+
+        return changed
+
+    @staticmethod
+    def _inode(path: str) -> Optional[Tuple[int, int]]:
+        """Get (st_dev, st_ino) of a directory (None if missing or not a directory)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino) if stat.S_ISDIR(st.st_mode) else None
+
+    @staticmethod
+    def _mtime(path: str) -> int:
+        """Get directory mtime in nanoseconds (0 if missing)."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
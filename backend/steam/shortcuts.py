@@ -0,0 +1,297 @@
+"""Non-Steam shortcut resolution from binary shortcuts.vdf files"""
+
+import os
+import struct
+from typing import Optional, Dict, List, Tuple
+
+# Binary VDF field types
+VDF_MAP = 0x00
+VDF_STRING = 0x01
+VDF_INT32 = 0x02
+VDF_FLOAT32 = 0x03
+VDF_POINTER = 0x04
+VDF_WSTRING = 0x05
+VDF_COLOR = 0x06
+VDF_UINT64 = 0x07
+VDF_MAP_END = 0x08
+VDF_INT64 = 0x0A
+
+# Fixed-size value types -> payload length in bytes
+_FIXED_SIZES = {
+    VDF_INT32: 4,
+    VDF_FLOAT32: 4,
+    VDF_POINTER: 4,
+    VDF_COLOR: 4,
+    VDF_UINT64: 8,
+    VDF_INT64: 8,
+}
+
+_INT32 = struct.Struct('<i')
+
+
+class VDFParseError(ValueError):
+    """Raised when a binary VDF buffer is truncated or malformed."""
+
+
+def _read_cstring(data: bytes, offset: int) -> Tuple[bytes, int]:
+    """Read NUL-terminated string. Returns (raw_bytes, offset_after_nul)."""
+    end = data.find(b'\0', offset)
+    if end < 0:
+        raise VDFParseError(f"Unterminated string at offset {offset}")
+    return data[offset:end], end + 1
+
+
+def _skip_map(data: bytes, offset: int) -> int:
+    """Skip over a nested map without materializing it. Returns offset after MAP_END."""
+    depth = 1
+    size = len(data)
+
+    while depth:
+        if offset >= size:
+            raise VDFParseError("Truncated map")
+
+        field_type = data[offset]
+        offset += 1
+
+        if field_type == VDF_MAP_END:
+            depth -= 1
+            continue
+
+        _, offset = _read_cstring(data, offset)  # key
+
+        if field_type == VDF_MAP:
+            depth += 1
+        else:
+            offset = _skip_value(data, offset, field_type)
+
+    return offset
+
+
+def parse_shortcuts(data: bytes) -> Dict[str, Dict[str, str]]:
+    """
+    Parse shortcuts.vdf contents into an appid index.
+
+    Only the appid, name and exe fields of each shortcut are decoded;
+    everything else (tags, icons, launch options) is skipped by offset.
+
+    Args:
+        data: Raw contents of userdata/<id>/config/shortcuts.vdf
+
+    Returns:
+        Dictionary mapping unsigned 32-bit appid string to {"name", "exe"}
+
+    Example:
+        >>> parse_shortcuts(open(path, 'rb').read())
+        {"3141592653": {"name": "RetroArch", "exe": "\\"/usr/bin/retroarch\\""}}
+
+    Raises:
+        VDFParseError: If the buffer is malformed
+    """
+    try:
+        return _parse_shortcuts(data)
+    except (IndexError, struct.error) as e:
+        raise VDFParseError(f"Truncated shortcuts file: {e}") from e
+
+
+def _parse_shortcuts(data: bytes) -> Dict[str, Dict[str, str]]:
+    """Parse implementation; see parse_shortcuts()."""
+    index: Dict[str, Dict[str, str]] = {}
+
+    # Root: MAP "shortcuts" { MAP "<n>" {...} ... } MAP_END
+    if len(data) < 2 or data[0] != VDF_MAP:
+        raise VDFParseError("Missing root map")
+
+    _, offset = _read_cstring(data, 1)
+    size = len(data)
+
+    while offset < size:
+        field_type = data[offset]
+        offset += 1
+
+        if field_type == VDF_MAP_END:
+            break
+
+        _, offset = _read_cstring(data, offset)
+
+        if field_type != VDF_MAP:
+            offset = _skip_value(data, offset, field_type)
+            continue
+
+        # One shortcut entry
+        appid: Optional[int] = None
+        name = exe = ""
+
+        while True:
+            if offset >= size:
+                raise VDFParseError("Truncated shortcut entry")
+
+            entry_type = data[offset]
+            offset += 1
+
+            if entry_type == VDF_MAP_END:
+                break
+
+            key, offset = _read_cstring(data, offset)
+            key = key.lower()
+
+            if entry_type == VDF_STRING:
+                value, offset = _read_cstring(data, offset)
+                if key == b'appname':
+                    name = value.decode('utf-8', 'replace')
+                elif key == b'exe':
+                    exe = value.decode('utf-8', 'replace')
+            elif entry_type == VDF_INT32 and key == b'appid':
+                appid = _INT32.unpack_from(data, offset)[0]
+                offset += 4
+            elif entry_type == VDF_MAP:
+                offset = _skip_map(data, offset)
+            else:
+                offset = _skip_value(data, offset, entry_type)
+
+        if appid is not None and name:
+            index[str(appid & 0xFFFFFFFF)] = {"name": name, "exe": exe}
+
+    return index
+
+
+def _skip_value(data: bytes, offset: int, field_type: int) -> int:
+    """Skip a single non-map value. Returns offset after it."""
+    if field_type == VDF_MAP:
+        return _skip_map(data, offset)
+    if field_type == VDF_STRING:
+        return _read_cstring(data, offset)[1]
+    if field_type in _FIXED_SIZES:
+        return offset + _FIXED_SIZES[field_type]
+    if field_type == VDF_WSTRING:
+        end = data.find(b'\0\0', offset)
+        while end >= 0 and (end - offset) % 2:
+            end = data.find(b'\0\0', end + 1)
+        if end < 0:
+            raise VDFParseError("Unterminated wide string")
+        return end + 2
+    raise VDFParseError(f"Unknown field type 0x{field_type:02x} at offset {offset}")
+
+
+def normalize_shortcut_appid(appid: str) -> str:
+    """
+    Normalize a launch AppId to the 32-bit shortcut appid.
+
+    Steam may pass either the 32-bit appid or the 64-bit game id
+    ((appid << 32) | 0x02000000) on the command line.
+
+    Args:
+        appid: AppId string from the SteamLaunch command line
+
+    Returns:
+        32-bit appid string
+    """
+    value = int(appid)
+    if value > 0xFFFFFFFF:
+        value >>= 32
+    return str(value)
+
+
+class ShortcutIndex:
+    """
+    Cached index of non-Steam shortcuts across all Steam users.
+
+    Each shortcuts.vdf is parsed only when its (mtime, size) changes, so
+    lookups after the first are a handful of stat() calls.
+    """
+
+    def __init__(self, userdata_path: str, logger=None):
+        """
+        Initialize shortcut index (nothing is parsed until first lookup).
+
+        Args:
+            userdata_path: Steam userdata directory
+            logger: Logger instance for logging operations
+        """
+        self.userdata_path = userdata_path
+        self.logger = logger
+
+        self._userdata_mtime = 0
+        self._files: List[str] = []
+
+        # path -> ((mtime_ns, size), {appid: info})
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, str]]]] = {}
+
+    def lookup(self, appid: str) -> Optional[Dict[str, str]]:
+        """
+        Look up a shortcut by launch AppId.
+
+        Args:
+            appid: AppId from the SteamLaunch command line (32 or 64-bit)
+
+        Returns:
+            Dictionary with 'name' and 'exe' or None if not a known shortcut
+        """
+        try:
+            key = normalize_shortcut_appid(appid)
+        except ValueError:
+            return None
+
+        self._refresh()
+
+        for _, shortcuts in self._parsed.values():
+            info = shortcuts.get(key)
+            if info:
+                return info
+        return None
+
+    def _refresh(self) -> None:
+        """Re-list user dirs if userdata changed and re-parse changed files."""
+        try:
+            mtime = os.stat(self.userdata_path).st_mtime_ns
+        except OSError:
+            self._files = []
+            self._parsed.clear()
+            return
+
+        if mtime != self._userdata_mtime:
+            self._userdata_mtime = mtime
+            self._files = self._find_shortcut_files()
+
+            for stale in set(self._parsed) - set(self._files):
+                del self._parsed[stale]
+
+        for path in self._files:
+            try:
+                st = os.stat(path)
+            except OSError:
+                self._parsed.pop(path, None)
+                continue
+
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._parsed.get(path)
+            if cached and cached[0] == signature:
+                continue
+
+            self._parsed[path] = (signature, self._parse_file(path))
+
+    def _find_shortcut_files(self) -> List[str]:
+        """List userdata/*/config/shortcuts.vdf candidates."""
+        files = []
+        try:
+            with os.scandir(self.userdata_path) as entries:
+                for entry in entries:
+                    if entry.is_dir() and entry.name.isdigit():
+                        files.append(os.path.join(entry.path, "config", "shortcuts.vdf"))
+        except OSError:
+            pass
+        return files
+
+    def _parse_file(self, path: str) -> Dict[str, Dict[str, str]]:
+        """Parse one shortcuts.vdf, returning an empty index on error."""
+        try:
+            with open(path, 'rb') as f:
+                shortcuts = parse_shortcuts(f.read())
+
+            if self.logger:
+                self.logger.info(f"Discord Lite: Indexed {len(shortcuts)} non-Steam shortcuts from {path}")
+            return shortcuts
+
+        except (OSError, VDFParseError) as e:
+            if self.logger:
+                self.logger.warning(f"Discord Lite: Could not parse {path}: {e}")
+            return {}
@@ -1,7 +1,25 @@
 """Utility modules"""
 
-from .cache import LRUCache
-from .settings import SettingsManager
-from .socket_finder import find_discord_ipc_socket
+from .lazy import Lazy, LazyRegistry, lazy_exports
 
-__all__ = ['LRUCache', 'SettingsManager', 'find_discord_ipc_socket']
+# Submodules are imported on first access (the profiler pulls in tracemalloc)
+__getattr__ = lazy_exports(__name__, {
+    'LRUCache': '.cache',
+    'SettingsManager': '.settings',
+    'find_discord_ipc_socket': '.socket_finder',
+    'IPCSocketFinder': '.socket_finder',
+    'get_socket_finder': '.socket_finder',
+    'SingleFlight': '.single_flight',
+    'ResponseCache': '.response_cache',
+    'Histogram': '.histogram',
+    'PluginLogger': '.log',
+    'Tracer': '.tracing',
+    'tracer': '.tracing',
+    'StackSampler': '.profiler',
+    'MemoryProfiler': '.profiler',
+    'get_ssl_context': '.ssl_context',
+})
+
+__all__ = ['LRUCache', 'SettingsManager', 'find_discord_ipc_socket', 'SingleFlight', 'ResponseCache', 'Histogram', 'PluginLogger', 'Tracer', 'tracer',
+           'StackSampler', 'MemoryProfiler', 'Lazy', 'LazyRegistry', 'lazy_exports', 'get_ssl_context', 'IPCSocketFinder',
+           'get_socket_finder']
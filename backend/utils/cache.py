@@ -56,6 +56,15 @@ class LRUCache:
         # Add new entry (most recent)
         self._cache[key] = value
 
+    def delete(self, key: str) -> None:
+        """
+        Remove entry from cache (no-op if missing).
+
+        Args:
+            key: Cache key
+        """
+        self._cache.pop(key, None)
+
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
@@ -0,0 +1,71 @@
+"""Fixed-bucket latency histogram"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations in milliseconds.
+
+    Cheap enough to update on every job tick or RPC round trip; used for
+    tick costs (before/after changing the worker priority) and command
+    latencies.
+    """
+
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+    def __init__(self):
+        """Initialize empty histogram."""
+        self.counts: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """
+        Record one sample.
+
+        Args:
+            value_ms: Sample in milliseconds
+        """
+        self.counts[bisect_left(self.BUCKETS_MS, value_ms)] += 1
+        self.total += 1
+        self.sum_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """
+        Estimate a percentile as the upper bound of its bucket.
+
+        Args:
+            fraction: Percentile as fraction (0.5 = p50)
+
+        Returns:
+            Bucket upper bound in ms (capped at the max sample), or None if empty
+        """
+        if not self.total:
+            return None
+
+        rank = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                bound = self.BUCKETS_MS[index] if index < len(self.BUCKETS_MS) else self.max_ms
+                return round(min(bound, self.max_ms), 3)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize histogram for diagnostics."""
+        labels = [f"<={b:g}" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]:g}"]
+        return {
+            "count": self.total,
+            "mean_ms": round(self.sum_ms / self.total, 3) if self.total else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {label: count for label, count in zip(labels, self.counts) if count},
+        }
@@ -0,0 +1,175 @@
+"""Minimal non-blocking inotify wrapper (ctypes, no external dependencies)"""
+
+import os
+import ctypes
+import ctypes.util
+import struct
+from typing import Dict, List, Optional, Tuple
+
+# Event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_UNMOUNT = 0x00002000
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def _load_libc():
+    """Load libc with errno support, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        # Probe the symbols we need
+        libc.inotify_init1
+        libc.inotify_add_watch
+        libc.inotify_rm_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+
+
+class InotifyWatcher:
+    """
+    Non-blocking inotify instance.
+
+    Never blocks: read_events() drains whatever the kernel has queued and
+    returns immediately, so it can be called from a polling tick.
+    """
+
+    def __init__(self):
+        """
+        Create inotify instance.
+
+        Raises:
+            OSError: If inotify is not available on this system
+        """
+        if _libc is None:
+            raise OSError("inotify not available")
+
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self.fd = fd
+        self._paths: Dict[int, str] = {}  # wd -> watched path
+        self._inodes: Dict[int, Tuple[int, int]] = {}  # wd -> (st_dev, st_ino)
+
+    def add_watch(self, path: str, mask: int) -> Optional[int]:
+        """
+        Watch a path for events.
+
+        The kernel keeps one watch per inode, so a second name for an
+        already watched directory (e.g., through a symlink) would replace
+        its mask and take over its events. Such a path is refused instead;
+        watch each directory under one name (os.path.realpath).
+
+        Args:
+            path: Directory or file to watch
+            mask: Bitmask of IN_* events
+
+        Returns:
+            Watch descriptor, or None if the path could not be watched or
+            is already watched under another name
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        inode = (st.st_dev, st.st_ino)
+        for wd, watched in self._inodes.items():
+            if watched == inode and self._paths.get(wd) != path:
+                return None
+
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            return None
+
+        self._paths[wd] = path
+        self._inodes[wd] = inode
+        return wd
+
+    def remove_watch(self, path: str) -> None:
+        """
+        Stop watching a path (no-op if not watched).
+
+        Args:
+            path: Previously watched path
+        """
+        for wd, watched in list(self._paths.items()):
+            if watched == path:
+                _libc.inotify_rm_watch(self.fd, wd)
+                del self._paths[wd]
+                self._inodes.pop(wd, None)
+
+    def watched_paths(self) -> List[str]:
+        """Get list of currently watched paths."""
+        return list(self._paths.values())
+
+    def read_events(self) -> List[Tuple[str, int, str]]:
+        """
+        Drain pending events without blocking.
+
+        Returns:
+            List of (watched_path, mask, name) tuples. A mask containing
+            IN_Q_OVERFLOW means events were lost and callers should rescan.
+        """
+        events = []
+
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            if not data:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b'\0').decode('utf-8', 'replace')
+                offset += name_len
+
+                path = self._paths.get(wd, "")
+                if mask & IN_IGNORED:
+                    # Kernel dropped the watch (directory removed or unmounted)
+                    self._paths.pop(wd, None)
+                    self._inodes.pop(wd, None)
+
+                events.append((path, mask, name))
+
+        return events
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self.fd >= 0:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = -1
+            self._paths.clear()
+            self._inodes.clear()
+
+
+def is_available() -> bool:
+    """Check whether inotify can be used on this system."""
+    return _libc is not None
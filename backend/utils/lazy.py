@@ -0,0 +1,190 @@
+"""Deferred imports and on-first-use construction of heavy components"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Lazy:
+    """
+    A value built by a factory on first get().
+
+    Construction happens once, under a lock, so a component first touched
+    from the event loop and a poller thread at the same time is still
+    built only once. A factory that raises leaves the value unbuilt and
+    the next get() tries again.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Initialize lazy value.
+
+        Args:
+            factory: Function building the value (called at most once per reset)
+        """
+        self._factory = factory
+        self._value: Any = None
+        self._built = False
+        self._lock = threading.RLock()
+
+        # Stats
+        self.build_ms: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        """True once the value exists."""
+        return self._built
+
+    def get(self) -> Any:
+        """Return the value, building it on first call."""
+        if self._built:
+            return self._value
+
+        with self._lock:
+            if not self._built:
+                start = time.perf_counter()
+                self._value = self._factory()
+                self.build_ms = round((time.perf_counter() - start) * 1000, 3)
+                self._built = True
+
+        return self._value
+
+    def peek(self) -> Any:
+        """Return the value if built, else None (never builds)."""
+        return self._value if self._built else None
+
+    def reset(self) -> Any:
+        """
+        Forget the value so the next get() builds a new one.
+
+        Returns:
+            The previous value (None if it was never built)
+        """
+        with self._lock:
+            value = self.peek()
+            self._value = None
+            self._built = False
+            return value
+
+
+class LazyRegistry:
+    """
+    Named components built on first use.
+
+    Plugin load registers factories instead of constructing everything
+    up front; whatever a session never touches (OAuth when a saved token
+    works, the profilers, the game detector with game sync off) is never
+    imported or built. close_all() releases only what was built, newest
+    first, so components depending on earlier ones close before them.
+    """
+
+    def __init__(self, logger=None):
+        """
+        Initialize empty registry.
+
+        Args:
+            logger: Logger instance for build and close messages
+        """
+        self.logger = logger
+        self._entries: Dict[str, Lazy] = {}
+        self._closers: Dict[str, Callable[[Any], None]] = {}
+        self._build_order: List[str] = []
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Any],
+                 close: Optional[Callable[[Any], None]] = None) -> None:
+        """
+        Register a component factory.
+
+        Args:
+            name: Component name
+            factory: Function building the component (imports belong inside it)
+            close: Function releasing a built component (optional)
+        """
+        self._entries[name] = Lazy(factory)
+        if close:
+            self._closers[name] = close
+
+    def get(self, name: str) -> Any:
+        """
+        Get a component, building it on first use.
+
+        Raises:
+            KeyError: If no component was registered under name
+        """
+        entry = self._entries[name]
+        if entry.is_built:
+            return entry.peek()
+
+        value = entry.get()
+        with self._lock:
+            if name not in self._build_order:
+                self._build_order.append(name)
+                if self.logger:
+                    self.logger.info(f"Discord Lite: Built {name} on first use ({entry.build_ms} ms)")
+        return value
+
+    def peek(self, name: str) -> Any:
+        """Get a component only if it was already built (None otherwise)."""
+        entry = self._entries.get(name)
+        return entry.peek() if entry else None
+
+    def is_built(self, name: str) -> bool:
+        """True if the component exists."""
+        entry = self._entries.get(name)
+        return bool(entry and entry.is_built)
+
+    def close_all(self) -> None:
+        """Close built components in reverse build order and forget them."""
+        with self._lock:
+            order = list(reversed(self._build_order))
+            self._build_order.clear()
+
+        for name in order:
+            value = self._entries[name].reset()
+            close = self._closers.get(name)
+            if close is None or value is None:
+                continue
+            try:
+                close(value)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Discord Lite: Error closing {name}: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get built state and construction time of each component."""
+        return {
+            name: {"built": entry.is_built, "build_ms": entry.build_ms}
+            for name, entry in self._entries.items()
+        }
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module __getattr__ (PEP 562) importing submodules on first access.
+
+    Lets a package __init__ keep its public names without importing every
+    submodule up front: `from backend.auth.token_manager import
+    TokenManager` no longer drags in the OAuth stack through
+    backend/auth/__init__.py. Resolved names are stored on the package,
+    so later lookups are plain attribute reads.
+
+    Args:
+        package: The package's __name__
+        exports: Public name -> relative submodule (e.g., {"OAuth2Manager": ".oauth"})
+
+    Returns:
+        Function to assign to the package's __getattr__
+    """
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -0,0 +1,227 @@
+"""Low-overhead logging: lazy formatting, rate limits and an in-memory trace buffer"""
+
+import logging
+import os
+import reprlib
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+class PluginLogger:
+    """
+    Wraps the Decky logger to keep log I/O near zero in normal operation.
+
+    - Messages take %-style arguments and are only formatted if the line
+      is actually written (or dumped)
+    - trace() lines (RPC bodies and other verbose detail) go to a bounded
+      in-memory ring buffer and reach the log file only at DEBUG level or
+      when verbose mode is on
+    - limited() writes a given message key at most once per interval and
+      reports how many were suppressed
+    - dump() writes the ring buffer to a file on demand
+
+    Buffered arguments are shortened with reprlib on insert (scalars are
+    kept as is), so a trace of a large RPC reply holds a bounded string
+    instead of keeping the reply dict alive until it is evicted.
+
+    Everything else (info, warning, error, ...) is passed through, so the
+    wrapper can be handed to any component that expects a logger.
+    """
+
+    DEFAULT_CAPACITY = 500
+    DEFAULT_INTERVAL = 60.0
+
+    def __init__(self, logger, capacity: int = DEFAULT_CAPACITY, verbose: bool = False):
+        """
+        Initialize plugin logger.
+
+        Args:
+            logger: Underlying logger (decky.logger)
+            capacity: Number of trace entries kept in memory
+            verbose: Also write trace lines to the log at INFO
+        """
+        self.logger = logger
+        self.verbose = verbose
+
+        self._lock = threading.Lock()
+        # (wall time, level name, message, args); formatted only when dumped
+        self._buffer: Deque[Tuple[float, str, str, Tuple[Any, ...]]] = deque(maxlen=capacity)
+        # key -> (last written monotonic time, suppressed count)
+        self._limits: Dict[str, Tuple[float, int]] = {}
+
+    def __getattr__(self, name: str):
+        # info/warning/error/debug/exception/isEnabledFor/... of the wrapped logger
+        return getattr(self.logger, name)
+
+    def trace(self, msg: str, *args: Any) -> None:
+        """
+        Record verbose detail (e.g., a full RPC response).
+
+        Stored unformatted in the ring buffer; written to the log only if
+        DEBUG is enabled on the wrapped logger or verbose mode is on.
+
+        Args:
+            msg: %-style message
+            *args: Message arguments (shortened with reprlib when buffered)
+        """
+        entry = (time.time(), "TRACE", msg, _snapshot_args(args))
+        with self._lock:
+            self._buffer.append(entry)
+
+        if self.verbose:
+            self.logger.info(msg, *args)
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args)
+
+    def limited(self, key: str, level: int, msg: str, *args: Any,
+                interval: float = DEFAULT_INTERVAL) -> bool:
+        """
+        Write a message at most once per interval for its key.
+
+        Args:
+            key: Rate limit key (e.g., "rpc.not_connected")
+            level: logging level (e.g., logging.ERROR)
+            msg: %-style message
+            *args: Message arguments
+            interval: Minimum seconds between writes for this key
+
+        Returns:
+            True if the message was written
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            last, suppressed = self._limits.get(key, (None, 0))
+            if last is not None and now - last < interval:
+                self._limits[key] = (last, suppressed + 1)
+                self._buffer.append((time.time(), logging.getLevelName(level), msg, _snapshot_args(args)))
+                return False
+            self._limits[key] = (now, 0)
+
+        if suppressed:
+            msg = f"{msg} (%d similar messages suppressed)"
+            args = args + (suppressed,)
+
+        self.logger.log(level, msg, *args)
+        return True
+
+    def dump(self, directory: str, prefix: str = "discord-lite-trace") -> Optional[str]:
+        """
+        Write the ring buffer to a file.
+
+        Args:
+            directory: Target directory (DECKY_PLUGIN_LOG_DIR)
+            prefix: File name prefix
+
+        Returns:
+            Path of the written file, or None on error
+        """
+        with self._lock:
+            entries = list(self._buffer)
+
+        path = os.path.join(directory, f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}.log")
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(path, 'w') as f:
+                for timestamp, level, msg, args in entries:
+                    when = time.strftime('%H:%M:%S', time.localtime(timestamp))
+                    f.write(f"{when}.{int(timestamp % 1 * 1000):03d} {level} {_format(msg, args)}\n")
+        except OSError as e:
+            self.logger.error("Discord Lite: Could not write trace dump %s: %s", path, e)
+            return None
+
+        self.logger.info("Discord Lite: Wrote %d trace entries to %s", len(entries), path)
+        return path
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer usage and suppression counters."""
+        with self._lock:
+            return {
+                "buffered": len(self._buffer),
+                "capacity": self._buffer.maxlen,
+                "verbose": self.verbose,
+                "suppressed": {key: count for key, (_, count) in self._limits.items() if count},
+            }
+
+
+# Bounds what one buffered argument can hold (a few KiB even for a huge reply)
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxlevel = 4
+_ARG_REPR.maxdict = 8
+_ARG_REPR.maxlist = 8
+_ARG_REPR.maxstring = 160
+_ARG_REPR.maxother = 160
+
+_SCALARS = (int, float, bool, type(None))
+MAX_ARG_CHARS = 1024
+
+
+def _snapshot_args(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """
+    Make buffered arguments independent of the caller's objects.
+
+    Numbers stay numbers (so %d still formats); strings are cut to
+    MAX_ARG_CHARS and anything else becomes a shortened repr.
+    """
+    return tuple(
+        arg if isinstance(arg, _SCALARS)
+        else arg[:MAX_ARG_CHARS] if isinstance(arg, str)
+        else _ARG_REPR.repr(arg)
+        for arg in args
+    )
+
+
+def _format(msg: str, args: Tuple[Any, ...]) -> str:
+    """Apply %-style arguments, tolerating mismatched ones."""
+    if not args:
+        return msg
+    try:
+        return msg % args
+    except (TypeError, ValueError):
+        return f"{msg} {args!r}"
+
+
+def trace(logger, msg: str, *args: Any) -> None:
+    """
+    Record verbose detail on any logger.
+
+    Uses PluginLogger.trace when available, otherwise logs at DEBUG
+    (still lazily formatted).
+
+    Args:
+        logger: Logger instance or None
+        msg: %-style message
+        *args: Message arguments
+    """
+    if logger is None:
+        return
+
+    if isinstance(logger, PluginLogger):
+        logger.trace(msg, *args)
+    else:
+        logger.debug(msg, *args)
+
+
+def log_limited(logger, key: str, level: int, msg: str, *args: Any,
+                interval: float = PluginLogger.DEFAULT_INTERVAL) -> None:
+    """
+    Rate-limited log on any logger (plain loggers write every time).
+
+    Args:
+        logger: Logger instance or None
+        key: Rate limit key
+        level: logging level
+        msg: %-style message
+        *args: Message arguments
+        interval: Minimum seconds between writes for this key
+    """
+    if logger is None:
+        return
+
+    if isinstance(logger, PluginLogger):
+        logger.limited(key, level, msg, *args, interval=interval)
+    else:
+        logger.log(level, msg, *args)
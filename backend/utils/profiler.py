@@ -0,0 +1,232 @@
+"""On-demand CPU sampling and tracemalloc memory diffs"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+
+def _timestamp() -> str:
+    return time.strftime('%Y%m%d-%H%M%S')
+
+
+class StackSampler:
+    """
+    Wall-clock stack sampler for all plugin threads.
+
+    Unlike cProfile, which only sees the thread that enabled it, this
+    samples sys._current_frames() from a separate thread, so the Decky
+    event loop, the poller worker and executor threads show up together.
+    Cost while running is one frame walk per thread per interval; nothing
+    runs between profiles.
+
+    Output is the collapsed-stack format ("thread;outer;inner count"),
+    which speedscope and flamegraph.pl load directly.
+    """
+
+    DEFAULT_INTERVAL = 0.005
+    MAX_SECONDS = 120.0
+    MAX_DEPTH = 64
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self._running = threading.Lock()
+
+    def is_running(self) -> bool:
+        """True while a profile is being collected."""
+        return self._running.locked()
+
+    def run(self, seconds: float) -> Optional[Dict[str, Any]]:
+        """
+        Sample all threads for a duration (blocks the calling thread).
+
+        Args:
+            seconds: Profile length (capped at MAX_SECONDS)
+
+        Returns:
+            Dictionary with samples, stacks (Counter) and top functions,
+            or None if a profile is already running
+        """
+        if not self._running.acquire(blocking=False):
+            return None
+
+        try:
+            return self._sample(min(max(seconds, 0.1), self.MAX_SECONDS))
+        finally:
+            self._running.release()
+
+    def _sample(self, seconds: float) -> Dict[str, Any]:
+        own_id = threading.get_ident()
+        stacks: Counter = Counter()
+        self_time: Counter = Counter()
+        samples = 0
+
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+
+                frames: List[str] = []
+                while frame is not None and len(frames) < self.MAX_DEPTH:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+
+                if not frames:
+                    continue
+
+                self_time[frames[0]] += 1
+                frames.append(names.get(thread_id, str(thread_id)))
+                stacks[";".join(reversed(frames))] += 1
+
+            samples += 1
+            time.sleep(self.interval)
+
+        return {
+            "seconds": seconds,
+            "samples": samples,
+            "stacks": stacks,
+            "top": [{"function": name, "samples": count} for name, count in self_time.most_common(20)],
+        }
+
+    @staticmethod
+    def write_collapsed(stacks: Counter, directory: str, prefix: str = "discord-lite-profile") -> str:
+        """
+        Write collapsed stacks to a file.
+
+        Args:
+            stacks: Counter from run()
+            directory: Target directory (DECKY_PLUGIN_LOG_DIR)
+            prefix: File name prefix
+
+        Returns:
+            Path of the written file
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{prefix}-{_timestamp()}.folded")
+
+        with open(path, 'w') as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        return path
+
+
+class MemoryProfiler:
+    """
+    tracemalloc snapshots diffed against the previous call.
+
+    The first snapshot() starts tracing and records a baseline; each
+    later call writes the top allocation growth since the previous
+    snapshot and makes the new one the baseline. Tracing has a real
+    memory and CPU cost, so it only runs between the first snapshot()
+    and stop(). Tracing someone else started (e.g., PYTHONTRACEMALLOC or
+    the benchmarks) is reused and left running by stop().
+    """
+
+    DEFAULT_FRAMES = 5
+    DEFAULT_TOP = 25
+
+    def __init__(self, frames: int = DEFAULT_FRAMES):
+        """
+        Initialize memory profiler.
+
+        Args:
+            frames: Traceback depth stored per allocation
+        """
+        self.frames = frames
+        self._lock = threading.Lock()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_time = 0.0
+        self._owns_tracing = False  # True if snapshot() called tracemalloc.start()
+
+    def is_tracing(self) -> bool:
+        """True while tracemalloc is recording for this profiler."""
+        return self._baseline is not None and tracemalloc.is_tracing()
+
+    def snapshot(self, directory: str, top: int = DEFAULT_TOP,
+                 prefix: str = "discord-lite-memory") -> Dict[str, Any]:
+        """
+        Take a snapshot and diff it against the previous one.
+
+        Args:
+            directory: Target directory (DECKY_PLUGIN_LOG_DIR)
+            top: Number of lines in the diff
+            prefix: File name prefix
+
+        Returns:
+            Dictionary with traced memory totals; after the first call
+            also the top growth lines and the path of the written report
+        """
+        with self._lock:
+            if not self.is_tracing():
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start(self.frames)
+                    self._owns_tracing = True
+                self._baseline = self._take()
+                self._baseline_time = time.monotonic()
+                current, peak = tracemalloc.get_traced_memory()
+                return {"started": True, "traced_bytes": current, "peak_bytes": peak}
+
+            snapshot = self._take()
+            stats = snapshot.compare_to(self._baseline, "lineno")
+            elapsed = time.monotonic() - self._baseline_time
+            self._baseline = snapshot
+            self._baseline_time = time.monotonic()
+
+        current, peak = tracemalloc.get_traced_memory()
+        growth = [
+            {
+                "location": str(stat.traceback[0]) if stat.traceback else "?",
+                "size_diff": stat.size_diff,
+                "size": stat.size,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:top]
+        ]
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{prefix}-{_timestamp()}.txt")
+        with open(path, 'w') as f:
+            f.write(f"# tracemalloc diff over {elapsed:.1f}s, traced={current} peak={peak}\n")
+            for stat in stats[:top]:
+                f.write(f"{stat}\n")
+                for line in stat.traceback.format()[1:]:
+                    f.write(f"    {line}\n")
+
+        return {
+            "started": False,
+            "elapsed_seconds": round(elapsed, 1),
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "top": growth,
+            "path": path,
+        }
+
+    def stop(self) -> None:
+        """Drop the baseline and stop tracing if this profiler started it."""
+        with self._lock:
+            self._baseline = None
+            if self._owns_tracing and tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._owns_tracing = False
+
+    @staticmethod
+    def _take() -> tracemalloc.Snapshot:
+        # Allocations made by tracemalloc itself would dominate the diff
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
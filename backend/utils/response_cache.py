@@ -0,0 +1,62 @@
+"""Memoized frontend response payloads keyed by state version"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+
+class ResponseCache:
+    """
+    Reuses a built response until the state it was built from changes.
+
+    Each response name keeps only its latest (key, payload) pair. The key
+    is a tuple of whatever identifies the underlying state (snapshot
+    objects, version counters); keys are compared with ==, so snapshot
+    objects compare by identity. Repeated identical polls then cost a
+    tuple comparison instead of rebuilding nested member/guild lists.
+
+    Payloads are shared between callers and must not be modified.
+    """
+
+    def __init__(self):
+        """Initialize empty cache."""
+        self._entries: Dict[str, Tuple[Tuple[Any, ...], Any]] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        """
+        Get the cached payload for a response, rebuilding it if the key changed.
+
+        Args:
+            name: Response name (e.g., "get_voice_state")
+            key: State version key
+            build: Function building the payload
+
+        Returns:
+            Cached or freshly built payload
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[1]
+
+        payload = build()
+
+        with self._lock:
+            self._entries[name] = (key, payload)
+            self.misses += 1
+
+        return payload
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
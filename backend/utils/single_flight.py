@@ -0,0 +1,119 @@
+"""Single-flight request coalescing for RPC reads"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    """One in-flight or recently completed call"""
+
+    __slots__ = ("done", "result", "error", "finished_at", "stale")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.finished_at: Optional[float] = None
+        self.stale = False  # Invalidated while in flight; never reused once finished
+
+
+class SingleFlight:
+    """
+    Collapses duplicate reads into one request.
+
+    Callers asking for the same key while a request is in flight wait
+    for it and share its result instead of issuing their own. A finished
+    result is reused for max_age seconds, so reads fired close together
+    (e.g., get_voice_state right after sync_full_state) cost one round trip.
+    """
+
+    DEFAULT_MAX_AGE = 0.5
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize single-flight group.
+
+        Args:
+            max_age: Seconds a finished result stays fresh
+            clock: Monotonic time source
+        """
+        self.max_age = max_age
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+        # Stats
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: str, func: Callable[[], Any], max_age: Optional[float] = None) -> Any:
+        """
+        Run func once for concurrent or closely spaced callers of key.
+
+        Args:
+            key: Request identity (e.g., "GET_VOICE_SETTINGS")
+            func: Function performing the request
+            max_age: Override freshness window (0 = only join in-flight calls)
+
+        Returns:
+            Result of func (shared between coalesced callers)
+        """
+        if max_age is None:
+            max_age = self.max_age
+
+        with self._lock:
+            call = self._calls.get(key)
+
+            if call is not None and (
+                (not call.done.is_set() and not call.stale)
+                or (call.error is None and not call.stale and self.clock() - call.finished_at < max_age)
+            ):
+                self.shared += 1
+                owner = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                owner = True
+
+        if not owner:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            call.finished_at = self.clock()
+            call.done.set()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Forget finished results so the next read goes to Discord.
+
+        In-flight calls are marked stale: callers already waiting on them
+        still get their result, but it is not reused afterwards.
+
+        Args:
+            key: Key to invalidate, or None for all keys
+        """
+        with self._lock:
+            keys = [key] if key is not None else list(self._calls)
+            for k in keys:
+                call = self._calls.get(k)
+                if call is None:
+                    continue
+                if call.done.is_set():
+                    del self._calls[k]
+                else:
+                    call.stale = True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get executed/shared call counters."""
+        return {"executed": self.executed, "shared": self.shared}
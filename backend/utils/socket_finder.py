@@ -1,7 +1,292 @@
 """Discord IPC socket detection for Linux/Steam Deck"""
 
 import os
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from . import inotify
+from .lazy import Lazy
+
+SOCKET_PREFIX = "discord-ipc-"
+
+# Subdirectories of a runtime dir holding sockets, in priority order (as in pypresence)
+RUNTIME_SUBDIRS = (
+    "app/com.discordapp.Discord",        # Flatpak (Steam Deck uses this most often)
+    "",                                   # Native installation
+    "snap.discord",                       # Snap
+    "app/com.discordapp.DiscordCanary",  # Flatpak Canary
+)
+
+
+def default_search_dirs(uids: Optional[List[int]] = None, environ=os.environ) -> List[str]:
+    """
+    Directories that may hold Discord IPC sockets, in priority order.
+
+    Args:
+        uids: User IDs whose /run/user dirs are searched (default: 1000 and the current user)
+        environ: Environment (XDG_RUNTIME_DIR, TMPDIR)
+
+    Returns:
+        Deduplicated list of directories (existing or not)
+    """
+    if uids is None:
+        uids = [1000, os.getuid()]
+
+    runtime_dirs = []
+    if environ.get("XDG_RUNTIME_DIR"):
+        runtime_dirs.append(environ["XDG_RUNTIME_DIR"])
+    runtime_dirs += [f"/run/user/{uid}" for uid in uids]
+
+    dirs = [os.path.normpath(os.path.join(base, sub)) for base in runtime_dirs for sub in RUNTIME_SUBDIRS]
+    dirs.append(environ.get("TMPDIR") or "/tmp")
+
+    return list(dict.fromkeys(dirs))
+
+
+class IPCSocketFinder:
+    """
+    Finds the Discord IPC socket and remembers it.
+
+    A search scans each candidate directory once with os.scandir and picks
+    the lowest-numbered socket, earlier directories winning ties. The
+    result is cached both ways:
+
+    - Found: the cached path is re-validated with one stat(); a different
+      inode means Discord restarted and re-created the socket, a missing
+      file means it exited. Either triggers a new search.
+    - Not found: directories are watched with inotify (their nearest
+      existing parent when they do not exist yet, e.g. before the first
+      Flatpak launch), and a new search only runs once something changed.
+      Checking costs one non-blocking read of the inotify fd.
+
+    Without inotify, a miss searches again on every call (still one
+    scandir per directory instead of a stat per possible path).
+
+    Thread-safe; shared by every RPC client (see get_socket_finder()).
+    """
+
+    WATCH_EVENTS = (
+        inotify.IN_CREATE | inotify.IN_DELETE | inotify.IN_MOVED_FROM |
+        inotify.IN_MOVED_TO | inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF
+    )
+
+    def __init__(self, search_dirs: Optional[List[str]] = None, use_inotify: bool = True, logger=None):
+        """
+        Initialize finder (nothing is scanned or watched until first find()).
+
+        Args:
+            search_dirs: Candidate directories in priority order (default: default_search_dirs())
+            use_inotify: Watch directories while no socket exists (False = search every call)
+            logger: Logger instance for logging operations
+        """
+        self.search_dirs = search_dirs if search_dirs is not None else default_search_dirs()
+        self.use_inotify = use_inotify
+        self.logger = logger
+        self._lock = threading.Lock()
+
+        self._path: Optional[str] = None  # Last socket found
+        self._inode: Optional[int] = None
+        self._miss_valid = False  # No socket found and nothing changed since
+        self._dead_inodes: Set[int] = set()  # Socket files nobody listens on
+
+        self._inotify: Optional[inotify.InotifyWatcher] = None
+        self._inotify_failed = False
+        self._watch_names: Set[str] = set()  # Entry names that matter in parent watches
+
+        # Stats
+        self.searches = 0
+        self.hits = 0
+        self.miss_hits = 0
+
+    def find(self) -> Optional[str]:
+        """
+        Get the current socket path.
+
+        Returns:
+            Full path to socket file or None if Discord is not running
+        """
+        with self._lock:
+            if self._path is not None:
+                if self._cached_path_valid():
+                    self.hits += 1
+                    return self._path
+                self._forget_path()
+
+            elif self._miss_valid and not self._watch_changed():
+                self.miss_hits += 1
+                return None
+
+            return self._search()
+
+    def mark_dead(self, path: str) -> None:
+        """
+        Report a socket that refused connections (Discord exited without removing it).
+
+        The file is skipped by later searches until it is replaced.
+
+        Args:
+            path: Socket path that could not be connected to
+        """
+        try:
+            inode = os.stat(path).st_ino
+        except OSError:
+            inode = None
+
+        with self._lock:
+            if inode is not None:
+                self._dead_inodes.add(inode)
+            if path == self._path:
+                self._forget_path()
+
+    def invalidate(self) -> None:
+        """Drop cached results so the next find() searches again."""
+        with self._lock:
+            self._forget_path()
+            self._miss_valid = False
+
+    def close(self) -> None:
+        """Release the inotify instance."""
+        with self._lock:
+            if self._inotify:
+                self._inotify.close()
+                self._inotify = None
+            self._miss_valid = False
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get cached path, search count and cache hits."""
+        return {
+            "path": self._path,
+            "searches": self.searches,
+            "hits": self.hits,
+            "miss_hits": self.miss_hits,
+            "watching": self._inotify.watched_paths() if self._inotify else [],
+        }
+
+    # ==================== INTERNALS (caller holds the lock) ====================
+
+    def _cached_path_valid(self) -> bool:
+        try:
+            return os.stat(self._path).st_ino == self._inode
+        except OSError:
+            return False
+
+    def _forget_path(self) -> None:
+        if self._path is not None and self.logger:
+            self.logger.info(f"Discord Lite: Socket {self._path} is gone")
+        self._path = None
+        self._inode = None
+
+    def _search(self) -> Optional[str]:
+        """Scan every directory once and cache the best socket."""
+        self.searches += 1
+
+        # Events queued before this scan are covered by it
+        self._watch_changed()
+
+        best: Optional[Tuple[int, int, str, int]] = None  # (number, dir priority, path, inode)
+        seen_inodes: Set[int] = set()
+
+        for priority, directory in enumerate(self.search_dirs):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        suffix = entry.name[len(SOCKET_PREFIX):]
+                        if not entry.name.startswith(SOCKET_PREFIX) or not suffix.isdigit():
+                            continue
+
+                        inode = entry.inode()
+                        seen_inodes.add(inode)
+                        if inode in self._dead_inodes:
+                            continue
+
+                        candidate = (int(suffix), priority, entry.path, inode)
+                        if best is None or candidate < best:
+                            best = candidate
+            except OSError:
+                continue
+
+        self._dead_inodes &= seen_inodes
+
+        if best is not None:
+            _, _, self._path, self._inode = best
+            self._miss_valid = False
+            if self.logger:
+                self.logger.info(f"Discord Lite: Socket found at: {self._path}")
+            return self._path
+
+        self._miss_valid = self._watch_dirs()
+        if self.logger:
+            self.logger.warning(f"Discord Lite: No socket found in {len(self.search_dirs)} directories")
+        return None
+
+    def _watch_dirs(self) -> bool:
+        """
+        Watch candidate directories (or their nearest existing parent).
+
+        Returns:
+            True if every directory is covered by a watch
+        """
+        if not self.use_inotify or self._inotify_failed:
+            return False
+
+        if self._inotify is None:
+            try:
+                self._inotify = inotify.InotifyWatcher()
+            except OSError:
+                self._inotify_failed = True
+                return False
+
+        watched = set(self._inotify.watched_paths())
+
+        for directory in self.search_dirs:
+            path = directory
+            while True:
+                if os.path.isdir(path):
+                    break
+                # Not created yet: watch for the missing component in its parent
+                parent = os.path.dirname(path)
+                if parent == path:
+                    return False
+                self._watch_names.add(os.path.basename(path))
+                path = parent
+
+            # One watch per directory, whatever name (symlink) led to it
+            path = os.path.realpath(path)
+            if path not in watched:
+                if self._inotify.add_watch(path, self.WATCH_EVENTS) is None:
+                    return False
+                watched.add(path)
+
+        return True
+
+    def _watch_changed(self) -> bool:
+        """Drain inotify events; True if any could mean a socket appeared."""
+        if self._inotify is None:
+            return True
+
+        changed = False
+        for _path, mask, name in self._inotify.read_events():
+            if (name.startswith(SOCKET_PREFIX) or name in self._watch_names
+                    or mask & (inotify.IN_Q_OVERFLOW | inotify.IN_IGNORED |
+                               inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF)):
+                changed = True
+
+        return changed
+
+
+_default_finder = Lazy(IPCSocketFinder)
+
+
+def get_socket_finder() -> IPCSocketFinder:
+    """Get the process-wide socket finder (created on first use)."""
+    return _default_finder.get()
+
+
+def close_socket_finder() -> None:
+    """Release the shared finder's inotify watches (the next use starts fresh)."""
+    finder = _default_finder.reset()
+    if finder is not None:
+        finder.close()
 
 
 def find_discord_ipc_socket(logger=None) -> Optional[str]:
@@ -11,39 +296,19 @@ def find_discord_ipc_socket(logger=None) -> Optional[str]:
     Args:
         logger: Optional logger instance for logging operations
 
-    Searches in three priority locations:
-    1. Flatpak: /run/user/{uid}/app/com.discordapp.Discord/discord-ipc-*
-    2. Native: /run/user/{uid}/discord-ipc-*
-    3. Fallback: /tmp/discord-ipc-*
+    Searches Flatpak, native, Snap and Flatpak Canary locations under
+    XDG_RUNTIME_DIR and /run/user/{uid}, then the temp directory, through
+    the shared IPCSocketFinder, so repeated calls cost one stat (socket
+    present) or one inotify read (Discord not running).
 
     Returns:
         Full path to socket file or None if Discord is not running
 
     Example:
         >>> find_discord_ipc_socket()
-        '/run/user/1000/discord-ipc-0'
+        '/run/user/1000/app/com.discordapp.Discord/discord-ipc-0'
     """
-    # Get possible UIDs (Steam Deck typically uses 1000)
-    possible_uids = [1000, os.getuid()]
-    possible_uids = list(set(possible_uids))  # Remove duplicates
-
-    for uid in possible_uids:
-        for socket_number in range(10):  # Discord creates discord-ipc-0 through discord-ipc-9
-            possible_paths = [
-                # Flatpak path (Steam Deck uses this most often)
-                f"/run/user/{uid}/app/com.discordapp.Discord/discord-ipc-{socket_number}",
-                # Native installation path
-                f"/run/user/{uid}/discord-ipc-{socket_number}",
-                # Temporary fallback path
-                f"/tmp/discord-ipc-{socket_number}",
-            ]
-
-            for socket_path in possible_paths:
-                if os.path.exists(socket_path):
-                    if logger:
-                        logger.info(f"Discord Lite: Socket found at: {socket_path}")
-                    return socket_path
-
-    if logger:
-        logger.warning(f"Discord Lite: No socket found. Tested UIDs: {possible_uids}")
-    return None
+    finder = get_socket_finder()
+    if logger and finder.logger is None:
+        finder.logger = logger
+    return finder.find()
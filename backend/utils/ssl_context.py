@@ -0,0 +1,36 @@
+"""Shared SSL context for Discord HTTP API requests"""
+
+from .lazy import Lazy
+
+
+def _build_ssl_context():
+    """
+    Client context without certificate verification.
+
+    Certificates may not be properly configured on the Steam Deck, so
+    verification stays off. With verification off, the CA bundle is never
+    consulted; ssl.create_default_context() would still load it (tens of
+    milliseconds on the Deck), so a bare client context is built instead.
+    """
+    import ssl
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+_ssl_context = Lazy(_build_ssl_context)
+
+
+def get_ssl_context():
+    """
+    Get the shared SSL context, building it on first call.
+
+    The OAuth token exchange and the detectable apps download share one
+    context instead of each building their own on construction.
+
+    Returns:
+        ssl.SSLContext
+    """
+    return _ssl_context.get()
@@ -0,0 +1,279 @@
+"""Span tracing with Chrome trace-event export"""
+
+import asyncio
+import functools
+import heapq
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+class _NullSpan:
+    """Context manager returned while tracing is off (shared, does nothing)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """One open span; recorded into the tracer when it exits"""
+
+    __slots__ = ("tracer", "name", "category", "args", "lane", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.lane = tracer._lane()
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args = dict(self.args or {}, error=exc_type.__name__)
+        self.tracer._record(self.name, self.category, self.lane, self.start, end - self.start, self.args)
+        return False
+
+
+class Tracer:
+    """
+    Records timed spans into a fixed-size buffer.
+
+    Spans nest per thread (worker thread, socket callers) or per asyncio
+    task (Plugin callables on the Decky loop), so concurrent calls show up
+    on separate lanes. Tasks borrow numbered lanes from a pool and give
+    them back when they finish, so the lane count follows peak
+    concurrency rather than the number of calls. While disabled, span() returns a shared no-op
+    context manager: the only cost is one attribute check.
+
+    The buffer exports as Chrome trace-event JSON, which loads in
+    chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    DEFAULT_CAPACITY = 20000
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        """
+        Initialize tracer.
+
+        Args:
+            capacity: Number of completed spans kept (oldest dropped first)
+            enabled: Start recording immediately
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        # (name, category, lane, start ns, duration ns, args)
+        self._spans: Deque[Tuple[str, str, str, int, int, Optional[Dict[str, Any]]]] = deque(maxlen=capacity)
+        self._lanes: Dict[str, int] = {}
+        self._next_tid = 1
+        self._task_lanes: Dict[asyncio.Task, str] = {}
+        self._free_task_lanes: List[int] = []
+        self._task_lane_count = 0
+        self.dropped = 0
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Start or stop recording (recorded spans are kept).
+
+        Args:
+            enabled: True to record spans
+        """
+        self.enabled = bool(enabled)
+
+    def span(self, name: str, category: str = "plugin", args: Optional[Dict[str, Any]] = None):
+        """
+        Time a block of code.
+
+        Args:
+            name: Span name (e.g., "GET_VOICE_SETTINGS")
+            category: Span category (plugin, rpc, voice, poller, steam)
+            args: Extra values shown with the span
+
+        Returns:
+            Context manager
+
+        Example:
+            >>> with tracer.span("decode", "rpc"):
+            ...     decode_message(data)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        with self._lock:
+            self._spans.clear()
+            self._lanes.clear()
+            self.dropped = 0
+
+    def _lane(self) -> str:
+        """Name of the timeline the current span belongs to."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        if task is not None:
+            return self._task_lane(task)
+        return threading.current_thread().name
+
+    def _task_lane(self, task: asyncio.Task) -> str:
+        """Pool lane held by a task until it finishes."""
+        lane = self._task_lanes.get(task)
+        if lane is not None:
+            return lane
+
+        with self._lock:
+            if self._free_task_lanes:
+                number = heapq.heappop(self._free_task_lanes)
+            else:
+                self._task_lane_count += 1
+                number = self._task_lane_count
+            lane = f"task {number}"
+            self._task_lanes[task] = lane
+
+        task.add_done_callback(lambda done: self._release_task_lane(done, number))
+        return lane
+
+    def _release_task_lane(self, task: asyncio.Task, number: int) -> None:
+        with self._lock:
+            if self._task_lanes.pop(task, None) is not None:
+                heapq.heappush(self._free_task_lanes, number)
+
+    def _record(self, name: str, category: str, lane: str, start: int, duration: int,
+                args: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            if len(self._spans) == self._spans.maxlen:
+                self.dropped += 1
+            if lane not in self._lanes:
+                self._lanes[lane] = self._next_tid
+                self._next_tid += 1
+            self._spans.append((name, category, lane, start, duration, args))
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Build a Chrome trace-event document from the buffer.
+
+        Returns:
+            Dictionary with traceEvents (complete "X" events plus
+            thread_name metadata per lane)
+        """
+        with self._lock:
+            spans = list(self._spans)
+            # Forget lanes whose spans have all been dropped from the buffer
+            used = {span[2] for span in spans}
+            self._lanes = {lane: tid for lane, tid in self._lanes.items() if lane in used}
+            lanes = dict(self._lanes)
+            dropped = self.dropped
+
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": lane}}
+            for lane, tid in lanes.items()
+        ]
+
+        for name, category, lane, start, duration, args in spans:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": lanes.get(lane, 0),
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"spans": len(spans), "dropped": dropped},
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer usage."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "spans": len(self._spans),
+                "capacity": self._spans.maxlen,
+                "dropped": self.dropped,
+            }
+
+
+# Process-wide tracer shared by the plugin, RPC client, poller and detector
+tracer = Tracer()
+
+
+def traced(category: str = "plugin", name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording a span around each call of a function or coroutine.
+
+    Args:
+        category: Span category
+        name: Span name (defaults to the function name)
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with tracer.span(span_name, category):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def trace_public_methods(category: str = "plugin") -> Callable:
+    """
+    Class decorator applying traced() to every public coroutine method.
+
+    Used on the Plugin class so each frontend callable gets a span
+    without decorating them one by one.
+
+    Args:
+        category: Span category
+
+    Returns:
+        Class decorator
+    """
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("_") and asyncio.iscoroutinefunction(value):
+                setattr(cls, attr, traced(category)(value))
+        return cls
+
+    return decorator
@@ -2,11 +2,15 @@
 
 from .volume import perceptual_to_amplitude, amplitude_to_perceptual
 from .controller import VoiceController
+from .state import VoiceSnapshot
 from .members import MemberTracker
+from .event_coalescer import MemberEventCoalescer
 
 __all__ = [
     'perceptual_to_amplitude',
     'amplitude_to_perceptual',
     'VoiceController',
-    'MemberTracker'
+    'VoiceSnapshot',
+    'MemberTracker',
+    'MemberEventCoalescer'
 ]
@@ -1,8 +1,25 @@
 """Voice settings controller for Discord RPC"""
 
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
 
+from .state import VoiceSnapshot
 from .volume import perceptual_to_amplitude, amplitude_to_perceptual
+from ..utils.log import trace
+from ..utils.single_flight import SingleFlight
+from ..utils.tracing import traced
+
+
+def _state_field(name: str, doc: str) -> property:
+    """Expose a snapshot field as a controller attribute (writes swap the snapshot)."""
+    def getter(self):
+        return getattr(self._state, name)
+
+    def setter(self, value):
+        self._update(**{name: value})
+
+    return property(getter, setter, doc=doc)
 
 
 class VoiceController:
@@ -11,8 +28,28 @@ class VoiceController:
 
     Manages voice state, settings, and channel operations with automatic
     conversion between perceptual and amplitude values.
+
+    State lives in an immutable VoiceSnapshot that is rebuilt per update
+    and swapped atomically, so the poller thread and Plugin methods on
+    the event loop never see half-updated channel state. Writers
+    serialize on a lock; readers take `state` without locking.
     """
 
+    # Snapshot fields readable (and writable) as plain attributes
+    is_muted = _state_field("is_muted", "Self-mute state")
+    is_deafened = _state_field("is_deafened", "Self-deafen state")
+    input_volume = _state_field("input_volume", "Input volume (perceptual 0-100)")
+    output_volume = _state_field("output_volume", "Output volume (perceptual 0-200)")
+    mode_type = _state_field("mode_type", "VOICE_ACTIVITY or PUSH_TO_TALK")
+    automatic_gain_control = _state_field("automatic_gain_control", "Automatic gain control")
+    echo_cancellation = _state_field("echo_cancellation", "Echo cancellation")
+    noise_suppression = _state_field("noise_suppression", "Noise suppression")
+    qos = _state_field("qos", "Quality of service")
+    silence_warning = _state_field("silence_warning", "Silence warning")
+    voice_channel_id = _state_field("channel_id", "Current voice channel ID")
+    voice_channel_name = _state_field("channel_name", "Current voice channel name")
+    voice_guild_id = _state_field("guild_id", "Guild of the current voice channel")
+
     def __init__(self, rpc_client, logger=None):
         """
         Initialize voice controller.
@@ -24,33 +61,83 @@ class VoiceController:
         self.rpc = rpc_client
         self.logger = logger
 
-        # Voice state
-        self.is_muted = False
-        self.is_deafened = False
-        self.input_volume = 100
-        self.output_volume = 100
+        # Voice, settings and channel state (replaced, never mutated)
+        self._state = VoiceSnapshot()
+        self._write_lock = threading.Lock()
+
+        # Monotonic time the member list is current as of (never decreases)
+        self._members_as_of = 0.0
 
-        # Voice settings
-        self.mode_type = "VOICE_ACTIVITY"  # or PUSH_TO_TALK
-        self.automatic_gain_control = True
-        self.echo_cancellation = True
-        self.noise_suppression = True
-        self.qos = True
-        self.silence_warning = False
+        # Shares concurrent/closely spaced GET_* reads (one IPC round trip)
+        self._reads = SingleFlight()
 
-        # Channel state
-        self.voice_channel_id: Optional[str] = None
-        self.voice_channel_name: Optional[str] = None
-        self.voice_guild_id: Optional[str] = None
-        self.voice_members: List[Dict[str, Any]] = []
+        # Last GET_GUILDS result; guilds_version changes only when it differs
+        self._guilds_raw: Optional[List[Dict[str, Any]]] = None
+        self._guilds: List[Dict[str, Any]] = []
+        self.guilds_version = 0
 
-    def get_voice_settings(self) -> Optional[Dict[str, Any]]:
+    @property
+    def state(self) -> VoiceSnapshot:
+        """Current state snapshot (consistent, lock-free read)."""
+        return self._state
+
+    @property
+    def voice_members(self) -> List[Dict[str, Any]]:
+        """Current voice channel members as a list (do not modify)."""
+        return self._state.member_list()
+
+    @voice_members.setter
+    def voice_members(self, members: List[Dict[str, Any]]) -> None:
+        self._update(members={m["user_id"]: m for m in members if m.get("user_id")})
+
+    @property
+    def members_as_of(self) -> float:
+        """Monotonic time of the newest member data (fetch start or pushed delta)."""
+        return self._members_as_of
+
+    def members_snapshot(self) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Get the member list together with the time it is current as of.
+
+        Returns:
+            Tuple of (member list, monotonic timestamp) read atomically
+        """
+        with self._write_lock:
+            return self._state.member_list(), self._members_as_of
+
+    def get_read_stats(self) -> Dict[str, int]:
+        """Get executed/shared counts of coalesced GET_* reads."""
+        return self._reads.get_stats()
+
+    def _update(self, **changes) -> VoiceSnapshot:
+        """
+        Swap in a new snapshot with some fields changed.
+
+        Returns:
+            The current snapshot after the update
+        """
+        with self._write_lock:
+            self._state = self._state.evolve(**changes)
+            return self._state
+
+    def get_voice_settings(self, fresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Fetch current voice settings from Discord and update internal state.
 
+        Concurrent callers share one request; a result less than
+        SingleFlight.DEFAULT_MAX_AGE old is reused.
+
+        Args:
+            fresh: Skip the freshness window (still joins an in-flight request)
+
         Returns:
             Raw Discord response or None on error
         """
+        return self._reads.do("GET_VOICE_SETTINGS", self._fetch_voice_settings, 0 if fresh else None)
+
+    @traced("voice")
+    def _fetch_voice_settings(self) -> Optional[Dict[str, Any]]:
+        """Issue GET_VOICE_SETTINGS and update internal state."""
         result = self.rpc.send_command("GET_VOICE_SETTINGS")
 
         if not result or not result.get("data"):
@@ -59,38 +146,43 @@ class VoiceController:
         data = result["data"]
 
         # Update mute/deafen state
-        self.is_muted = data.get("mute", False)
-        self.is_deafened = data.get("deaf", False)
+        changes: Dict[str, Any] = {
+            "is_muted": data.get("mute", False),
+            "is_deafened": data.get("deaf", False),
+        }
 
         # Update input volume (0-100 range)
         input_data = data.get("input", {})
         if isinstance(input_data, dict):
             raw_amplitude = float(input_data.get("volume", 100))
             perceptual = amplitude_to_perceptual(raw_amplitude, 100)
-            if self.logger:
-                self.logger.info(f"Discord Lite: GET_VOICE_SETTINGS input amplitude={raw_amplitude:.2f} perceptual={perceptual:.2f}")
-            self.input_volume = int(perceptual)
+            trace(self.logger, "Discord Lite: GET_VOICE_SETTINGS input amplitude=%.2f perceptual=%.2f",
+                  raw_amplitude, perceptual)
+            changes["input_volume"] = int(perceptual)
 
         # Update output volume (0-200 range with boost)
         output_data = data.get("output", {})
         if isinstance(output_data, dict):
             raw_amplitude = float(output_data.get("volume", 100))
             perceptual = amplitude_to_perceptual(raw_amplitude, 200)
-            if self.logger:
-                self.logger.info(f"Discord Lite: GET_VOICE_SETTINGS output amplitude={raw_amplitude:.2f} perceptual={perceptual:.2f}")
-            self.output_volume = int(perceptual)
+            trace(self.logger, "Discord Lite: GET_VOICE_SETTINGS output amplitude=%.2f perceptual=%.2f",
+                  raw_amplitude, perceptual)
+            changes["output_volume"] = int(perceptual)
 
         # Update mode
         mode_data = data.get("mode", {})
         if isinstance(mode_data, dict):
-            self.mode_type = mode_data.get("type", "VOICE_ACTIVITY")
+            changes["mode_type"] = mode_data.get("type", "VOICE_ACTIVITY")
 
         # Update advanced settings
-        self.automatic_gain_control = data.get("automatic_gain_control", True)
-        self.echo_cancellation = data.get("echo_cancellation", True)
-        self.noise_suppression = data.get("noise_suppression", True)
-        self.qos = data.get("qos", True)
-        self.silence_warning = data.get("silence_warning", False)
+        changes["automatic_gain_control"] = data.get("automatic_gain_control", True)
+        changes["echo_cancellation"] = data.get("echo_cancellation", True)
+        changes["noise_suppression"] = data.get("noise_suppression", True)
+        changes["qos"] = data.get("qos", True)
+        changes["silence_warning"] = data.get("silence_warning", False)
+
+        # One swap, so readers never see half of the new settings
+        self._update(**changes)
 
         return data
 
@@ -104,6 +196,7 @@ class VoiceController:
         Returns:
             Dictionary with 'success' and optional 'message'
         """
+        self._reads.invalidate("GET_VOICE_SETTINGS")
         result = self.rpc.send_command("SET_VOICE_SETTINGS", kwargs)
 
         if not result:
@@ -168,7 +261,7 @@ class VoiceController:
         Returns:
             Dictionary with 'success', 'is_muted', and optional 'message'
         """
-        self.get_voice_settings()  # Refresh current state
+        self.get_voice_settings(fresh=True)  # Refresh current state
         new_state = not self.is_muted
 
         result = self.set_voice_settings(mute=new_state)
@@ -188,71 +281,152 @@ class VoiceController:
         Returns:
             Dictionary with 'success', 'is_deafened', 'is_muted', and optional 'message'
         """
-        self.get_voice_settings()  # Refresh current state
+        self.get_voice_settings(fresh=True)  # Refresh current state
         new_state = not self.is_deafened
 
         result = self.set_voice_settings(deaf=new_state)
 
         if result.get("success"):
-            self.is_deafened = new_state
             if new_state:
-                self.is_muted = True
-            return {"success": True, "is_deafened": new_state, "is_muted": self.is_muted}
+                state = self._update(is_deafened=True, is_muted=True)
+            else:
+                state = self._update(is_deafened=False)
+            return {"success": True, "is_deafened": new_state, "is_muted": state.is_muted}
 
         return result
 
-    def get_selected_voice_channel(self) -> Optional[Dict[str, Any]]:
+    def get_selected_voice_channel(self, fresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get currently selected voice channel and members.
 
-        Updates internal state with channel info and members.
+        Updates internal state with channel info and members. Concurrent
+        callers share one request (see get_voice_settings).
+
+        Args:
+            fresh: Skip the freshness window (still joins an in-flight request)
 
         Returns:
             Channel data or None if not in voice
         """
+        return self._reads.do("GET_SELECTED_VOICE_CHANNEL", self._fetch_selected_voice_channel, 0 if fresh else None)
+
+    @traced("voice")
+    def _fetch_selected_voice_channel(self) -> Optional[Dict[str, Any]]:
+        """Issue GET_SELECTED_VOICE_CHANNEL and update internal state."""
+        started = time.monotonic()
         result = self.rpc.send_command("GET_SELECTED_VOICE_CHANNEL")
 
         if not result or not result.get("data"):
-            # Not in voice channel
-            self.voice_channel_id = None
-            self.voice_channel_name = None
-            self.voice_guild_id = None
-            self.voice_members = []
+            # Not in voice channel (empty response also means not in voice)
+            self._apply_channel(started, channel_id=None, channel_name=None, guild_id=None, members={})
             return None
 
         data = result["data"]
 
-        if not data:
-            # Empty response means not in voice
-            self.voice_channel_id = None
-            self.voice_channel_name = None
-            self.voice_guild_id = None
-            self.voice_members = []
-            return None
+        # Parse members, keeping existing dicts for members that did not change
+        previous = self._state.members
+        members: Dict[str, Dict[str, Any]] = {}
+
+        for vs in data.get("voice_states", []):
+            member = self._parse_member(vs)
+            user_id = member["user_id"]
+            if not user_id:
+                continue
 
-        # Update channel info
-        self.voice_channel_id = data.get("id")
-        self.voice_channel_name = data.get("name")
-        self.voice_guild_id = data.get("guild_id")
-
-        # Parse members
-        voice_states = data.get("voice_states", [])
-        self.voice_members = []
-
-        for vs in voice_states:
-            user = vs.get("user", {})
-            member = {
-                "user_id": user.get("id"),
-                "username": user.get("username", "User"),
-                "avatar": user.get("avatar"),
-                "mute": vs.get("mute", False) or vs.get("self_mute", False),
-                "deaf": vs.get("deaf", False) or vs.get("self_deaf", False),
-                "volume": vs.get("volume", 100),
-            }
-            self.voice_members.append(member)
+            existing = previous.get(user_id)
+            members[user_id] = existing if existing == member else member
+
+        # Channel info and members swap together
+        self._apply_channel(
+            started,
+            channel_id=data.get("id"),
+            channel_name=data.get("name"),
+            guild_id=data.get("guild_id"),
+            members=members
+        )
 
         return data
 
+    def _apply_channel(self, started: float, **changes) -> None:
+        """
+        Swap in fetched channel state unless pushed deltas are newer.
+
+        A fetch that began before the last VOICE_STATE_* delta for the same
+        channel would drop that member change, so its members are ignored
+        (channel fields still apply).
+
+        Args:
+            started: Monotonic time the fetch was sent
+            **changes: Channel fields and members from the reply
+        """
+        with self._write_lock:
+            state = self._state
+            if started < self._members_as_of and changes["channel_id"] == state.channel_id:
+                del changes["members"]
+            else:
+                self._members_as_of = max(self._members_as_of, started)
+            self._state = state.evolve(**changes)
+
+    def clear_channel(self) -> None:
+        """Mark as not in a voice channel (one atomic update)."""
+        self._apply_channel(time.monotonic(), channel_id=None, channel_name=None, guild_id=None, members={})
+
+    def apply_voice_state_event(self, event: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply a VOICE_STATE_CREATE/UPDATE/DELETE event to the member list.
+
+        No full channel refetch needed; the member dict is copied and
+        swapped so readers holding the previous snapshot are unaffected.
+
+        Args:
+            event: Event name
+            data: Event data (same shape as a voice_states entry)
+
+        Returns:
+            Parsed member dictionary, or None if the event was ignored
+        """
+        member = self._parse_member(data)
+        user_id = member["user_id"]
+        if not user_id:
+            return None
+
+        if event not in ("VOICE_STATE_CREATE", "VOICE_STATE_UPDATE", "VOICE_STATE_DELETE"):
+            return None
+
+        with self._write_lock:
+            state = self._state
+            existing = state.members.get(user_id)
+            self._members_as_of = time.monotonic()
+
+            if event == "VOICE_STATE_DELETE":
+                if existing is None:
+                    return member
+                members = dict(state.members)
+                del members[user_id]
+                self._state = state.evolve(members=members)
+                return existing
+
+            if existing == member:
+                return existing
+
+            members = dict(state.members)
+            members[user_id] = member
+            self._state = state.evolve(members=members)
+            return member
+
+    @staticmethod
+    def _parse_member(vs: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a Discord voice state into a member dictionary."""
+        user = vs.get("user", {})
+        return {
+            "user_id": user.get("id"),
+            "username": user.get("username", "User"),
+            "avatar": user.get("avatar"),
+            "mute": vs.get("mute", False) or vs.get("self_mute", False),
+            "deaf": vs.get("deaf", False) or vs.get("self_deaf", False),
+            "volume": vs.get("volume", 100),
+        }
+
     def select_voice_channel(self, channel_id: Optional[str], force: bool = False) -> bool:
         """
         Join or leave voice channel.
@@ -268,6 +442,7 @@ class VoiceController:
         if force:
             args["force"] = True
 
+        self._reads.invalidate("GET_SELECTED_VOICE_CHANNEL")
         result = self.rpc.send_command("SELECT_VOICE_CHANNEL", args)
         return result is not None
 
@@ -291,6 +466,7 @@ class VoiceController:
         if mute is not None:
             args["mute"] = mute
 
+        self._reads.invalidate("GET_SELECTED_VOICE_CHANNEL")
         result = self.rpc.send_command("SET_USER_VOICE_SETTINGS", args)
         return result is not None and result.get("cmd") == "SET_USER_VOICE_SETTINGS"
 
@@ -318,7 +494,9 @@ class VoiceController:
         """
         Get list of guilds (servers) user is in.
 
-        Adds icon_url field for convenience.
+        Adds icon_url field for convenience. If Discord returns the same
+        guilds as last time, the previously built list is returned and
+        guilds_version is left unchanged (do not modify the list).
 
         Returns:
             List of guild dictionaries with icon URLs
@@ -326,18 +504,25 @@ class VoiceController:
         result = self.rpc.send_command("GET_GUILDS")
 
         if result and result.get("data"):
-            guilds = result["data"].get("guilds", [])
+            raw = result["data"].get("guilds", [])
+            if raw == self._guilds_raw:
+                return self._guilds
 
-            # Add icon URLs
-            for guild in guilds:
+            guilds = []
+            for guild in raw:
                 guild_id = guild.get("id")
                 icon_hash = guild.get("icon")
 
+                # Add icon URL
                 if guild_id and icon_hash:
-                    guild["icon_url"] = f"https://cdn.discordapp.com/icons/{guild_id}/{icon_hash}.png?size=64"
+                    icon_url = f"https://cdn.discordapp.com/icons/{guild_id}/{icon_hash}.png?size=64"
                 else:
-                    guild["icon_url"] = None
+                    icon_url = None
+                guilds.append({**guild, "icon_url": icon_url})
 
+            self._guilds_raw = raw
+            self._guilds = guilds
+            self.guilds_version += 1
             return guilds
 
         return []
@@ -0,0 +1,218 @@
+"""Coalescing of voice member join/leave notifications"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+JOIN = "VOICE_JOIN"
+LEAVE = "VOICE_LEAVE"
+
+
+class MemberEventCoalescer:
+    """
+    Sits between MemberTracker and the frontend event queue.
+
+    - Flaps: a join and a leave for the same user inside the window
+      cancel out, so join→leave→join yields a single join
+    - Rate cap: at most max_per_user_per_minute events per user
+    - Bursts: burst_threshold or more events of one type that become
+      ready together are collapsed into one event with a count
+
+    An event is held until its user has been quiet for window seconds,
+    then released by flush(). Thread-safe: events may arrive from the
+    poller worker and from RPC event listeners.
+    """
+
+    DEFAULT_WINDOW = 3.0
+    DEFAULT_MAX_PER_USER_PER_MINUTE = 6
+    DEFAULT_BURST_THRESHOLD = 3
+    BURST_NAMES_LIMIT = 5  # Usernames kept on a collapsed event
+    RATE_PERIOD = 60.0  # Seconds covered by max_per_user_per_minute
+
+    def __init__(self, window: float = DEFAULT_WINDOW,
+                 max_per_user_per_minute: int = DEFAULT_MAX_PER_USER_PER_MINUTE,
+                 burst_threshold: int = DEFAULT_BURST_THRESHOLD,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize coalescer.
+
+        Args:
+            window: Seconds a user must stay quiet before their event is released
+                    (0 releases events on the next flush without merging)
+            max_per_user_per_minute: Events released per user per minute (0 = no cap)
+            burst_threshold: Events of one type released together that are
+                             collapsed into a single event (0 = never collapse)
+            clock: Monotonic time source
+        """
+        self.window = window
+        self.max_per_user_per_minute = max_per_user_per_minute
+        self.burst_threshold = burst_threshold
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        # user_id -> (event_type, member, last_seen)
+        self._pending: Dict[str, Tuple[str, Dict[str, Any], float]] = {}
+        # user_id -> release times within the last RATE_PERIOD
+        self._released: Dict[str, Deque[float]] = {}
+        self._last_prune = clock()
+
+        # Stats
+        self.merged = 0
+        self.rate_limited = 0
+        self.collapsed = 0
+
+    def configure(self, window: Optional[float] = None,
+                  max_per_user_per_minute: Optional[int] = None,
+                  burst_threshold: Optional[int] = None) -> None:
+        """
+        Update limits (None leaves a value unchanged).
+
+        Args:
+            window: Quiet period in seconds
+            max_per_user_per_minute: Per-user cap
+            burst_threshold: Burst collapse threshold
+        """
+        if window is not None:
+            self.window = max(0.0, float(window))
+        if max_per_user_per_minute is not None:
+            self.max_per_user_per_minute = max(0, int(max_per_user_per_minute))
+        if burst_threshold is not None:
+            self.burst_threshold = max(0, int(burst_threshold))
+
+    def add(self, event_type: str, member: Dict[str, Any]) -> None:
+        """
+        Record a join or leave.
+
+        Args:
+            event_type: VOICE_JOIN or VOICE_LEAVE
+            member: Member dictionary (user_id, username, avatar)
+        """
+        user_id = member.get("user_id")
+        if not user_id:
+            return
+
+        now = self.clock()
+        with self._lock:
+            pending = self._pending.get(user_id)
+
+            if pending and pending[0] != event_type:
+                # Opposite of an unreleased event: net effect is nothing
+                del self._pending[user_id]
+                self.merged += 1
+                return
+
+            if pending:
+                self.merged += 1
+
+            self._pending[user_id] = (event_type, member, now)
+
+    def flush(self, force: bool = False) -> List[Dict[str, Any]]:
+        """
+        Release events whose user has been quiet for the window.
+
+        Args:
+            force: Release all pending events regardless of the window
+
+        Returns:
+            Frontend event dictionaries, collapsed per burst
+        """
+        now = self.clock()
+        ready: Dict[str, List[Dict[str, Any]]] = {JOIN: [], LEAVE: []}
+
+        with self._lock:
+            if now - self._last_prune >= self.RATE_PERIOD:
+                self._prune_released(now)
+
+            if not self._pending:
+                return []
+
+            for user_id in [uid for uid, (_, _, seen) in self._pending.items()
+                            if force or now - seen >= self.window]:
+                event_type, member, _ = self._pending.pop(user_id)
+
+                if not self._allow(user_id, now):
+                    self.rate_limited += 1
+                    continue
+
+                ready.setdefault(event_type, []).append(member)
+
+        events = []
+        for event_type, members in ready.items():
+            if not members:
+                continue
+
+            if self.burst_threshold and len(members) >= self.burst_threshold:
+                self.collapsed += len(members) - 1
+                events.append(self._burst_event(event_type, members))
+            else:
+                events.extend(self._member_event(event_type, m) for m in members)
+
+        return events
+
+    def has_pending(self) -> bool:
+        """Check if any events are waiting for their window to pass."""
+        return bool(self._pending)
+
+    def reset(self) -> None:
+        """Drop pending events and rate history (on logout and channel change)."""
+        with self._lock:
+            self._pending.clear()
+            self._released.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get coalescing counters."""
+        return {
+            "pending": len(self._pending),
+            "rate_tracked_users": len(self._released),
+            "merged": self.merged,
+            "rate_limited": self.rate_limited,
+            "collapsed": self.collapsed,
+        }
+
+    def _allow(self, user_id: str, now: float) -> bool:
+        """Apply per-user per-minute cap (lock held)."""
+        if not self.max_per_user_per_minute:
+            return True
+
+        history = self._released.get(user_id)
+        if history is None:
+            history = self._released[user_id] = deque()
+
+        while history and now - history[0] >= self.RATE_PERIOD:
+            history.popleft()
+
+        if len(history) >= self.max_per_user_per_minute:
+            return False
+
+        history.append(now)
+        return True
+
+    def _prune_released(self, now: float) -> None:
+        """Forget users with no release inside the rate period (lock held)."""
+        self._last_prune = now
+        for user_id in [uid for uid, history in self._released.items()
+                        if not history or now - history[-1] >= self.RATE_PERIOD]:
+            del self._released[user_id]
+
+    @staticmethod
+    def _member_event(event_type: str, member: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a single-member event."""
+        return {
+            "type": event_type,
+            "user_id": member.get("user_id"),
+            "username": member.get("username"),
+            "avatar": member.get("avatar"),
+        }
+
+    def _burst_event(self, event_type: str, members: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build one event standing for several members."""
+        first = members[0]
+        return {
+            "type": event_type,
+            "user_id": first.get("user_id"),
+            "username": first.get("username"),
+            "avatar": first.get("avatar"),
+            "count": len(members),
+            "usernames": [m.get("username") for m in members[:self.BURST_NAMES_LIMIT]],
+        }
@@ -1,17 +1,21 @@
 """Voice channel member tracking and diff detection"""
 
-from typing import Dict, List, Set
-from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
 
 
-@dataclass
-class MemberInfo:
+class MemberRecord:
     """Voice channel member information"""
-    user_id: str
-    username: str
-    avatar: str | None
 
-    def to_dict(self) -> Dict[str, any]:
+    __slots__ = ("user_id", "username", "avatar")
+
+    def __init__(self, user_id: str, username: str, avatar: Optional[str]):
+        self.user_id = user_id
+        self.username = username
+        self.avatar = avatar
+
+    def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "user_id": self.user_id,
@@ -20,19 +24,38 @@ class MemberInfo:
         }
 
 
+# Backward-compatible name
+MemberInfo = MemberRecord
+
+
 class MemberTracker:
     """
     Tracks voice channel members and detects join/leave events.
 
-    Maintains a cache of previous state to compute diffs efficiently.
+    Accepts individual create/update/delete deltas (from VOICE_STATE_*
+    events) in O(1) each. Full member lists from polling are only used to
+    reconcile, and unchanged members keep their existing records.
+
+    Deltas arrive on the event loop or inside any RPC call while the
+    poller thread reconciles, so every method takes the lock. Full lists
+    carry the time they are current as of; one older than the last applied
+    delta is ignored instead of undoing it (a stale list would drop a
+    member just added and re-announce it on the next reconcile).
     """
 
     def __init__(self):
         """Initialize member tracker with empty state."""
-        self.previous_members: Dict[str, MemberInfo] = {}
+        self.members: Dict[str, MemberRecord] = {}
         self.initial_sync_done = False
+        self.last_delta_at = 0.0  # Monotonic time of the newest applied delta
+        self._lock = threading.Lock()
+
+    @property
+    def previous_members(self) -> Dict[str, MemberRecord]:
+        """Alias kept for callers of the old attribute name."""
+        return self.members
 
-    def initialize(self, members: List[Dict[str, any]]) -> None:
+    def initialize(self, members: List[Dict[str, Any]], as_of: Optional[float] = None) -> bool:
         """
         Initialize tracker with current members (silent sync).
 
@@ -40,26 +63,118 @@ class MemberTracker:
 
         Args:
             members: List of member dictionaries from Discord
+            as_of: Monotonic time the list is current as of (None = now)
+
+        Returns:
+            False if the list predates the last applied delta and was ignored
+        """
+        with self._lock:
+            if self._is_stale(as_of):
+                return False
+
+            self.members = {}
+
+            for member_data in members:
+                self._upsert(member_data)
+
+            self.initial_sync_done = True
+            return True
+
+    # ==================== DELTAS ====================
+
+    def apply_create(self, member_data: Dict[str, Any], at: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Apply a member joining the channel.
+
+        Args:
+            member_data: Member dictionary (user_id, username, avatar)
+            at: Monotonic time of the delta (None = now)
+
+        Returns:
+            Joined member dictionary, or None if already known
+        """
+        return self.apply_update(member_data, at)
+
+    def apply_update(self, member_data: Dict[str, Any], at: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
-        self.previous_members = {}
+        Apply a member state change (unknown members count as joins).
 
-        for member_data in members:
-            user_id = member_data.get("user_id")
-            if user_id:
-                self.previous_members[user_id] = MemberInfo(
-                    user_id=user_id,
-                    username=member_data.get("username", "User"),
-                    avatar=member_data.get("avatar")
-                )
+        Args:
+            member_data: Member dictionary (user_id, username, avatar)
+            at: Monotonic time of the delta (None = now)
 
-        self.initial_sync_done = True
+        Returns:
+            Joined member dictionary if the member was new, otherwise None
+        """
+        with self._lock:
+            self._mark_delta(at)
+            record, created = self._upsert(member_data)
+            return record.to_dict() if created and record else None
 
-    def update_and_get_diff(self, current_members: List[Dict[str, any]]) -> Dict[str, List[Dict[str, any]]]:
+    def apply_delete(self, user_id: str, at: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
-        Update member state and return diff since last update.
+        Apply a member leaving the channel.
+
+        Args:
+            user_id: Discord user ID
+            at: Monotonic time of the delta (None = now)
+
+        Returns:
+            Left member dictionary, or None if unknown
+        """
+        with self._lock:
+            self._mark_delta(at)
+            record = self.members.pop(user_id, None)
+            return record.to_dict() if record else None
+
+    def _mark_delta(self, at: Optional[float]) -> None:
+        """Record when the newest delta was applied (caller holds the lock)."""
+        self.last_delta_at = max(self.last_delta_at, time.monotonic() if at is None else at)
+
+    def _is_stale(self, as_of: Optional[float]) -> bool:
+        """True if a full list from as_of would undo a later delta (caller holds the lock)."""
+        return as_of is not None and as_of < self.last_delta_at
+
+    def _upsert(self, member_data: Dict[str, Any]):
+        """
+        Insert or update a record in place.
+
+        Returns:
+            Tuple of (record or None, created flag)
+        """
+        user_id = member_data.get("user_id")
+        if not user_id:
+            return None, False
+
+        username = member_data.get("username", "User")
+        avatar = member_data.get("avatar")
+
+        record = self.members.get(user_id)
+        if record is None:
+            record = MemberRecord(user_id, username, avatar)
+            self.members[user_id] = record
+            return record, True
+
+        if record.username != username:
+            record.username = username
+        if record.avatar != avatar:
+            record.avatar = avatar
+        return record, False
+
+    # ==================== RECONCILIATION ====================
+
+    def update_and_get_diff(self, current_members: List[Dict[str, Any]],
+                            as_of: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Reconcile with a full member list and return diff since last update.
+
+        Only used when deltas are not available (polling) or to repair
+        missed events; unchanged members are not reallocated. A list older
+        than the last applied delta leaves the tracker unchanged.
 
         Args:
             current_members: Current member list from Discord
+            as_of: Monotonic time the list is current as of (None = now)
 
         Returns:
             Dictionary with 'joined', 'left', and 'current_count' keys
@@ -73,35 +188,33 @@ class MemberTracker:
             >>> diff['current_count']
             5
         """
-        # Build current state
-        current_member_map: Dict[str, MemberInfo] = {}
-        for member_data in current_members:
-            user_id = member_data.get("user_id")
-            if user_id:
-                current_member_map[user_id] = MemberInfo(
-                    user_id=user_id,
-                    username=member_data.get("username", "User"),
-                    avatar=member_data.get("avatar")
-                )
+        with self._lock:
+            joined_info = []
+            left_info = []
 
-        # Calculate diffs
-        current_ids = set(current_member_map.keys())
-        previous_ids = set(self.previous_members.keys())
+            if self._is_stale(as_of):
+                return {"joined": joined_info, "left": left_info, "current_count": len(self.members)}
 
-        joined_ids = current_ids - previous_ids
-        left_ids = previous_ids - current_ids
+            seen: Set[str] = set()
 
-        joined_info = [current_member_map[uid].to_dict() for uid in joined_ids]
-        left_info = [self.previous_members[uid].to_dict() for uid in left_ids]
+            for member_data in current_members:
+                record, created = self._upsert(member_data)
+                if record is None:
+                    continue
 
-        # Update cache
-        self.previous_members = current_member_map
+                seen.add(record.user_id)
+                if created:
+                    joined_info.append(record.to_dict())
 
-        return {
-            "joined": joined_info,
-            "left": left_info,
-            "current_count": len(current_member_map)
-        }
+            if len(seen) != len(self.members):
+                for user_id in [uid for uid in self.members if uid not in seen]:
+                    left_info.append(self.members.pop(user_id).to_dict())
+
+            return {
+                "joined": joined_info,
+                "left": left_info,
+                "current_count": len(self.members)
+            }
 
     def should_emit_events(self) -> bool:
         """
@@ -112,12 +225,14 @@ class MemberTracker:
         Returns:
             True if events should be emitted
         """
-        return self.initial_sync_done
+        with self._lock:
+            return self.initial_sync_done
 
     def reset(self) -> None:
         """Reset tracker state (e.g., when leaving channel)."""
-        self.previous_members = {}
-        self.initial_sync_done = False
+        with self._lock:
+            self.members = {}
+            self.initial_sync_done = False
 
     def get_current_member_ids(self) -> Set[str]:
         """
@@ -126,7 +241,8 @@ class MemberTracker:
         Returns:
             Set of user ID strings
         """
-        return set(self.previous_members.keys())
+        with self._lock:
+            return set(self.members.keys())
 
     def get_member_count(self) -> int:
         """
@@ -135,4 +251,5 @@ class MemberTracker:
         Returns:
             Number of members in channel
         """
-        return len(self.previous_members)
+        with self._lock:
+            return len(self.members)
@@ -0,0 +1,113 @@
+"""Rate-limited live speaking indicator stream"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+
+class SpeakingStream:
+    """
+    Pushes the current speaker set to the frontend at a bounded rate.
+
+    SPEAKING_START/STOP can arrive many times per second in a busy
+    channel. Instead of forwarding each one, the stream samples the
+    tracker once per frame (at most max_rate frames per second) and emits
+    only when the speaker set actually changed, so bridge traffic is
+    bounded by max_rate no matter how busy the channel is.
+
+    Runs as an asyncio task on the plugin loop and only while the member
+    list is visible.
+    """
+
+    EVENT_NAME = "speaking_update"
+    DEFAULT_MAX_RATE = 10.0
+
+    def __init__(self, tracker_source: Callable[[], Optional[object]],
+                 emit: Callable[..., Awaitable[None]],
+                 max_rate: float = DEFAULT_MAX_RATE, logger=None):
+        """
+        Initialize speaking stream.
+
+        Args:
+            tracker_source: Function returning the current SpeakingTracker (or None)
+            emit: Async function sending an event to the frontend (decky.emit)
+            max_rate: Maximum frames per second
+            logger: Logger instance for logging operations
+        """
+        self.tracker_source = tracker_source
+        self.emit = emit
+        self.max_rate = max_rate
+        self.logger = logger
+
+        self._task: Optional[asyncio.Task] = None
+        self._last_version: Optional[int] = None
+        self._last_speakers: Optional[List[str]] = None
+
+        # Stats
+        self.frames_emitted = 0
+
+    def set_max_rate(self, max_rate: float) -> None:
+        """
+        Set maximum frames per second.
+
+        Args:
+            max_rate: Frames per second (clamped to 1-30)
+        """
+        self.max_rate = min(30.0, max(1.0, float(max_rate)))
+
+    def start(self) -> None:
+        """Start streaming (must be called from the event loop)."""
+        if self.is_active():
+            return
+
+        self._last_version = None
+        self._last_speakers = None
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="discord-lite:speaking-stream")
+
+        if self.logger:
+            self.logger.info(f"Discord Lite: Speaking stream started ({self.max_rate:g} Hz max)")
+
+    def stop(self) -> None:
+        """Stop streaming."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+            if self.logger:
+                self.logger.info(f"Discord Lite: Speaking stream stopped after {self.frames_emitted} frames")
+
+    def is_active(self) -> bool:
+        """Check if the stream task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        """Sample the tracker once per frame and emit changes."""
+        while True:
+            try:
+                await self._tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Discord Lite: Error in speaking stream: {e}")
+
+            await asyncio.sleep(1.0 / self.max_rate)
+
+    async def _tick(self) -> None:
+        """Emit one frame if the speaker set changed."""
+        tracker = self.tracker_source()
+        if tracker is None:
+            return
+
+        # Cheap version check first; only build the list when something changed
+        version = tracker.get_version()
+        if version == self._last_version:
+            return
+        self._last_version = version
+
+        speakers = sorted(tracker.get_speaking_users())
+        if speakers == self._last_speakers:
+            return
+
+        self._last_speakers = speakers
+        self.frames_emitted += 1
+        await self.emit(self.EVENT_NAME, speakers)
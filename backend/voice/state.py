@@ -0,0 +1,117 @@
+"""Immutable voice state snapshots"""
+
+from typing import Any, Dict, List
+
+# Snapshot fields and their defaults
+VOICE_STATE_DEFAULTS: Dict[str, Any] = {
+    # Voice state
+    "is_muted": False,
+    "is_deafened": False,
+    "input_volume": 100,
+    "output_volume": 100,
+
+    # Voice settings
+    "mode_type": "VOICE_ACTIVITY",  # or PUSH_TO_TALK
+    "automatic_gain_control": True,
+    "echo_cancellation": True,
+    "noise_suppression": True,
+    "qos": True,
+    "silence_warning": False,
+
+    # Channel state
+    "channel_id": None,
+    "channel_name": None,
+    "guild_id": None,
+    "members": {},  # user_id -> member dict (insertion-ordered)
+}
+
+
+class VoiceSnapshot:
+    """
+    One consistent, immutable view of the voice state.
+
+    Writers never modify a snapshot; they build a new one with evolve()
+    and swap the controller's reference, which is atomic in Python. A
+    reader that grabs a snapshot therefore always sees channel id, name
+    and members from the same update, without taking a lock.
+
+    Member dicts are shared between snapshots and must be treated as
+    read-only. Derived values (member list, serialized dict) are built
+    once per snapshot on first use.
+    """
+
+    __slots__ = tuple(VOICE_STATE_DEFAULTS) + ("version", "_member_list", "_dict")
+
+    def __init__(self, version: int = 0, **fields):
+        """
+        Initialize snapshot.
+
+        Args:
+            version: Monotonic state version
+            **fields: Field values (see VOICE_STATE_DEFAULTS)
+        """
+        set_field = object.__setattr__
+        set_field(self, "version", version)
+        for name, default in VOICE_STATE_DEFAULTS.items():
+            set_field(self, name, fields.pop(name, default))
+        set_field(self, "_member_list", None)
+        set_field(self, "_dict", None)
+
+        if fields:
+            raise TypeError(f"Unknown voice state fields: {', '.join(fields)}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("VoiceSnapshot is immutable; use evolve()")
+
+    def evolve(self, **changes) -> "VoiceSnapshot":
+        """
+        Build the next snapshot with some fields changed.
+
+        Args:
+            **changes: Field values to replace
+
+        Returns:
+            New snapshot with version + 1, or self if nothing changed
+        """
+        if all(getattr(self, name) == value for name, value in changes.items()):
+            return self
+
+        fields = {name: getattr(self, name) for name in VOICE_STATE_DEFAULTS}
+        fields.update(changes)
+        return VoiceSnapshot(self.version + 1, **fields)
+
+    @property
+    def in_voice(self) -> bool:
+        """True if connected to a voice channel."""
+        return self.channel_id is not None
+
+    def member_list(self) -> List[Dict[str, Any]]:
+        """Members as a list (built once per snapshot; do not modify)."""
+        if self._member_list is None:
+            object.__setattr__(self, "_member_list", list(self.members.values()))
+        return self._member_list
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize for the frontend (built once per snapshot; do not modify).
+
+        Returns:
+            Dictionary using the field names of get_voice_state
+        """
+        if self._dict is None:
+            object.__setattr__(self, "_dict", {
+                "is_muted": self.is_muted,
+                "is_deafened": self.is_deafened,
+                "input_volume": self.input_volume,
+                "output_volume": self.output_volume,
+                "channel_id": self.channel_id,
+                "channel_name": self.channel_name,
+                "guild_id": self.guild_id,
+                "in_voice": self.in_voice,
+                "members": self.member_list(),
+                "mode_type": self.mode_type,
+                "noise_suppression": self.noise_suppression,
+                "echo_cancellation": self.echo_cancellation,
+                "automatic_gain_control": self.automatic_gain_control,
+            })
+        return self._dict
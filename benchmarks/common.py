@@ -0,0 +1,106 @@
+"""Shared helpers for benchmark scripts: statistics, JSON reports, baseline comparison"""
+
+import json
+import platform
+import time
+from typing import Any, Dict, List
+
+# Differences below these are noise, whatever the ratio
+MIN_DELTA_MS = 0.05
+MIN_DELTA_KB = 4.0
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summarize(times_ms: List[float]) -> Dict[str, float]:
+    """Mean, p50, p95 and max of a list of millisecond timings."""
+    return {
+        "iterations": len(times_ms),
+        "mean_ms": round(sum(times_ms) / len(times_ms), 4),
+        "p50_ms": round(percentile(times_ms, 0.50), 4),
+        "p95_ms": round(percentile(times_ms, 0.95), 4),
+        "max_ms": round(max(times_ms), 4),
+    }
+
+
+def new_report(**meta: Any) -> Dict[str, Any]:
+    """Empty report with environment metadata."""
+    return {
+        "meta": {
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            **meta,
+        },
+        "results": {},
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare a report against a baseline report.
+
+    A metric regresses when it grew by more than threshold (relative) and
+    by more than the noise floor (absolute). Entries missing from either
+    side are skipped.
+
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+
+    for scenario, entries in report["results"].items():
+        for name, stats in entries.items():
+            base = baseline.get("results", {}).get(scenario, {}).get(name)
+            if not base:
+                continue
+
+            for key, min_delta, unit in (("p50_ms", MIN_DELTA_MS, "ms"), ("alloc_peak_kb", MIN_DELTA_KB, "KiB")):
+                old, new = base.get(key), stats.get(key)
+                if old is None or new is None:
+                    continue
+                if new - old > min_delta and new > old * (1 + threshold):
+                    regressions.append(f"{scenario}/{name} {key}: {old:.3f} -> {new:.3f} {unit}")
+
+    return regressions
+
+
+def finish(report: Dict[str, Any], output: str = None, baseline_path: str = None,
+           threshold: float = 0.25) -> int:
+    """
+    Write the report and compare it against a baseline.
+
+    Args:
+        report: Report from new_report() with results filled in
+        output: Path to write the report to (optional)
+        baseline_path: Previous report to compare against (optional)
+        threshold: Allowed relative growth (0.25 = 25%)
+
+    Returns:
+        Process exit status (1 if anything regressed)
+    """
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {output}")
+
+    if not baseline_path:
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    regressions = compare(report, baseline, threshold)
+    if regressions:
+        print(f"Regressions vs {baseline_path} (threshold {threshold:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print(f"No regressions vs {baseline_path}")
+    return 0
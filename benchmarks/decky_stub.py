@@ -0,0 +1,62 @@
+"""Minimal stand-in for the decky module so main.Plugin runs outside Decky Loader"""
+
+import logging
+import os
+import sys
+import tempfile
+import types
+from typing import Any, List, Optional, Tuple
+
+
+def install(root: Optional[str] = None, level: int = logging.WARNING) -> types.ModuleType:
+    """
+    Register a fake `decky` module in sys.modules (call before importing main).
+
+    Settings, runtime and log directories are created under root. Emitted
+    events are collected in `decky.emitted` instead of reaching a frontend.
+
+    Args:
+        root: Directory for the plugin's files (a temporary one if None)
+        level: Logger level
+
+    Returns:
+        The stub module
+    """
+    existing = sys.modules.get("decky")
+    if existing is not None and getattr(existing, "IS_STUB", False):
+        return existing
+
+    root = root or tempfile.mkdtemp(prefix="discord-lite-bench-")
+
+    decky = types.ModuleType("decky")
+    decky.IS_STUB = True
+    decky.HOME = root
+    decky.USER = "deck"
+    decky.DECKY_VERSION = "stub"
+    decky.DECKY_USER = "deck"
+    decky.DECKY_USER_HOME = root
+    decky.DECKY_HOME = root
+    decky.DECKY_PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    decky.DECKY_PLUGIN_NAME = "Discord Lite"
+    decky.DECKY_PLUGIN_VERSION = "stub"
+    decky.DECKY_PLUGIN_AUTHOR = "stub"
+
+    for name, sub in (("DECKY_PLUGIN_SETTINGS_DIR", "settings"),
+                      ("DECKY_PLUGIN_RUNTIME_DIR", "runtime"),
+                      ("DECKY_PLUGIN_LOG_DIR", "logs")):
+        path = os.path.join(root, sub)
+        os.makedirs(path, exist_ok=True)
+        setattr(decky, name, path)
+
+    decky.logger = logging.getLogger("discord-lite-bench")
+    decky.logger.setLevel(level)
+
+    decky.emitted: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    async def emit(event: str, *args: Any) -> None:
+        decky.emitted.append((event, args))
+
+    decky.emit = emit
+
+    sys.modules["decky"] = decky
+    return decky
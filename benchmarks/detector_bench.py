@@ -0,0 +1,136 @@
+"""
+Steam game detector benchmarks on synthetic /proc and library trees.
+
+Builds fixtures with tools/steam_fixtures.py for each combination of
+process count and manifest count, points SteamGameDetector at them and
+reports:
+
+    index_build   first library index build (cold start)
+    scan_idle     one detection tick with no game running (full /proc scan)
+    scan_game     one detection tick with a game running (name cached)
+    name_cold     name resolution with an empty name cache (manifest read)
+    name_warm     name resolution from the LRU cache
+    shortcut      non-Steam shortcut lookup
+
+Fixture files live on a regular filesystem, so reads cost less than real
+procfs (where the kernel builds cmdline on every read); compare runs
+with each other rather than with on-device numbers.
+
+Usage (from the repository root):
+    python -m benchmarks.detector_bench
+    python -m benchmarks.detector_bench --processes 300 --processes 5000 --manifests 5000
+    python -m benchmarks.detector_bench --output base.json
+    python -m benchmarks.detector_bench --baseline base.json
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from backend.steam.game_detector import SteamGameDetector  # noqa: E402
+from benchmarks.common import finish, new_report, summarize  # noqa: E402
+from tools.steam_fixtures import make_fixture, make_proc_tree  # noqa: E402
+
+
+def _time(func: Callable[[], Any], iterations: int) -> List[float]:
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def run_scenario(processes: int, manifests: int, args) -> Dict[str, Dict[str, Any]]:
+    """Benchmark one fixture size."""
+    root = tempfile.mkdtemp(prefix="steam-fixture-")
+    fixture = make_fixture(root, processes, manifests, libraries=args.libraries,
+                           shortcuts=args.shortcuts, game_position=args.game_position)
+    idle_proc = make_proc_tree(os.path.join(root, "proc-idle"), processes, games=[])
+    game_appid = fixture["appids"][0]
+
+    def detector(proc_root: str = fixture["proc_root"]) -> SteamGameDetector:
+        return SteamGameDetector(proc_root=proc_root, home=fixture["home"], media_root=fixture["media_root"])
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    # Cold start: each iteration builds a fresh index
+    builds = []
+    for _ in range(max(1, args.iterations // 10)):
+        fresh = detector()
+        start = time.perf_counter()
+        fresh.sync_library_index()
+        builds.append((time.perf_counter() - start) * 1000)
+        fresh.close()
+    results["index_build"] = summarize(builds)
+
+    idle = detector(idle_proc)
+    idle.sync_library_index()
+    assert idle.detect_running_game() is None
+    results["scan_idle"] = summarize(_time(idle.detect_running_game, args.iterations))
+    idle.close()
+
+    playing = detector()
+    game = playing.detect_running_game()
+    assert game and game["appid"] == game_appid, game
+    results["scan_game"] = summarize(_time(playing.detect_running_game, args.iterations))
+
+    def name_cold():
+        playing.game_name_cache.clear()
+        playing._get_game_name(game_appid)
+
+    results["name_cold"] = summarize(_time(name_cold, args.iterations))
+    results["name_warm"] = summarize(_time(lambda: playing._get_game_name(game_appid), args.iterations))
+
+    if fixture["shortcut_appids"]:
+        shortcut_appid = fixture["shortcut_appids"][-1]
+        assert playing.shortcut_index.lookup(shortcut_appid)
+        results["shortcut"] = summarize(
+            _time(lambda: playing.shortcut_index.lookup(shortcut_appid), args.iterations)
+        )
+
+    playing.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SteamGameDetector on synthetic fixtures")
+    parser.add_argument("--processes", type=int, action="append", help="PID count (repeatable; default 300, 3000)")
+    parser.add_argument("--manifests", type=int, action="append", help="Manifest count (repeatable; default 100, 5000)")
+    parser.add_argument("--libraries", type=int, default=2, help="Steam libraries (internal + SD cards)")
+    parser.add_argument("--shortcuts", type=int, default=50)
+    parser.add_argument("--game-position", choices=("start", "end", "random"), default="end")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Compare against a previous --output file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    process_counts = args.processes or [300, 3000]
+    manifest_counts = args.manifests or [100, 5000]
+
+    report = new_report(iterations=args.iterations, libraries=args.libraries,
+                        shortcuts=args.shortcuts, game_position=args.game_position)
+
+    print("Steam game detector benchmarks")
+    for processes in process_counts:
+        for manifests in manifest_counts:
+            name = f"p{processes}-m{manifests}"
+            results = report["results"][name] = run_scenario(processes, manifests, args)
+
+            print(f"  {processes} processes, {manifests} manifests")
+            for metric, stats in results.items():
+                print(f"    {metric:<12} p50 {stats['p50_ms']:>9.3f} ms  p95 {stats['p95_ms']:>9.3f} ms")
+
+    sys.exit(finish(report, args.output, args.baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
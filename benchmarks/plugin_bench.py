@@ -0,0 +1,236 @@
+"""
+End-to-end benchmarks for Plugin callables.
+
+Drives main.Plugin (with a stubbed decky module) against
+tools/fake_ipc_server.py running in a subprocess, and measures latency
+and Python allocations per call for a small and a huge account.
+
+Back-to-back calls would mostly be answered by VoiceController's
+SingleFlight freshness window and the plugin's ResponseCache, so each
+callable is measured twice: uncached (both dropped before every call,
+results under the callable's name) and cached (results under
+"<name>:cached").
+
+Usage (from the repository root):
+    python -m benchmarks.plugin_bench
+    python -m benchmarks.plugin_bench --output benchmarks/baseline.json
+    python -m benchmarks.plugin_bench --baseline benchmarks/baseline.json --threshold 0.25
+
+With --baseline, exits with status 1 if any callable got slower (p50) or
+allocates more (peak) than the threshold allows.
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks import decky_stub  # noqa: E402
+from benchmarks.common import finish, new_report, summarize  # noqa: E402
+
+# name -> fake server account size
+SCENARIOS: Dict[str, Dict[str, int]] = {
+    "small": {"guilds": 1, "members": 2},
+    "huge": {"guilds": 200, "members": 99},
+}
+
+CALLABLES = [
+    "auto_auth",
+    "sync_full_state",
+    "get_voice_state",
+    "toggle_mute",
+    "get_guilds",
+    "get_voice_channels",
+]
+
+class FakeServerProcess:
+    """tools/fake_ipc_server.py in a subprocess (keeps its work out of our measurements)"""
+
+    def __init__(self, guilds: int, members: int, latency: float = 0.0):
+        self.directory = tempfile.mkdtemp(prefix="fake-discord-")
+        self.args = [
+            sys.executable, os.path.join(ROOT, "tools", "fake_ipc_server.py"),
+            "--dir", self.directory,
+            "--guilds", str(guilds),
+            "--members", str(members),
+            "--latency", str(latency),
+        ]
+        self.process: Optional[subprocess.Popen] = None
+        self.path: Optional[str] = None
+
+    def __enter__(self) -> "FakeServerProcess":
+        self.process = subprocess.Popen(self.args, stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline()
+        if not line.startswith("Listening on "):
+            self.process.kill()
+            raise RuntimeError(f"Fake server did not start: {line!r}")
+        self.path = line[len("Listening on "):].strip()
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        return False
+
+
+async def measure(call: Callable[[], Awaitable[Dict[str, Any]]], iterations: int,
+                  warmup: int, alloc_iterations: int,
+                  before: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+    """
+    Time a callable, then measure its allocations in a separate pass.
+
+    Allocation tracing slows everything down, so latency is measured
+    with tracemalloc off.
+
+    Args:
+        call: Callable under test
+        iterations: Timed calls
+        warmup: Untimed calls first
+        alloc_iterations: Calls in the allocation pass
+        before: Run before every call, outside the measurement (e.g., drop caches)
+
+    Returns:
+        Dictionary with latency percentiles (ms), allocation peak and
+        retained size per call (KiB) and the number of failed calls
+    """
+    before = before or (lambda: None)
+
+    failures = 0
+    for _ in range(warmup):
+        before()
+        await call()
+
+    times = []
+    for _ in range(iterations):
+        before()
+        start = time.perf_counter()
+        result = await call()
+        times.append((time.perf_counter() - start) * 1000)
+        if not isinstance(result, dict) or not result.get("success"):
+            failures += 1
+
+    tracemalloc.start()
+    peaks = []
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(alloc_iterations):
+        before()
+        start_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await call()
+        peaks.append(tracemalloc.get_traced_memory()[1] - start_size)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    return {
+        **summarize(times),
+        "failures": failures,
+        "alloc_peak_kb": round(sum(peaks) / len(peaks) / 1024, 2),
+        "alloc_retained_kb": round(retained / alloc_iterations / 1024, 2),
+    }
+
+
+async def run_scenario(name: str, guilds: int, members: int, args) -> Dict[str, Dict[str, Any]]:
+    """Benchmark every callable against one fake account."""
+    import main
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with FakeServerProcess(guilds, members, args.latency) as server:
+        plugin = main.Plugin()
+        plugin.ipc_path = server.path
+        plugin.access_token = "bench-token"
+
+        def drop_caches():
+            # Force every read to Discord instead of a recent shared result
+            if plugin.voice_controller:
+                plugin.voice_controller._reads.invalidate()
+            plugin.response_cache.clear()
+
+        async def auto_auth():
+            return await plugin.auto_auth()
+
+        if not args.only or "auto_auth" in args.only:
+            # Full reconnect + authenticate each time, so fewer iterations
+            results["auto_auth"] = await measure(auto_auth, max(1, args.iterations // 5), 1,
+                                                 max(1, args.alloc_iterations // 5), drop_caches)
+        elif not (await auto_auth()).get("success"):
+            raise RuntimeError("Authentication against the fake server failed")
+
+        # Background jobs would compete with the calls being measured
+        plugin.voice_poller.stop()
+
+        guilds_result = await plugin.get_guilds()
+        guild_id = guilds_result["guilds"][0]["id"] if guilds_result.get("guilds") else None
+
+        calls = {
+            "sync_full_state": plugin.sync_full_state,
+            "get_voice_state": plugin.get_voice_state,
+            "toggle_mute": plugin.toggle_mute,
+            "get_guilds": plugin.get_guilds,
+            "get_voice_channels": lambda: plugin.get_voice_channels(guild_id),
+        }
+
+        for callable_name in CALLABLES:
+            if callable_name in calls and (not args.only or callable_name in args.only):
+                results[callable_name] = await measure(
+                    calls[callable_name], args.iterations, args.warmup, args.alloc_iterations, drop_caches
+                )
+                results[f"{callable_name}:cached"] = await measure(
+                    calls[callable_name], args.iterations, args.warmup, args.alloc_iterations
+                )
+
+        plugin.voice_poller.stop()
+        if plugin.rpc_client:
+            plugin.rpc_client.disconnect()
+
+    print(f"  {name}: {guilds} guilds, {members} members")
+    for callable_name, stats in results.items():
+        print(f"    {callable_name:<27} p50 {stats['p50_ms']:>9.3f} ms  p95 {stats['p95_ms']:>9.3f} ms  "
+              f"peak {stats['alloc_peak_kb']:>9.1f} KiB  failures {stats['failures']}")
+
+    return results
+
+
+async def run(args) -> int:
+    decky_stub.install()
+
+    scenarios = {name: size for name, size in SCENARIOS.items() if not args.scenario or name in args.scenario}
+    report = new_report(iterations=args.iterations, latency=args.latency)
+
+    print("Plugin callable benchmarks")
+    for name, size in scenarios.items():
+        report["results"][name] = await run_scenario(name, size["guilds"], size["members"], args)
+
+    return finish(report, args.output, args.baseline, args.threshold)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Plugin callables against a fake Discord")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--alloc-iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake Discord reply delay in seconds")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--only", action="append", choices=CALLABLES, help="Benchmark only these callables")
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Compare against a previous --output file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Plugin load benchmark: import time, construction and _main().
+
+Each iteration starts a fresh interpreter with `-X importtime` (imports
+are only cold once per process), preloads the standard modules Decky
+Loader's plugin host has already imported, installs the decky stub and
+times:
+
+    import_main     wall time of `import main`
+    importtime      main's cumulative time as reported by -X importtime
+    construct       Plugin()
+    main_init       Plugin._main() (settings and token load)
+    first_oauth     first use of the deferred OAuth manager (SSL, urllib)
+    first_detector  first use of the deferred game detector
+
+The modules with the largest self time under `import main` are listed
+for the median run, so new heavy imports show up by name.
+
+--cold points the child at an empty bytecode cache, so every module is
+compiled from source the way the first load after install is (build.sh
+ships the plugin without __pycache__).
+
+Usage (from the repository root):
+    python -m benchmarks.startup_bench
+    python -m benchmarks.startup_bench --iterations 30 --top 25
+    python -m benchmarks.startup_bench --cold
+    python -m benchmarks.startup_bench --output base.json
+    python -m benchmarks.startup_bench --baseline base.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.common import finish, new_report, summarize  # noqa: E402
+
+# Already imported by the plugin host before it loads main.py
+DEFAULT_PRELOAD = "asyncio,logging,json,subprocess"
+
+# Runs in the child interpreter; prints one JSON line of millisecond timings
+CHILD = r"""
+import sys, time
+sys.path.insert(0, {root!r})
+for name in {preload!r}:
+    __import__(name)
+from benchmarks import decky_stub
+decky_stub.install()
+
+import asyncio, json
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+plugin = main.Plugin()
+constructed = time.perf_counter()
+asyncio.run(plugin._main())
+initialized = time.perf_counter()
+plugin.oauth_manager.ssl_context
+oauth = time.perf_counter()
+plugin.game_detector
+detector = time.perf_counter()
+asyncio.run(plugin._unload())
+
+print(json.dumps({{
+    "import_main": (imported - start) * 1000,
+    "construct": (constructed - imported) * 1000,
+    "main_init": (initialized - constructed) * 1000,
+    "first_oauth": (oauth - initialized) * 1000,
+    "first_detector": (detector - oauth) * 1000,
+}}))
+"""
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def parse_importtime(stderr: str, target: str = "main") -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Extract one top-level import from -X importtime output.
+
+    Children are printed before their parent, so the modules imported by
+    target are the lines between the previous top-level entry and target.
+
+    Args:
+        stderr: Child process stderr
+        target: Top-level module name
+
+    Returns:
+        Tuple of (cumulative ms of target, [(module, self ms)] of its subtree)
+    """
+    subtree: List[Tuple[str, float]] = []
+
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if not match:
+            continue
+
+        self_us, cumulative_us, indent, name = match.groups()
+        if indent:
+            subtree.append((name, int(self_us) / 1000))
+            continue
+
+        if name == target:
+            subtree.append((name, int(self_us) / 1000))
+            return int(cumulative_us) / 1000, subtree
+        subtree = []
+
+    raise ValueError(f"{target} not found in -X importtime output")
+
+
+def run_once(preload: List[str], cold: bool = False) -> Tuple[Dict[str, float], List[Tuple[str, float]]]:
+    """Load the plugin in a fresh interpreter (with no usable bytecode cache if cold)."""
+    code = CHILD.format(root=ROOT, preload=preload)
+    command = [sys.executable, "-X", "importtime"]
+    env = dict(os.environ)
+
+    if cold:
+        command += ["-X", f"pycache_prefix={tempfile.mkdtemp(prefix='startup-pycache-')}"]
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    else:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    proc = subprocess.run(command + ["-c", code], capture_output=True, text=True,
+                          cwd=ROOT, env=env, timeout=60)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Child failed:\n{proc.stderr[-2000:]}")
+
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    timings["importtime"], modules = parse_importtime(proc.stderr)
+    return timings, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark plugin import and construction time")
+    parser.add_argument("--iterations", type=int, default=15)
+    parser.add_argument("--preload", default=DEFAULT_PRELOAD,
+                        help=f"Comma-separated modules imported before main (default {DEFAULT_PRELOAD})")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--cold", action="store_true", help="Compile every module from source (first load)")
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Compare against a previous --output file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    preload = [name for name in args.preload.split(",") if name]
+    # Warm run writes the bytecode cache the measured runs then use
+    if not args.cold:
+        run_once(preload)
+    runs = [run_once(preload, args.cold) for _ in range(args.iterations)]
+
+    metrics = ("import_main", "importtime", "construct", "main_init", "first_oauth", "first_detector")
+    results: Dict[str, Any] = {
+        metric: summarize([timings[metric] for timings, _ in runs]) for metric in metrics
+    }
+
+    # Module list of the run with the median importtime
+    ordered = sorted(runs, key=lambda run: run[0]["importtime"])
+    _, modules = ordered[len(ordered) // 2]
+    slowest = sorted(modules, key=lambda item: item[1], reverse=True)[:args.top]
+
+    report = new_report(iterations=args.iterations, preload=preload, cold=args.cold)
+    report["results"]["startup"] = results
+    report["slowest_imports"] = [{"module": name, "self_ms": round(ms, 3)} for name, ms in slowest]
+
+    print(f"Plugin startup benchmarks ({'cold' if args.cold else 'warm'} bytecode cache)")
+    for metric, stats in results.items():
+        print(f"  {metric:<15} p50 {stats['p50_ms']:>8.2f} ms  p95 {stats['p95_ms']:>8.2f} ms")
+    print(f"  Slowest imports under main ({len(modules)} modules):")
+    for name, ms in slowest:
+        print(f"    {ms:>7.2f} ms  {name}")
+
+    sys.exit(finish(report, args.output, args.baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,14 @@ Refactored architecture with modular components.
 This file maintains the Plugin class API for Decky Loader compatibility.
 """
 
+import asyncio
+import functools
 import os
 import sys
+import json
 import subprocess
-from typing import Optional, Dict, List, Any
+import time
+from typing import TYPE_CHECKING, Optional, Dict, List, Any
 import decky
 
 # Add plugin directory to Python path for backend imports
@@ -19,17 +23,31 @@ if plugin_dir not in sys.path:
 
 # Import modular backend components
 from backend.discord_rpc.client import DiscordRPCClient
-from backend.auth.oauth import OAuth2Manager
+from backend.discord_rpc.metrics import RPCMetrics
+from backend.discord_rpc.recorder import FrameRecorder
 from backend.auth.token_manager import TokenManager
 from backend.voice.controller import VoiceController
 from backend.voice.members import MemberTracker
+from backend.voice.speaking_stream import SpeakingStream
 from backend.voice.volume import perceptual_to_amplitude, amplitude_to_perceptual
-from backend.steam.game_detector import SteamGameDetector
-from backend.steam.activity_sync import ActivitySyncManager
 from backend.polling.voice_poller import VoicePoller
 from backend.utils.settings import SettingsManager
-
-
+from backend.utils.response_cache import ResponseCache
+from backend.utils.log import PluginLogger
+from backend.utils.tracing import tracer, trace_public_methods
+from backend.utils.lazy import LazyRegistry
+from backend.utils.socket_finder import find_discord_ipc_socket, get_socket_finder, close_socket_finder
+
+# Imported on first use (see _register_components); OAuth pulls in urllib/http.client,
+# the game detector inotify, the profilers tracemalloc
+if TYPE_CHECKING:
+    from backend.auth.oauth import OAuth2Manager
+    from backend.steam.game_detector import SteamGameDetector
+    from backend.steam.activity_sync import ActivitySyncManager
+    from backend.utils.profiler import StackSampler, MemoryProfiler
+
+
+@trace_public_methods("plugin")
 class Plugin:
     """
     Discord Lite - Complete Discord control from Steam Deck.
@@ -41,32 +59,107 @@ class Plugin:
     CLIENT_ID = "1461502476401381446"
     SCOPES = ["rpc", "rpc.voice.read", "rpc.voice.write"]
 
+    # Out of voice without a live VOICE_CHANNEL_SELECT subscription, every
+    # Nth member_check tick still polls the selected channel to notice joins
+    CHANNEL_POLL_EVERY = 3
+
     def __init__(self):
         """Initialize plugin with modular components."""
+        # Rate-limited logger with an in-memory trace buffer for hot paths
+        self.logger = PluginLogger(decky.logger)
+
         # Core components
         self.rpc_client: Optional[DiscordRPCClient] = None
+        self.ipc_path: Optional[str] = None  # Socket override (None = auto-detect)
+        self.ipc_recorder: Optional[FrameRecorder] = None  # Opt-in traffic recording
+        self.rpc_metrics = RPCMetrics()  # Shared by every client, survives reconnects
         self.voice_controller: Optional[VoiceController] = None
         self.member_tracker = MemberTracker()
         self.settings_manager = SettingsManager(decky.DECKY_PLUGIN_SETTINGS_DIR, decky.logger)
         self.token_manager = TokenManager(decky.DECKY_PLUGIN_SETTINGS_DIR, decky.logger)
-        self.oauth_manager = OAuth2Manager(self.CLIENT_ID, decky.logger)
+
+        # Heavy components (OAuth, game detector, profilers) built on first use
+        self.components = LazyRegistry(decky.logger)
+        self._register_components()
 
         # Game sync
-        self.game_detector = SteamGameDetector(decky.logger)
-        self.activity_sync: Optional[ActivitySyncManager] = None
+        self.activity_sync: Optional["ActivitySyncManager"] = None
         self.game_sync_enabled = True
 
         # Polling system
-        self.voice_poller = VoicePoller(decky.logger)
+        self.voice_poller = VoicePoller(self.logger)
 
         # Authentication state
         self.access_token: Optional[str] = None
         self.auth_in_progress = False
 
+        # Background connect at plugin start (auto_connect setting)
+        self._warmup_task: Optional[asyncio.Task] = None
+        self.warmup_stats: Dict[str, Any] = {"status": "disabled", "ms": None}
+
         # Guild/server selection
         self.guilds_cache: List[Dict] = []
         self.selected_guild_id: Optional[str] = None
 
+        # Built responses reused until the state behind them changes
+        self.response_cache = ResponseCache()
+
+        # Channel whose VOICE_STATE_* events are subscribed (None = polling only)
+        self._voice_events_channel_id: Optional[str] = None
+        self._voice_channel_changed = False
+        self._idle_member_checks = 0  # member_check ticks skipped while out of voice
+
+        # Live speaking indicators (only while the member list is visible)
+        self.speaking_stream = SpeakingStream(
+            lambda: self.rpc_client.speaking_tracker if self.rpc_client else None,
+            decky.emit,
+            logger=self.logger
+        )
+        self._speaking_events_channel_id: Optional[str] = None
+
+    def _register_components(self) -> None:
+        """Register factories for components built on first use."""
+        def oauth_manager():
+            from backend.auth.oauth import OAuth2Manager
+            return OAuth2Manager(self.CLIENT_ID, decky.logger)
+
+        def game_detector():
+            from backend.steam.game_detector import SteamGameDetector
+            return SteamGameDetector(decky.logger)
+
+        def stack_sampler():
+            from backend.utils.profiler import StackSampler
+            return StackSampler()
+
+        def memory_profiler():
+            from backend.utils.profiler import MemoryProfiler
+            return MemoryProfiler()
+
+        self.components.register("oauth_manager", oauth_manager)
+        self.components.register("game_detector", game_detector, close=lambda detector: detector.close())
+        self.components.register("stack_sampler", stack_sampler)
+        self.components.register("memory_profiler", memory_profiler, close=lambda profiler: profiler.stop())
+
+    @property
+    def oauth_manager(self) -> "OAuth2Manager":
+        """OAuth2 PKCE flow (only needed when no saved token works)."""
+        return self.components.get("oauth_manager")
+
+    @property
+    def game_detector(self) -> "SteamGameDetector":
+        """Steam game detector shared with activity sync."""
+        return self.components.get("game_detector")
+
+    @property
+    def stack_sampler(self) -> "StackSampler":
+        """On-demand CPU sampler (idle until start_profile)."""
+        return self.components.get("stack_sampler")
+
+    @property
+    def memory_profiler(self) -> "MemoryProfiler":
+        """On-demand tracemalloc profiler (idle until memory_snapshot)."""
+        return self.components.get("memory_profiler")
+
     # ==================== LIFECYCLE ====================
 
     async def _main(self):
@@ -80,15 +173,115 @@ class Plugin:
         settings = self.settings_manager.load_settings()
         self.selected_guild_id = settings.get("selected_guild_id")
         self.game_sync_enabled = settings.get("game_sync_enabled", True)
+        self.voice_poller.set_background_priority(settings.get("background_priority", "low"))
+        self.voice_poller.member_events.configure(window=settings.get("event_coalesce_window"))
+        self.rpc_metrics.set_enabled(settings.get("diagnostics_enabled", True))
+        self.logger.verbose = bool(settings.get("debug_logging", False))
+
+        # Connect in the background so the first QAM open finds a live session
+        if settings.get("auto_connect", False) and self.access_token:
+            self._warmup_task = asyncio.create_task(self._warm_up())
 
         decky.logger.info("Discord Lite: Plugin initialized")
 
+    async def _warm_up(self) -> bool:
+        """
+        Connect, authenticate with the saved token and prefetch state.
+
+        Runs once at plugin start when auto_connect is on. Socket discovery,
+        the handshake and authentication block, so they run in the default
+        executor instead of stalling Decky's event loop, as do session setup
+        (subscriptions, current channel, game detector) and the concurrent
+        voice settings and guilds prefetch; only starting the poller jobs
+        runs on the loop. Never starts the OAuth
+        dialog: without a working saved token it gives up and the
+        frontend's normal connect flow takes over.
+
+        Returns:
+            True if a session was established
+        """
+        loop = asyncio.get_running_loop()
+        token = self.access_token
+        start = time.monotonic()
+        self.warmup_stats = {"status": "running", "ms": None}
+
+        def finish(status: str) -> bool:
+            self.warmup_stats = {"status": status, "ms": round((time.monotonic() - start) * 1000, 1)}
+            return status == "connected"
+
+        try:
+            client = await loop.run_in_executor(None, self._connect_with_token, token)
+            if client is None:
+                return finish("skipped")
+
+            # Logged out (or a manual connect replaced the token) meanwhile
+            if self.access_token != token or (self.rpc_client and self.rpc_client.authenticated):
+                client.disconnect()
+                return finish("skipped")
+
+            self.rpc_client = client
+            await loop.run_in_executor(None, self._prepare_session)
+            self._start_voice_polling()
+
+            await asyncio.gather(
+                loop.run_in_executor(None, self._prefetch_voice_settings),
+                loop.run_in_executor(None, self._prefetch_guilds),
+            )
+
+            finish("connected")
+            decky.logger.info(
+                f"Discord Lite: Warm-up connected as {client.user.get('username', 'User')} "
+                f"in {self.warmup_stats['ms']} ms"
+            )
+            return True
+
+        except asyncio.CancelledError:
+            finish("cancelled")
+            raise
+
+        except Exception as e:
+            decky.logger.warning(f"Discord Lite: Warm-up failed: {e}")
+            return finish("failed")
+
+    def _connect_with_token(self, token: str) -> Optional[DiscordRPCClient]:
+        """
+        Open an authenticated session with a saved token (runs in executor).
+
+        Returns:
+            Authenticated client, or None if Discord is not running or the token was rejected
+        """
+        client = DiscordRPCClient(self.CLIENT_ID, self.logger, metrics=self.rpc_metrics,
+                                  ipc_path=self.ipc_path, recorder=self.ipc_recorder)
+
+        if not client.connect():
+            decky.logger.info("Discord Lite: Warm-up skipped, Discord not running")
+            return None
+
+        if not client.authenticate(token):
+            decky.logger.warning("Discord Lite: Warm-up skipped, saved token rejected")
+            client.disconnect()
+            return None
+
+        return client
+
+    def _prefetch_voice_settings(self) -> None:
+        """Load mute/deafen state (runs in executor; channel and members came with the session)."""
+        self.voice_controller.get_voice_settings()
+
+    def _prefetch_guilds(self) -> None:
+        """Load the guild list (runs in executor)."""
+        self.guilds_cache = self.voice_controller.get_guilds()
+
     async def _unload(self):
         """Plugin cleanup."""
         decky.logger.info("Discord Lite: Unloading plugin...")
 
-        # Stop polling
-        self.voice_poller.stop()
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+
+        # Stop polling and wait for background jobs to be cancelled
+        self.speaking_stream.stop()
+        await self.voice_poller.shutdown()
 
         # Disconnect RPC
         if self.rpc_client:
@@ -98,6 +291,13 @@ class Plugin:
         if self.activity_sync:
             self.activity_sync.clear()
 
+        # Release library and socket watches and profilers (only those that were built)
+        self.components.close_all()
+        close_socket_finder()
+
+        if self.ipc_recorder:
+            self.ipc_recorder.close()
+
         decky.logger.info("Discord Lite: Plugin unloaded")
 
     # ==================== AUTHENTICATION ====================
@@ -111,6 +311,18 @@ class Plugin:
         Returns:
             Dictionary with success status and user info
         """
+        # Startup warm-up still connecting: use its session instead of racing it
+        warmup = self._warmup_task
+        if warmup and not warmup.done():
+            decky.logger.info("Discord Lite: Waiting for startup warm-up...")
+            if await asyncio.shield(warmup) and self.rpc_client and self.rpc_client.authenticated:
+                return {
+                    "success": True,
+                    "authenticated": True,
+                    "user": self.rpc_client.user,
+                    "message": f"Connected as {self.rpc_client.user.get('username', 'User')}"
+                }
+
         if self.auth_in_progress:
             return {"success": False, "message": "Authentication already in progress"}
 
@@ -121,8 +333,14 @@ class Plugin:
             if not self.access_token:
                 self.access_token = self.token_manager.load()
 
+            # Drop any previous session and its background jobs
+            self.voice_poller.stop()
+            if self.rpc_client:
+                self.rpc_client.disconnect()
+
             # Create RPC client
-            self.rpc_client = DiscordRPCClient(self.CLIENT_ID, decky.logger)
+            self.rpc_client = DiscordRPCClient(self.CLIENT_ID, self.logger, metrics=self.rpc_metrics,
+                                               ipc_path=self.ipc_path, recorder=self.ipc_recorder)
 
             # Connect to Discord IPC
             if not self.rpc_client.connect():
@@ -163,7 +381,8 @@ class Plugin:
 
             # Reconnect with new token
             self.rpc_client.disconnect()
-            self.rpc_client = DiscordRPCClient(self.CLIENT_ID, decky.logger)
+            self.rpc_client = DiscordRPCClient(self.CLIENT_ID, self.logger, metrics=self.rpc_metrics,
+                                               ipc_path=self.ipc_path, recorder=self.ipc_recorder)
 
             if not self.rpc_client.connect():
                 return {"success": False, "message": "Failed to reconnect after authentication"}
@@ -192,18 +411,39 @@ class Plugin:
 
     def _post_authentication_setup(self):
         """Setup components after successful authentication."""
+        self._prepare_session()
+        self._start_voice_polling()
+
+    def _prepare_session(self) -> None:
+        """
+        Build session components and load the current channel.
+
+        Blocks on RPC round trips (SUBSCRIBE, GET_SELECTED_VOICE_CHANNEL)
+        and may build the game detector, so the warm-up runs it in the
+        executor; only _start_voice_polling() needs the event loop.
+        """
         # Create voice controller
-        self.voice_controller = VoiceController(self.rpc_client, decky.logger)
+        self.voice_controller = VoiceController(self.rpc_client, self.logger)
 
         # Create activity sync manager
+        from backend.steam.activity_sync import ActivitySyncManager
         self.activity_sync = ActivitySyncManager(
             decky.DECKY_PLUGIN_SETTINGS_DIR,
             self.rpc_client,
-            decky.logger
+            decky.logger,
+            game_detector=self.game_detector
         )
 
-        # Start polling
-        self._start_voice_polling()
+        # Member deltas and channel switches are pushed by Discord
+        self._voice_events_channel_id = None
+        self._speaking_events_channel_id = None
+        self.rpc_client.add_event_listener(self._on_rpc_event)
+        self.rpc_client.subscribe("VOICE_CHANNEL_SELECT")
+
+        # Initialize member tracker
+        self.voice_controller.get_selected_voice_channel()
+        self.member_tracker.initialize(*self.voice_controller.members_snapshot())
+        self.rpc_client.speaking_tracker.set_channel(self.voice_controller.voice_channel_id)
 
     async def logout(self) -> dict:
         """
@@ -221,6 +461,7 @@ class Plugin:
 
         # Stop polling
         self.voice_poller.stop()
+        self.voice_poller.member_events.reset()
 
         return {"success": True, "message": "Logged out"}
 
@@ -317,11 +558,11 @@ class Plugin:
             Dictionary with running status
         """
         try:
-            temp_rpc = DiscordRPCClient(self.CLIENT_ID, decky.logger)
-            from backend.utils.socket_finder import find_discord_ipc_socket
-
-            ipc_path = find_discord_ipc_socket(decky.logger)
-            is_running = ipc_path is not None
+            # Cached by the shared finder: one stat (or one inotify read) per check
+            if self.ipc_path:
+                is_running = os.path.exists(self.ipc_path)
+            else:
+                is_running = find_discord_ipc_socket(decky.logger) is not None
 
             return {"success": True, "running": is_running}
 
@@ -331,6 +572,22 @@ class Plugin:
 
     # ==================== VOICE CONTROL ====================
 
+    async def _rpc(self, func, *args, **kwargs):
+        """
+        Run a blocking RPC call on an executor thread.
+
+        The socket lock may be held by a background job running at reduced
+        priority; waiting for it off the event loop keeps every other
+        callable responsive meanwhile.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    def _refresh_voice_state(self) -> None:
+        """Read voice settings and the selected channel (runs in executor)."""
+        self.voice_controller.get_voice_settings()
+        self.voice_controller.get_selected_voice_channel()
+
     async def get_voice_state(self) -> dict:
         """
         Get current voice state including settings and channel info.
@@ -341,50 +598,50 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated", "authenticated": False}
 
-        self.voice_controller.get_voice_settings()
-        self.voice_controller.get_selected_voice_channel()
+        await self._rpc(self._refresh_voice_state)
 
-        speaking_users = self.rpc_client.get_speaking_users()
+        # One snapshot, so channel and members always belong together
+        state = self.voice_controller.state
+        tracker = self.rpc_client.speaking_tracker
 
-        return {
-            "success": True,
-            "authenticated": True,
-            "is_muted": self.voice_controller.is_muted,
-            "is_deafened": self.voice_controller.is_deafened,
-            "input_volume": self.voice_controller.input_volume,
-            "output_volume": self.voice_controller.output_volume,
-            "channel_id": self.voice_controller.voice_channel_id,
-            "channel_name": self.voice_controller.voice_channel_name,
-            "guild_id": self.voice_controller.voice_guild_id,
-            "in_voice": self.voice_controller.voice_channel_id is not None,
-            "members": self.voice_controller.voice_members,
-            "speaking_users": speaking_users,
-            "mode_type": self.voice_controller.mode_type,
-            "noise_suppression": self.voice_controller.noise_suppression,
-            "echo_cancellation": self.voice_controller.echo_cancellation,
-            "automatic_gain_control": self.voice_controller.automatic_gain_control,
-        }
+        return self.response_cache.get(
+            "get_voice_state",
+            (state, tracker, tracker.get_version()),
+            lambda: {
+                "success": True,
+                "authenticated": True,
+                **state.to_dict(),
+                "speaking_users": tracker.get_speaking_users(),
+            }
+        )
+
+    async def get_speaking_stats(self) -> dict:
+        """Get per-user speaking statistics (total talk time, last spoke)."""
+        if not self.rpc_client or not self.rpc_client.authenticated:
+            return {"success": False, "message": "Not authenticated"}
+
+        return {"success": True, "stats": self.rpc_client.get_speaking_stats()}
 
     async def toggle_mute(self) -> dict:
         """Toggle mute state."""
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        return self.voice_controller.toggle_mute()
+        return await self._rpc(self.voice_controller.toggle_mute)
 
     async def toggle_deafen(self) -> dict:
         """Toggle deafen state."""
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        return self.voice_controller.toggle_deafen()
+        return await self._rpc(self.voice_controller.toggle_deafen)
 
     async def set_input_volume(self, volume: int) -> dict:
         """Set microphone input volume (0-100)."""
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        result = self.voice_controller.set_input_volume(volume)
+        result = await self._rpc(self.voice_controller.set_input_volume, volume)
         return {"success": result.get("success"), "volume": volume}
 
     async def set_output_volume(self, volume: int) -> dict:
@@ -392,7 +649,7 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        result = self.voice_controller.set_output_volume(volume)
+        result = await self._rpc(self.voice_controller.set_output_volume, volume)
         return {"success": result.get("success"), "volume": volume}
 
     async def leave_voice(self) -> dict:
@@ -400,9 +657,8 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        if self.voice_controller.select_voice_channel(None):
-            self.voice_controller.voice_channel_id = None
-            self.voice_controller.voice_channel_name = None
+        if await self._rpc(self.voice_controller.select_voice_channel, None):
+            self.voice_controller.clear_channel()
             return {"success": True}
 
         return {"success": False, "message": "Failed to leave channel"}
@@ -414,7 +670,7 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated", "guilds": []}
 
-        self.guilds_cache = self.voice_controller.get_guilds()
+        self.guilds_cache = await self._rpc(self.voice_controller.get_guilds)
 
         return {
             "success": True,
@@ -441,13 +697,13 @@ class Plugin:
             guild_id = self.selected_guild_id
 
         if not guild_id:
-            self.voice_controller.get_selected_voice_channel()
+            await self._rpc(self.voice_controller.get_selected_voice_channel)
             guild_id = self.voice_controller.voice_guild_id
 
         if not guild_id:
             return {"success": False, "message": "No server selected", "channels": []}
 
-        channels = self.voice_controller.get_channels(guild_id)
+        channels = await self._rpc(self.voice_controller.get_channels, guild_id)
 
         return {"success": True, "guild_id": guild_id, "channels": channels}
 
@@ -456,8 +712,8 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        if self.voice_controller.select_voice_channel(channel_id, force=True):
-            self.voice_controller.get_selected_voice_channel()
+        if await self._rpc(self.voice_controller.select_voice_channel, channel_id, force=True):
+            await self._rpc(self.voice_controller.get_selected_voice_channel)
             return {
                 "success": True,
                 "channel_id": self.voice_controller.voice_channel_id,
@@ -489,7 +745,7 @@ class Plugin:
 
         decky.logger.info(f"Discord Lite: set_user_volume user={user_id} perceptual={volume} amplitude={amplitude}")
 
-        if self.voice_controller.set_user_voice_settings(user_id, volume=amplitude):
+        if await self._rpc(self.voice_controller.set_user_voice_settings, user_id, volume=amplitude):
             return {"success": True, "user_id": user_id, "volume": volume}
 
         return {"success": False, "message": "Failed to set user volume"}
@@ -513,7 +769,7 @@ class Plugin:
             else:
                 return {"success": True, "user_id": user_id, "muted": mute, "message": "Already in correct state"}
 
-        if self.voice_controller.set_user_voice_settings(user_id, mute=mute):
+        if await self._rpc(self.voice_controller.set_user_voice_settings, user_id, mute=mute):
             return {"success": True, "user_id": user_id, "muted": mute}
 
         return {"success": False, "message": "Failed to mute user"}
@@ -528,7 +784,7 @@ class Plugin:
         if mode_type not in ["VOICE_ACTIVITY", "PUSH_TO_TALK"]:
             return {"success": False, "message": "Invalid mode type"}
 
-        result = self.voice_controller.set_voice_settings(mode={"type": mode_type})
+        result = await self._rpc(self.voice_controller.set_voice_settings, mode={"type": mode_type})
 
         if result.get("success"):
             self.voice_controller.mode_type = mode_type
@@ -543,7 +799,7 @@ class Plugin:
 
         shortcut = [{"type": key_type, "code": key_code, "name": key_name}]
 
-        result = self.voice_controller.set_voice_settings(mode={
+        result = await self._rpc(self.voice_controller.set_voice_settings, mode={
             "type": "PUSH_TO_TALK",
             "shortcut": shortcut,
             "delay": 100.0
@@ -560,7 +816,7 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        result = self.voice_controller.set_voice_settings(noise_suppression=enabled)
+        result = await self._rpc(self.voice_controller.set_voice_settings, noise_suppression=enabled)
 
         if result.get("success"):
             self.voice_controller.noise_suppression = enabled
@@ -573,7 +829,7 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        result = self.voice_controller.set_voice_settings(echo_cancellation=enabled)
+        result = await self._rpc(self.voice_controller.set_voice_settings, echo_cancellation=enabled)
 
         if result.get("success"):
             self.voice_controller.echo_cancellation = enabled
@@ -586,7 +842,7 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        result = self.voice_controller.set_voice_settings(automatic_gain_control=enabled)
+        result = await self._rpc(self.voice_controller.set_voice_settings, automatic_gain_control=enabled)
 
         if result.get("success"):
             self.voice_controller.automatic_gain_control = enabled
@@ -608,12 +864,32 @@ class Plugin:
                 "language": settings.get("language", "pt"),
                 "user_volumes": settings.get("user_volumes", {}),
                 "game_sync_enabled": settings.get("game_sync_enabled", True),
+                "background_priority": settings.get("background_priority", "low"),
+                "event_coalesce_window": settings.get("event_coalesce_window", self.voice_poller.member_events.window),
+                "diagnostics_enabled": settings.get("diagnostics_enabled", True),
+                "debug_logging": settings.get("debug_logging", False),
             }
         }
 
     async def save_settings_async(self, settings: dict) -> dict:
         """Save plugin settings."""
         try:
+            if "background_priority" in settings:
+                if not self.voice_poller.set_background_priority(settings["background_priority"]):
+                    return {"success": False, "message": "Invalid background priority"}
+
+            if "diagnostics_enabled" in settings:
+                self.rpc_metrics.set_enabled(settings["diagnostics_enabled"])
+
+            if "debug_logging" in settings:
+                self.logger.verbose = bool(settings["debug_logging"])
+
+            if "event_coalesce_window" in settings:
+                try:
+                    self.voice_poller.member_events.configure(window=settings["event_coalesce_window"])
+                except (TypeError, ValueError):
+                    return {"success": False, "message": "Invalid event coalesce window"}
+
             self.settings_manager.save_settings(settings)
 
             # Handle game sync toggle
@@ -623,7 +899,8 @@ class Plugin:
                 if not self.game_sync_enabled and self.activity_sync:
                     self.activity_sync.clear()
                 elif self.game_sync_enabled and self.activity_sync:
-                    self.activity_sync.sync()
+                    # Detection and the library index belong to the worker thread
+                    self.voice_poller.trigger("game_sync")
 
             return {"success": True}
 
@@ -638,9 +915,9 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        self.voice_controller.get_selected_voice_channel()
+        await self._rpc(self.voice_controller.get_selected_voice_channel)
 
-        diff = self.member_tracker.update_and_get_diff(self.voice_controller.voice_members)
+        diff = self.member_tracker.update_and_get_diff(*self.voice_controller.members_snapshot())
 
         return {
             "success": True,
@@ -654,116 +931,579 @@ class Plugin:
         if not self.rpc_client or not self.rpc_client.authenticated:
             return {"success": False, "message": "Not authenticated"}
 
-        # Get voice settings
-        self.voice_controller.get_voice_settings()
+        # Get voice settings and channel
+        await self._rpc(self._refresh_voice_state)
 
-        # Get voice channel
-        self.voice_controller.get_selected_voice_channel()
+        state = self.voice_controller.state
 
         # Update selected guild if in voice
-        if self.voice_controller.voice_guild_id:
-            self.selected_guild_id = self.voice_controller.voice_guild_id
-            self.settings_manager.save_settings({"selected_guild_id": self.voice_controller.voice_guild_id})
+        if state.guild_id:
+            self.selected_guild_id = state.guild_id
+            self.settings_manager.save_settings({"selected_guild_id": state.guild_id})
 
         # Initialize member tracker
-        self.member_tracker.initialize(self.voice_controller.voice_members)
+        self.member_tracker.initialize(*self.voice_controller.members_snapshot())
 
         # Get guilds
-        self.guilds_cache = self.voice_controller.get_guilds()
+        self.guilds_cache = await self._rpc(self.voice_controller.get_guilds)
 
         # Get current game
         current_game = self.activity_sync.get_current_game_info() if self.activity_sync else None
 
-        return {
-            "success": True,
-            "authenticated": True,
-            "is_muted": self.voice_controller.is_muted,
-            "is_deafened": self.voice_controller.is_deafened,
-            "input_volume": self.voice_controller.input_volume,
-            "output_volume": self.voice_controller.output_volume,
-            "channel_id": self.voice_controller.voice_channel_id,
-            "channel_name": self.voice_controller.voice_channel_name,
-            "guild_id": self.voice_controller.voice_guild_id,
-            "in_voice": self.voice_controller.voice_channel_id is not None,
-            "members": self.voice_controller.voice_members,
-            "mode_type": self.voice_controller.mode_type,
-            "noise_suppression": self.voice_controller.noise_suppression,
-            "echo_cancellation": self.voice_controller.echo_cancellation,
-            "automatic_gain_control": self.voice_controller.automatic_gain_control,
-            "guilds": self.guilds_cache,
-            "selected_guild_id": self.selected_guild_id,
-            "game_sync_enabled": self.game_sync_enabled,
-            "current_game": current_game,
-        }
+        key = (
+            state, self.voice_controller, self.voice_controller.guilds_version,
+            self.selected_guild_id, self.game_sync_enabled, current_game
+        )
+
+        return self.response_cache.get(
+            "sync_full_state",
+            key,
+            lambda: {
+                "success": True,
+                "authenticated": True,
+                **state.to_dict(),
+                "guilds": self.guilds_cache,
+                "selected_guild_id": self.selected_guild_id,
+                "game_sync_enabled": self.game_sync_enabled,
+                "current_game": current_game,
+            }
+        )
+
+    # ==================== BATCHING ====================
+
+    # Methods without side effects that batch() may run
+    BATCHABLE_METHODS = frozenset({
+        "check_status",
+        "check_discord_installed",
+        "check_discord_running",
+        "get_voice_state",
+        "get_speaking_stats",
+        "get_guilds",
+        "get_voice_channels",
+        "get_settings",
+        "get_events_since",
+        "get_poller_stats",
+    })
+
+    async def batch(self, calls: list) -> dict:
+        """
+        Run several read-only methods in one bridge round trip.
+
+        Identical calls (same method and arguments) run once and share
+        their result; RPC reads shared between methods (voice settings,
+        selected channel) are coalesced by VoiceController.
+
+        Args:
+            calls: List of method names or {"method": name, "args": [...]} entries
+
+        Returns:
+            Dictionary with 'results', one entry per call in the same order
+        """
+        results = []
+        done: Dict[str, Any] = {}
+
+        for call in calls or []:
+            if isinstance(call, str):
+                method, args = call, []
+            elif isinstance(call, dict):
+                method, args = call.get("method"), call.get("args") or []
+            else:
+                method, args = None, []
+
+            if method not in self.BATCHABLE_METHODS or not isinstance(args, list):
+                results.append({"success": False, "message": f"Not allowed in batch: {method}"})
+                continue
+
+            key = json.dumps([method, args], sort_keys=True, default=str)
+            if key not in done:
+                try:
+                    done[key] = await getattr(self, method)(*args)
+                except Exception as e:
+                    decky.logger.error(f"Discord Lite: Error in batched {method}: {e}")
+                    done[key] = {"success": False, "message": str(e)}
+
+            results.append(done[key])
+
+        return {"success": True, "results": results}
 
     # ==================== POLLING SYSTEM ====================
 
     async def get_pending_events(self) -> dict:
-        """Get pending events from polling queue."""
+        """Get events not yet returned by this call (single consumer)."""
         events = self.voice_poller.get_pending_events()
         return {"success": True, "events": events}
 
-    def _start_voice_polling(self):
-        """Start background polling thread."""
-        # Initialize member tracker
+    async def get_events_since(self, seq: int = 0) -> dict:
+        """
+        Get events newer than a cursor.
+
+        Each UI surface keeps its own cursor (the returned last_seq), so
+        several consumers can read the same stream.
+
+        Args:
+            seq: Last sequence number seen (0 for everything retained)
+
+        Returns:
+            Dictionary with events, last_seq, overflow and dropped
+        """
+        try:
+            seq = max(0, int(seq))
+        except (TypeError, ValueError):
+            return {"success": False, "message": "Invalid sequence number"}
+
+        return {"success": True, **self.voice_poller.get_events_since(seq)}
+
+    async def get_diagnostics(self, reset: bool = False) -> dict:
+        """
+        Get RPC metrics and internal stats for troubleshooting.
+
+        Shows per-command latency percentiles, reply sizes, timeouts and
+        reconnects, so slowness can be attributed to Discord (slow replies),
+        the socket (timeouts, reconnects) or the plugin (job overruns).
+
+        Args:
+            reset: Clear RPC metrics after reading them
+
+        Returns:
+            Dictionary with rpc, poller and cache sections
+        """
+        diagnostics = {
+            "success": True,
+            "rpc": self.rpc_metrics.snapshot(),
+            "connected": bool(self.rpc_client and self.rpc_client.connected),
+            "subscriptions": sorted(self.rpc_client.subscriptions) if self.rpc_client else [],
+            "poller": self.voice_poller.get_stats(),
+            "response_cache": self.response_cache.get_stats(),
+            "logging": self.logger.get_stats(),
+            "tracing": tracer.get_stats(),
+            "ipc_recording": self.ipc_recorder.get_stats() if self.ipc_recorder else None,
+            "components": self.components.get_stats(),
+            "warmup": self.warmup_stats,
+            "ipc_socket": get_socket_finder().get_stats(),
+        }
+
         if self.voice_controller:
-            self.voice_controller.get_selected_voice_channel()
-            self.member_tracker.initialize(self.voice_controller.voice_members)
+            diagnostics["voice_reads"] = self.voice_controller.get_read_stats()
+
+        if reset:
+            self.rpc_metrics.reset()
+
+        return diagnostics
+
+    async def dump_logs(self) -> dict:
+        """
+        Write the in-memory trace buffer (RPC responses, suppressed errors)
+        to the plugin log directory.
+
+        Returns:
+            Dictionary with the path of the written file
+        """
+        path = self.logger.dump(decky.DECKY_PLUGIN_LOG_DIR)
+        if path is None:
+            return {"success": False, "message": "Could not write trace dump"}
+
+        return {"success": True, "path": path}
+
+    async def set_tracing(self, enabled: bool, clear: bool = False) -> dict:
+        """
+        Start or stop span tracing at runtime.
+
+        Spans cover Plugin callables, RPC commands (lock wait, send,
+        receive, decode), voice reads, poller jobs and game detection.
+
+        Args:
+            enabled: True to record spans
+            clear: Drop previously recorded spans first
+
+        Returns:
+            Dictionary with tracer stats
+        """
+        if clear:
+            tracer.clear()
+        tracer.set_enabled(enabled)
+        return {"success": True, **tracer.get_stats()}
+
+    async def export_trace(self, save: bool = False) -> dict:
+        """
+        Export recorded spans as Chrome trace-event JSON.
+
+        Args:
+            save: Also write the trace to the plugin log directory
+
+        Returns:
+            Dictionary with the trace document (and its path if saved)
+        """
+        trace = tracer.export()
+        response = {"success": True, "trace": trace}
+
+        if save:
+            path = os.path.join(
+                decky.DECKY_PLUGIN_LOG_DIR,
+                f"discord-lite-spans-{time.strftime('%Y%m%d-%H%M%S')}.json"
+            )
+            try:
+                os.makedirs(decky.DECKY_PLUGIN_LOG_DIR, exist_ok=True)
+                with open(path, 'w') as f:
+                    json.dump(trace, f)
+                response["path"] = path
+            except OSError as e:
+                decky.logger.error(f"Discord Lite: Error writing trace: {e}")
+                return {"success": False, "message": str(e)}
+
+        return response
+
+    async def start_profile(self, seconds: float = 10) -> dict:
+        """
+        Sample the stacks of all plugin threads for a while.
+
+        Runs on an executor thread, so the event loop keeps serving calls
+        (and is itself sampled). Writes collapsed stacks to the plugin log
+        directory (loadable in speedscope or flamegraph.pl).
+
+        Args:
+            seconds: Profile length (max 120)
+
+        Returns:
+            Dictionary with the file path and the top functions by samples
+        """
+        try:
+            seconds = float(seconds)
+        except (TypeError, ValueError):
+            return {"success": False, "message": "Invalid duration"}
+
+        if self.stack_sampler.is_running():
+            return {"success": False, "message": "Profile already running"}
+
+        decky.logger.info(f"Discord Lite: Profiling for {seconds}s...")
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, self.stack_sampler.run, seconds)
 
-        # Start polling with callbacks
+        if result is None:
+            return {"success": False, "message": "Profile already running"}
+
+        try:
+            path = self.stack_sampler.write_collapsed(result["stacks"], decky.DECKY_PLUGIN_LOG_DIR)
+        except OSError as e:
+            decky.logger.error(f"Discord Lite: Error writing profile: {e}")
+            return {"success": False, "message": str(e)}
+
+        decky.logger.info(f"Discord Lite: Wrote profile ({result['samples']} samples) to {path}")
+        return {
+            "success": True,
+            "path": path,
+            "seconds": result["seconds"],
+            "samples": result["samples"],
+            "top": result["top"],
+        }
+
+    async def memory_snapshot(self, top: int = 25, stop: bool = False) -> dict:
+        """
+        Diff Python allocations against the previous snapshot.
+
+        The first call starts tracemalloc and records a baseline; later
+        calls write the top-N growth since the previous call to the plugin
+        log directory (e.g., to spot a growing apps cache or event queue).
+
+        Args:
+            top: Number of allocation sites to report
+            stop: Stop tracing afterwards (tracemalloc has overhead)
+
+        Returns:
+            Dictionary with traced memory totals, top growth and file path
+        """
+        try:
+            top = max(1, int(top))
+        except (TypeError, ValueError):
+            return {"success": False, "message": "Invalid top count"}
+
+        profiler = self.memory_profiler
+
+        def take_snapshot():
+            try:
+                return profiler.snapshot(decky.DECKY_PLUGIN_LOG_DIR, top)
+            finally:
+                if stop:
+                    profiler.stop()
+
+        # Snapshotting and diffing every traced block takes a while; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(None, take_snapshot)
+        except OSError as e:
+            decky.logger.error(f"Discord Lite: Error writing memory snapshot: {e}")
+            return {"success": False, "message": str(e)}
+
+        return {"success": True, "tracing": profiler.is_tracing(), **result}
+
+    async def start_ipc_recording(self) -> dict:
+        """
+        Record all IPC frames to a binary log in the plugin log directory.
+
+        Tokens and OAuth codes are redacted. The log survives reconnects
+        and can be replayed against the fake server with tools/ipc_replay.py.
+
+        Returns:
+            Dictionary with the recording path
+        """
+        if self.ipc_recorder and not self.ipc_recorder.closed:
+            return {"success": True, **self.ipc_recorder.get_stats()}
+
+        path = os.path.join(
+            decky.DECKY_PLUGIN_LOG_DIR,
+            f"discord-lite-ipc-{time.strftime('%Y%m%d-%H%M%S')}.dlrec"
+        )
+        try:
+            os.makedirs(decky.DECKY_PLUGIN_LOG_DIR, exist_ok=True)
+            self.ipc_recorder = FrameRecorder(path)
+        except OSError as e:
+            decky.logger.error(f"Discord Lite: Error starting IPC recording: {e}")
+            return {"success": False, "message": str(e)}
+
+        if self.rpc_client:
+            self.rpc_client.recorder = self.ipc_recorder
+
+        decky.logger.info(f"Discord Lite: Recording IPC traffic to {path}")
+        return {"success": True, **self.ipc_recorder.get_stats()}
+
+    async def stop_ipc_recording(self) -> dict:
+        """
+        Stop recording IPC traffic.
+
+        Returns:
+            Dictionary with the recording path, frame count and size
+        """
+        recorder = self.ipc_recorder
+        if not recorder:
+            return {"success": False, "message": "Not recording"}
+
+        self.ipc_recorder = None
+        if self.rpc_client:
+            self.rpc_client.recorder = None
+        recorder.close()
+
+        decky.logger.info(f"Discord Lite: Recorded {recorder.frames} IPC frames to {recorder.path}")
+        return {"success": True, **recorder.get_stats()}
+
+    async def get_poller_stats(self) -> dict:
+        """Get background job stats including tick-cost histograms."""
+        return {"success": True, **self.voice_poller.get_stats()}
+
+    async def set_qam_visible(self, visible: bool) -> dict:
+        """
+        Tell the polling policy whether the plugin panel is open.
+
+        Called by the frontend on mount/unmount of the panel.
+        """
+        self.voice_poller.set_qam_visible(bool(visible))
+
+        if not visible and self.speaking_stream.is_active():
+            await self.set_member_list_visible(False)
+
+        return {"success": True, "visible": bool(visible)}
+
+    async def set_member_list_visible(self, visible: bool) -> dict:
+        """
+        Start or stop the live speaking indicator stream.
+
+        While visible, speaking changes are pushed to the frontend as
+        "speaking_update" events (at most 10 per second, only on change).
+        """
+        if visible:
+            self.speaking_stream.start()
+        else:
+            self.speaking_stream.stop()
+
+        if self.voice_controller:
+            await self._rpc(self._ensure_speaking_subscription, self.voice_controller.voice_channel_id)
+        self.voice_poller.trigger("event_pump")
+
+        return {"success": True, "visible": bool(visible)}
+
+    def _start_voice_polling(self):
+        """Start background polling jobs (replaces any previous set; event loop only)."""
         self.voice_poller.start(
             check_members_callback=self._check_voice_members_changes,
             sync_game_callback=self._sync_game_to_discord,
-            is_active_callback=self._is_user_active
+            is_active_callback=self._is_user_active,
+            refresh_cache_callback=self._refresh_caches,
+            context_callback=self._polling_context,
+            pump_events_callback=self._pump_rpc_events
         )
 
     def _check_voice_members_changes(self):
-        """Check for voice member changes (called by poller)."""
+        """
+        Reconcile voice members with a full fetch (called by poller).
+
+        Runs periodically only while member events are not live; otherwise
+        it is triggered once per channel switch to resubscribe and resync.
+        Out of voice, joining a channel is noticed through VOICE_CHANNEL_SELECT;
+        until that subscription is confirmed, every CHANNEL_POLL_EVERY-th
+        tick polls the selected channel (and retries the subscription).
+        """
         try:
-            if not self.member_tracker.should_emit_events():
+            if not self.voice_controller:
                 return
 
-            if not self.voice_controller.voice_channel_id:
-                return
+            previous_channel_id = self.voice_controller.voice_channel_id
+            channel_changed = self._voice_channel_changed
+            self._voice_channel_changed = False
 
-            self.voice_controller.get_selected_voice_channel()
+            if not previous_channel_id and not self._voice_events_channel_id and not channel_changed:
+                if self.rpc_client.is_subscribed("VOICE_CHANNEL_SELECT"):
+                    self._idle_member_checks = 0
+                    return
 
-            if not self.voice_controller.voice_channel_id:
+                self._idle_member_checks += 1
+                if self._idle_member_checks < self.CHANNEL_POLL_EVERY:
+                    return
+
+                self._idle_member_checks = 0
+                self.rpc_client.subscribe("VOICE_CHANNEL_SELECT")
+
+            self.voice_controller.get_selected_voice_channel(fresh=channel_changed)
+            channel_id = self.voice_controller.voice_channel_id
+            members, as_of = self.voice_controller.members_snapshot()
+
+            if channel_id != previous_channel_id:
+                # Held joins/leaves, rate history and speaking stats belong to the old channel
+                self.voice_poller.member_events.reset()
+                self.rpc_client.speaking_tracker.set_channel(channel_id)
+
+            if not channel_id:
                 self.member_tracker.reset()
-                return
+            elif channel_id != previous_channel_id or not self.member_tracker.should_emit_events():
+                # New channel: silent sync instead of a join per existing member
+                self.member_tracker.initialize(members, as_of)
+            else:
+                diff = self.member_tracker.update_and_get_diff(members, as_of)
 
-            diff = self.member_tracker.update_and_get_diff(self.voice_controller.voice_members)
+                for member in diff["joined"]:
+                    self._enqueue_member_event("VOICE_JOIN", member)
 
-            # Enqueue join events
-            for member in diff["joined"]:
-                decky.logger.info(f"Discord Lite: {member['username']} joined channel")
-                self.voice_poller.enqueue_event(
-                    "VOICE_JOIN",
-                    user_id=member["user_id"],
-                    username=member["username"],
-                    avatar=member.get("avatar")
-                )
+                for member in diff["left"]:
+                    self._enqueue_member_event("VOICE_LEAVE", member)
 
-            # Enqueue leave events
-            for member in diff["left"]:
-                decky.logger.info(f"Discord Lite: {member['username']} left channel")
-                self.voice_poller.enqueue_event(
-                    "VOICE_LEAVE",
-                    user_id=member["user_id"],
-                    username=member["username"],
-                    avatar=member.get("avatar")
-                )
+            self._ensure_voice_subscriptions(channel_id)
 
         except Exception as e:
             decky.logger.error(f"Discord Lite: Error checking member changes: {e}")
 
+    def _ensure_voice_subscriptions(self, channel_id: Optional[str]) -> None:
+        """Point VOICE_STATE_* subscriptions at the current channel."""
+        if not self.rpc_client or not self.rpc_client.authenticated:
+            return
+
+        if channel_id == self._voice_events_channel_id and (
+            not channel_id or self.rpc_client.is_subscribed("VOICE_STATE_CREATE")
+        ):
+            self._ensure_speaking_subscription(channel_id)
+            return
+
+        if self._voice_events_channel_id:
+            self.rpc_client.unsubscribe_voice_state_events(self._voice_events_channel_id)
+            self._voice_events_channel_id = None
+
+        if channel_id and self.rpc_client.subscribe_voice_state_events(channel_id):
+            self._voice_events_channel_id = channel_id
+
+        self._ensure_speaking_subscription(channel_id)
+
+    def _ensure_speaking_subscription(self, channel_id: Optional[str]) -> None:
+        """Subscribe to SPEAKING_* for the current channel while the stream runs."""
+        if not self.rpc_client or not self.rpc_client.authenticated:
+            return
+
+        wanted = channel_id if self.speaking_stream.is_active() else None
+        if wanted == self._speaking_events_channel_id:
+            return
+
+        if self._speaking_events_channel_id:
+            self.rpc_client.unsubscribe_speaking_events(self._speaking_events_channel_id)
+            self._speaking_events_channel_id = None
+
+        if wanted and self.rpc_client.subscribe_speaking_events(wanted):
+            self._speaking_events_channel_id = wanted
+
+    def _on_rpc_event(self, payload: Dict[str, Any]) -> None:
+        """
+        Apply pushed Discord events to member state (RPC event listener).
+
+        May run inside another RPC call, so it only updates state and
+        schedules work; it never sends commands itself.
+        """
+        event = payload.get("evt")
+        data = payload.get("data") or {}
+
+        if event == "VOICE_CHANNEL_SELECT":
+            if data.get("channel_id") != self._voice_events_channel_id:
+                # Old channel's deltas no longer apply; resume polling until resubscribed
+                for name in DiscordRPCClient.VOICE_STATE_EVENTS:
+                    self.rpc_client.subscriptions.discard(name)
+                self._voice_channel_changed = True
+                self.voice_poller.trigger("member_check")
+            return
+
+        if event not in DiscordRPCClient.VOICE_STATE_EVENTS or not self.voice_controller:
+            return
+
+        if not self.rpc_client.is_subscribed(event):
+            return  # Late delta for a channel we already left
+
+        member = self.voice_controller.apply_voice_state_event(event, data)
+        if not member or not self.member_tracker.should_emit_events():
+            return
+
+        # Same timestamp as the controller's member list, so snapshots that
+        # include this delta are not mistaken for older ones
+        at = self.voice_controller.members_as_of
+        if event == "VOICE_STATE_DELETE":
+            left = self.member_tracker.apply_delete(member["user_id"], at)
+            if left:
+                self._enqueue_member_event("VOICE_LEAVE", left)
+        else:
+            joined = self.member_tracker.apply_update(member, at)
+            if joined:
+                self._enqueue_member_event("VOICE_JOIN", joined)
+
+    def _enqueue_member_event(self, event_type: str, member: Dict[str, Any]) -> None:
+        """Queue a VOICE_JOIN/VOICE_LEAVE event for the frontend (coalesced)."""
+        action = "joined" if event_type == "VOICE_JOIN" else "left"
+        self.logger.trace("Discord Lite: %s %s channel", member["username"], action)
+        self.voice_poller.enqueue_member_event(event_type, member)
+
+    def _pump_rpc_events(self):
+        """Dispatch pushed Discord events waiting on the socket (called by poller)."""
+        if self.rpc_client and self.rpc_client.connected:
+            self.rpc_client.pump_events()
+
     def _sync_game_to_discord(self):
         """Sync current game to Discord (called by poller)."""
         if self.activity_sync and self.game_sync_enabled:
             self.activity_sync.sync()
 
+    def _refresh_caches(self):
+        """Refresh detectable apps and Steam library caches (called by poller)."""
+        if self.activity_sync and self.game_sync_enabled:
+            self.activity_sync.refresh_caches()
+
     def _is_user_active(self) -> bool:
         """Check if user is active (in voice or game running)."""
         in_voice = self.voice_controller and self.voice_controller.voice_channel_id is not None
         game_running = self.activity_sync and self.activity_sync.current_game_appid is not None
         return in_voice or game_running
+
+    def _polling_context(self) -> dict:
+        """Context for the polling policy (called by poller)."""
+        member_events_live = bool(
+            self.rpc_client
+            and self.rpc_client.is_subscribed("VOICE_STATE_CREATE")
+            and self.rpc_client.is_subscribed("VOICE_STATE_DELETE")
+        )
+
+        return {
+            "in_voice": self.voice_controller and self.voice_controller.voice_channel_id is not None,
+            "game_running": self.activity_sync and self.activity_sync.current_game_appid is not None,
+            "member_events_live": member_events_live,
+            "events_live": bool(self.rpc_client and self.rpc_client.connected and self.rpc_client.subscriptions),
+            "speaking_stream": self.speaking_stream.is_active(),
+        }
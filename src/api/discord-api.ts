@@ -8,6 +8,9 @@ import type {
   DiscordStatusResponse,
   SettingsResponse,
   VoiceEvent,
+  EventsSinceResponse,
+  BatchCall,
+  BatchResponse,
   Guild,
 } from "../types/index";
 
@@ -54,7 +57,17 @@ export const getPendingEvents = callable<
   [],
   { success: boolean; events: VoiceEvent[] }
 >("get_pending_events");
+export const getEventsSince = callable<[number], EventsSinceResponse>(
+  "get_events_since",
+);
 export const getSettings = callable<[], SettingsResponse>("get_settings");
 export const saveSettings = callable<[Record<string, unknown>], ActionResponse>(
   "save_settings_async",
 );
+export const setQamVisible = callable<[boolean], ActionResponse>(
+  "set_qam_visible",
+);
+export const batch = callable<[BatchCall[]], BatchResponse>("batch");
+export const setMemberListVisible = callable<[boolean], ActionResponse>(
+  "set_member_list_visible",
+);
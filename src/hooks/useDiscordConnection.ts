@@ -1,5 +1,12 @@
 import { useState, useEffect, useCallback } from "react";
-import type { Language, Guild, VoiceStateResponse } from "../types/index";
+import type {
+  Language,
+  Guild,
+  VoiceStateResponse,
+  AutoAuthResponse,
+  DiscordStatusResponse,
+  GuildsResponse,
+} from "../types/index";
 import { translations } from "../i18n/translations";
 import * as DiscordAPI from "../api/discord-api";
 
@@ -132,8 +139,15 @@ export function useDiscordConnection(
           if (!installed.installed) return;
         }
 
-        // 2. Check if Discord is running
-        const running = await DiscordAPI.checkDiscordRunning();
+        // 2. Check if Discord is running (and the session, in the same call)
+        const checks = await DiscordAPI.batch([
+          "check_discord_running",
+          "check_status",
+        ]);
+        const [running, status] = checks.results as [
+          DiscordStatusResponse,
+          AutoAuthResponse,
+        ];
         const isRunning = running.running || false;
         setDiscordRunning(isRunning);
 
@@ -143,7 +157,6 @@ export function useDiscordConnection(
             // Already authenticated, just maintain status
           } else {
             // Check if there's an existing valid session
-            const status = await DiscordAPI.checkStatus();
             if (status.authenticated) {
               setIsAuthenticated(true);
               setUsername(status.user?.username || "");
@@ -152,8 +165,14 @@ export function useDiscordConnection(
               );
 
               // Load initial data
-              const voice = await DiscordAPI.getVoiceState();
-              const guildsRes = await DiscordAPI.getGuilds();
+              const initial = await DiscordAPI.batch([
+                "get_voice_state",
+                "get_guilds",
+              ]);
+              const [voice, guildsRes] = initial.results as [
+                VoiceStateResponse,
+                GuildsResponse,
+              ];
 
               if (onAuthSuccess) {
                 await onAuthSuccess({
@@ -1,5 +1,5 @@
 import { useState, useEffect, useCallback } from "react";
-import { toaster } from "@decky/api";
+import { toaster, addEventListener, removeEventListener } from "@decky/api";
 import type { VoiceStateResponse } from "../types/index";
 import * as DiscordAPI from "../api/discord-api";
 
@@ -43,6 +43,35 @@ export function useVoiceState(
     return () => clearInterval(intervalId);
   }, [isAuthenticated]);
 
+  // Live speaking indicators while the member list is shown
+  const membersVisible = !!(
+    isAuthenticated &&
+    voiceState?.in_voice &&
+    voiceState.members &&
+    voiceState.members.length > 0
+  );
+
+  useEffect(() => {
+    if (!membersVisible) return;
+
+    const onSpeakingUpdate = (speakingUsers: string[]) => {
+      setVoiceState((prev) =>
+        prev ? { ...prev, speaking_users: speakingUsers } : null
+      );
+    };
+
+    const listener = addEventListener<[string[]]>(
+      "speaking_update",
+      onSpeakingUpdate
+    );
+    DiscordAPI.setMemberListVisible(true);
+
+    return () => {
+      removeEventListener("speaking_update", listener);
+      DiscordAPI.setMemberListVisible(false);
+    };
+  }, [membersVisible]);
+
   const toggleMute = useCallback(async () => {
     const result = await DiscordAPI.toggleMute();
     if (result.success) {
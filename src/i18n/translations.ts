@@ -71,6 +71,9 @@ export const translations: Record<Language, Translations> = {
     // Toasts
     joined: "joined",
     left: "left",
+    joinedMany: "joined",
+    leftMany: "left",
+    people: "people",
     theCall: "the call",
     syncComplete: "Synced",
     membersInChannel: "members in channel",
@@ -143,6 +146,9 @@ export const translations: Record<Language, Translations> = {
     // Toasts
     joined: "entrou",
     left: "saiu",
+    joinedMany: "entraram",
+    leftMany: "saíram",
+    people: "pessoas",
     theCall: "da call",
     syncComplete: "Sincronizado",
     membersInChannel: "membros no canal",
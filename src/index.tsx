@@ -8,7 +8,7 @@ import {
   ToggleField,
 } from "@decky/ui";
 import { definePlugin, toaster } from "@decky/api";
-import { useState, useCallback, Fragment, useRef } from "react";
+import { useState, useCallback, Fragment, useRef, useEffect } from "react";
 
 // Plugin version
 const PLUGIN_VERSION = "1.4.0";
@@ -17,6 +17,8 @@ const PLUGIN_VERSION = "1.4.0";
 import type {
   Language,
   TranslationKey,
+  SettingsResponse,
+  EventsSinceResponse,
 } from "./types/index";
 
 // Import translations
@@ -103,6 +105,14 @@ function Content() {
   const notificationsEnabledRef = useRef(notificationsEnabled);
   notificationsEnabledRef.current = notificationsEnabled;
 
+  // Let the backend polling policy know while the panel is open
+  useEffect(() => {
+    DiscordAPI.setQamVisible(true).catch(() => {});
+    return () => {
+      DiscordAPI.setQamVisible(false).catch(() => {});
+    };
+  }, []);
+
   // Handlers
   const handleJoinChannel = useCallback(
     (channelId: string) => {
@@ -489,6 +499,8 @@ function Content() {
 // Plugin Export & Event Polling
 
 let eventPollingInterval: ReturnType<typeof setInterval> | null = null;
+// null until the first poll: events already in the log are history, not news
+let eventCursor: number | null = null;
 let notificationsEnabled = true;
 let currentLanguage: Language = "pt";
 
@@ -497,18 +509,41 @@ const startEventPolling = () => {
 
   const pollEvents = async () => {
     try {
-      const settings = await DiscordAPI.getSettings();
+      // Settings and events in one bridge round trip
+      const batch = await DiscordAPI.batch([
+        "get_settings",
+        { method: "get_events_since", args: [eventCursor ?? 0] },
+      ]);
+      const [settings, result] = batch.results as [
+        SettingsResponse,
+        EventsSinceResponse,
+      ];
       notificationsEnabled = settings.settings?.notifications_enabled ?? true;
       currentLanguage = settings.settings?.language ?? "pt";
 
-      if (!notificationsEnabled) return;
+      if (!result.success) return;
+
+      // After a frontend reload (first poll) or a backend restart (reset),
+      // skip to the newest event instead of replaying old ones as toasts
+      const catchUp = eventCursor === null || result.reset;
+      eventCursor = result.last_seq;
+      if (catchUp || !notificationsEnabled) return;
 
-      const result = await DiscordAPI.getPendingEvents();
-      if (result.success && result.events.length > 0) {
+      if (result.overflow) {
+        console.warn(`Discord Lite: Missed ${result.dropped} events`);
+      }
+      if (result.events.length > 0) {
         const t = translations[currentLanguage];
 
         for (const event of result.events) {
-          if (event.type === "VOICE_JOIN" && event.username) {
+          if (event.count && event.count > 1) {
+            const joined = event.type === "VOICE_JOIN";
+            toaster.toast({
+              title: `${joined ? "🎤" : "👋"} ${event.count} ${t.people}`,
+              body: `${joined ? t.joinedMany : t.leftMany} ${t.theCall}: ${(event.usernames || []).join(", ")}`,
+              duration: 4000,
+            });
+          } else if (event.type === "VOICE_JOIN" && event.username) {
             const avatarUrl =
               event.avatar && event.user_id
                 ? `https://cdn.discordapp.com/avatars/${event.user_id}/${event.avatar}.png?size=64`
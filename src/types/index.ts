@@ -55,6 +55,9 @@ export interface Translations {
   callTime: string;
   joined: string;
   left: string;
+  joinedMany: string;
+  leftMany: string;
+  people: string;
   theCall: string;
   syncComplete: string;
   membersInChannel: string;
@@ -143,6 +146,8 @@ export interface SettingsResponse {
     notifications_enabled?: boolean;
     auto_connect?: boolean;
     game_sync_enabled?: boolean;
+    background_priority?: "normal" | "low" | "idle";
+    event_coalesce_window?: number;
     language?: Language;
     user_volumes?: Record<string, number>;
   };
@@ -153,4 +158,22 @@ export interface VoiceEvent {
   user_id?: string;
   username?: string;
   avatar?: string;
+  count?: number;
+  usernames?: string[];
+}
+
+export interface EventsSinceResponse {
+  success: boolean;
+  events: (VoiceEvent & { seq: number })[];
+  last_seq: number;
+  overflow: boolean;
+  dropped: number;
+  reset: boolean;
+}
+
+export type BatchCall = string | { method: string; args?: unknown[] };
+
+export interface BatchResponse {
+  success: boolean;
+  results: unknown[];
 }
@@ -0,0 +1 @@
+"""Development tools (not shipped with the plugin)"""
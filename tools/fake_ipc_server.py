@@ -0,0 +1,657 @@
+"""
+Fake Discord IPC server for headless benchmarking and testing.
+
+Listens on a Unix socket named discord-ipc-N and speaks enough of the
+Discord RPC protocol for the plugin: handshake/READY, AUTHORIZE,
+AUTHENTICATE, the GET_* and SET_* commands Discord Lite uses,
+SUBSCRIBE/UNSUBSCRIBE with DISPATCH events, PING/PONG and CLOSE.
+
+Account size, reply latency, frame fragmentation and event storms are
+configurable, so the plugin's I/O paths can be measured without a Deck.
+
+Usage:
+    python tools/fake_ipc_server.py --dir /tmp/fake-discord --guilds 200 --members 99
+    python tools/fake_ipc_server.py --latency 0.02 --fragment 64 --storm 500
+
+From Python:
+    server = FakeDiscordServer(directory, guilds=200, members=99)
+    server.start()
+    client = DiscordRPCClient(CLIENT_ID, ipc_path=server.path)
+    ...
+    server.storm(rate=500, seconds=2)
+    server.stop()
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Wire opcodes (see backend/discord_rpc/protocol.py)
+OP_HANDSHAKE = 0
+OP_FRAME = 1
+OP_CLOSE = 2
+OP_PING = 3
+OP_PONG = 4
+
+# Discord RPC error codes
+ERROR_UNKNOWN = 1000
+ERROR_INVALID_PAYLOAD = 4000
+ERROR_INVALID_COMMAND = 4002
+ERROR_INVALID_GUILD = 4003
+ERROR_INVALID_CHANNEL = 4005
+ERROR_NOT_AUTHENTICATED = 4006
+ERROR_INVALID_TOKEN = 4009
+
+CHANNEL_TYPE_TEXT = 0
+CHANNEL_TYPE_VOICE = 2
+
+# Commands allowed before AUTHENTICATE
+UNAUTHENTICATED_COMMANDS = {"AUTHORIZE", "AUTHENTICATE", "SET_ACTIVITY", "SUBSCRIBE", "UNSUBSCRIBE"}
+
+
+def _snowflake(kind: int, index: int) -> str:
+    """Deterministic snowflake-like ID (kind keeps guilds/channels/users apart)."""
+    return str(100000000000000000 + kind * 10000000000 + index)
+
+
+class _Connection:
+    """One connected client"""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.send_lock = threading.Lock()
+        self.client_id: Optional[str] = None
+        self.authenticated = False
+        # (event, channel_id or None)
+        self.subscriptions: Set[Tuple[str, Optional[str]]] = set()
+        self.closed = False
+
+
+class FakeDiscordServer:
+    """
+    Scriptable stand-in for the Discord client's IPC endpoint.
+
+    State (guilds, channels, the selected voice channel and its members,
+    voice settings) is generated deterministically from the counts given,
+    and SET_* commands update it, so reads after writes are consistent.
+    """
+
+    def __init__(self, directory: Optional[str] = None, index: int = 0,
+                 guilds: int = 1, channels: int = 4, members: int = 2,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 fragment: int = 0, fragment_delay: float = 0.0,
+                 valid_tokens: Optional[List[str]] = None,
+                 auth_code: Optional[str] = "fake-auth-code",
+                 seed: int = 0):
+        """
+        Initialize server (call start() to listen).
+
+        Args:
+            directory: Socket directory (a temporary one if None)
+            index: N in discord-ipc-N
+            guilds: Number of guilds the user is in
+            channels: Channels per guild (half voice, half text; at least one voice)
+            members: Members in the selected voice channel (including the user)
+            latency: Seconds to wait before each reply
+            jitter: Random extra reply delay, 0..jitter seconds
+            fragment: Write frames in chunks of this many bytes (0 = whole frames)
+            fragment_delay: Pause between chunks
+            valid_tokens: Accepted access tokens (None = any non-empty token)
+            auth_code: Code returned by AUTHORIZE (None = user declines)
+            seed: Random seed for jitter and event storms
+        """
+        self.directory = directory or tempfile.mkdtemp(prefix="fake-discord-")
+        self.path = os.path.join(self.directory, f"discord-ipc-{index}")
+
+        self.latency = latency
+        self.jitter = jitter
+        self.fragment = fragment
+        self.fragment_delay = fragment_delay
+        self.valid_tokens = set(valid_tokens) if valid_tokens is not None else None
+        self.auth_code = auth_code
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._connections: List[_Connection] = []
+        self._server: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+        self._running = False
+
+        # Stats
+        self.commands: Dict[str, int] = {}
+        self.events_sent = 0
+
+        self.user = self._make_user(0)
+        self.guilds = [
+            {"id": _snowflake(1, i), "name": f"Guild {i}", "icon": f"{i:032x}" if i % 2 == 0 else None}
+            for i in range(guilds)
+        ]
+        self.channels: Dict[str, Dict[str, Any]] = {}
+        self.guild_channels: Dict[str, List[str]] = {}
+        for g, guild in enumerate(self.guilds):
+            ids = []
+            for c in range(max(1, channels)):
+                channel_id = _snowflake(2, g * 1000 + c)
+                voice = c % 2 == 0
+                self.channels[channel_id] = {
+                    "id": channel_id,
+                    "guild_id": guild["id"],
+                    "name": f"{'Voice' if voice else 'text'}-{c}",
+                    "type": CHANNEL_TYPE_VOICE if voice else CHANNEL_TYPE_TEXT,
+                    "position": c,
+                }
+                ids.append(channel_id)
+            self.guild_channels[guild["id"]] = ids
+
+        # Members of the selected channel, keyed by user ID (user is first)
+        self.voice_states: Dict[str, Dict[str, Any]] = {}
+        for i in range(members):
+            self._add_voice_state(i)
+
+        first_voice = next((c for c in self.channels.values() if c["type"] == CHANNEL_TYPE_VOICE), None)
+        self.selected_channel_id: Optional[str] = first_voice["id"] if first_voice and members else None
+
+        self.voice_settings: Dict[str, Any] = {
+            "input": {"device_id": "default", "volume": 100.0,
+                      "available_devices": [{"id": "default", "name": "Default"}]},
+            "output": {"device_id": "default", "volume": 100.0,
+                       "available_devices": [{"id": "default", "name": "Default"}]},
+            "mode": {"type": "VOICE_ACTIVITY", "auto_threshold": True, "threshold": -60,
+                     "shortcut": [], "delay": 20},
+            "automatic_gain_control": True,
+            "echo_cancellation": True,
+            "noise_suppression": True,
+            "qos": True,
+            "silence_warning": False,
+            "deaf": False,
+            "mute": False,
+        }
+        self.activity: Optional[Dict[str, Any]] = None
+
+    # ==================== DATA ====================
+
+    @staticmethod
+    def _make_user(index: int) -> Dict[str, Any]:
+        return {
+            "id": _snowflake(3, index),
+            "username": f"user{index}",
+            "discriminator": "0",
+            "global_name": f"User {index}",
+            "avatar": f"{index:032x}",
+            "bot": False,
+        }
+
+    def _add_voice_state(self, index: int) -> Dict[str, Any]:
+        voice_state = {
+            "nick": f"User {index}",
+            "mute": False,
+            "volume": 100,
+            "pan": {"left": 1.0, "right": 1.0},
+            "voice_state": {"mute": False, "deaf": False, "self_mute": False,
+                            "self_deaf": False, "suppress": False},
+            "user": self._make_user(index),
+        }
+        self.voice_states[voice_state["user"]["id"]] = voice_state
+        return voice_state
+
+    def _selected_channel(self) -> Optional[Dict[str, Any]]:
+        if self.selected_channel_id is None:
+            return None
+        channel = self.channels[self.selected_channel_id]
+        return {**channel, "voice_states": list(self.voice_states.values())}
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> "FakeDiscordServer":
+        """Bind the socket and start accepting connections."""
+        os.makedirs(self.directory, exist_ok=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(8)
+        self._running = True
+        self._spawn(self._accept_loop, "fake-ipc-accept")
+        return self
+
+    def stop(self) -> None:
+        """Close all connections and remove the socket."""
+        self._running = False
+
+        if self._server:
+            try:
+                self._server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._server.close()
+            self._server = None
+
+        with self._lock:
+            connections = list(self._connections)
+        for conn in connections:
+            self._close(conn)
+
+        for thread in self._threads:
+            thread.join(timeout=2)
+        self._threads.clear()
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _spawn(self, target, name: str, *args) -> threading.Thread:
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+        return thread
+
+    def _accept_loop(self) -> None:
+        while self._running:
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return
+
+            conn = _Connection(sock)
+            with self._lock:
+                self._connections.append(conn)
+            self._spawn(self._serve, "fake-ipc-conn", conn)
+
+    def _close(self, conn: _Connection) -> None:
+        conn.closed = True
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        try:
+            conn.sock.close()
+        except OSError:
+            pass
+
+    # ==================== WIRE ====================
+
+    def _recv_exact(self, conn: _Connection, size: int) -> Optional[bytes]:
+        data = b""
+        while len(data) < size:
+            try:
+                chunk = conn.sock.recv(size - len(data))
+            except OSError:
+                return None
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _read_frame(self, conn: _Connection) -> Tuple[Optional[int], Any]:
+        header = self._recv_exact(conn, 8)
+        if header is None:
+            return None, None
+        opcode, length = struct.unpack('<II', header)
+        body = self._recv_exact(conn, length) if length else b""
+        if body is None:
+            return None, None
+        try:
+            return opcode, json.loads(body.decode('utf-8')) if body else {}
+        except ValueError:
+            return opcode, None
+
+    def _send(self, conn: _Connection, opcode: int, payload: Dict[str, Any]) -> bool:
+        body = json.dumps(payload).encode('utf-8')
+        frame = struct.pack('<II', opcode, len(body)) + body
+
+        with conn.send_lock:
+            if conn.closed:
+                return False
+            try:
+                if self.fragment <= 0:
+                    conn.sock.sendall(frame)
+                else:
+                    for offset in range(0, len(frame), self.fragment):
+                        conn.sock.sendall(frame[offset:offset + self.fragment])
+                        if self.fragment_delay:
+                            time.sleep(self.fragment_delay)
+            except OSError:
+                return False
+        return True
+
+    def _delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    # ==================== PROTOCOL ====================
+
+    def _serve(self, conn: _Connection) -> None:
+        opcode, payload = self._read_frame(conn)
+        if opcode != OP_HANDSHAKE or not isinstance(payload, dict) or not payload.get("client_id"):
+            self._send(conn, OP_CLOSE, {"code": ERROR_INVALID_PAYLOAD, "message": "Invalid handshake"})
+            self._close(conn)
+            return
+
+        conn.client_id = payload["client_id"]
+        self._send(conn, OP_FRAME, {
+            "cmd": "DISPATCH",
+            "evt": "READY",
+            "nonce": None,
+            "data": {
+                "v": 1,
+                "config": {"cdn_host": "cdn.discordapp.com", "api_endpoint": "//discord.com/api",
+                           "environment": "production"},
+                "user": self.user,
+            },
+        })
+
+        while self._running and not conn.closed:
+            opcode, payload = self._read_frame(conn)
+
+            if opcode is None or opcode == OP_CLOSE:
+                break
+            if opcode == OP_PING:
+                self._send(conn, OP_PONG, payload or {})
+                continue
+            if opcode != OP_FRAME or not isinstance(payload, dict):
+                self._send(conn, OP_CLOSE, {"code": ERROR_INVALID_PAYLOAD, "message": "Invalid frame"})
+                break
+
+            self._delay()
+            reply, events = self._handle(conn, payload)
+            self._send(conn, OP_FRAME, reply)
+            for evt, data, channel_id in events:
+                self.dispatch(evt, data, channel_id)
+
+        self._close(conn)
+
+    def _handle(self, conn: _Connection, payload: Dict[str, Any]):
+        """
+        Build the reply for one command.
+
+        Returns:
+            Tuple of (reply payload, events to dispatch after the reply)
+        """
+        cmd = payload.get("cmd")
+        nonce = payload.get("nonce")
+        args = payload.get("args") or {}
+        events: List[Tuple[str, Dict[str, Any], Optional[str]]] = []
+
+        with self._lock:
+            self.commands[cmd] = self.commands.get(cmd, 0) + 1
+
+        def ok(data: Any, evt: Optional[str] = None):
+            return {"cmd": cmd, "evt": evt, "nonce": nonce, "data": data}, events
+
+        def error(code: int, message: str):
+            return {"cmd": cmd, "evt": "ERROR", "nonce": nonce,
+                    "data": {"code": code, "message": message}}, events
+
+        if not conn.authenticated and cmd not in UNAUTHENTICATED_COMMANDS:
+            return error(ERROR_NOT_AUTHENTICATED, "Not authenticated or invalid scope")
+
+        if cmd == "AUTHORIZE":
+            if self.auth_code is None:
+                return error(5000, "OAuth2 Error: access_denied")
+            return ok({"code": self.auth_code})
+
+        if cmd == "AUTHENTICATE":
+            token = args.get("access_token")
+            if not token or (self.valid_tokens is not None and token not in self.valid_tokens):
+                return error(ERROR_INVALID_TOKEN, "Invalid access token")
+            conn.authenticated = True
+            return ok({
+                "user": self.user,
+                "scopes": ["rpc", "rpc.voice.read", "rpc.voice.write"],
+                "expires": "2099-01-01T00:00:00.000000+00:00",
+                "application": {"id": conn.client_id, "name": "Discord Lite"},
+                "access_token": token,
+            })
+
+        if cmd == "GET_GUILDS":
+            return ok({"guilds": [{"id": g["id"], "name": g["name"], "icon": g["icon"]} for g in self.guilds]})
+
+        if cmd == "GET_GUILD":
+            guild = next((g for g in self.guilds if g["id"] == args.get("guild_id")), None)
+            if guild is None:
+                return error(ERROR_INVALID_GUILD, f"Invalid guild id: {args.get('guild_id')}")
+            return ok({**guild, "icon_url": None, "members": []})
+
+        if cmd == "GET_CHANNELS":
+            ids = self.guild_channels.get(args.get("guild_id"))
+            if ids is None:
+                return error(ERROR_INVALID_GUILD, f"Invalid guild id: {args.get('guild_id')}")
+            return ok({"channels": [
+                {"id": c["id"], "name": c["name"], "type": c["type"]}
+                for c in (self.channels[i] for i in ids)
+            ]})
+
+        if cmd == "GET_CHANNEL":
+            channel = self.channels.get(args.get("channel_id"))
+            if channel is None:
+                return error(ERROR_INVALID_CHANNEL, f"Invalid channel id: {args.get('channel_id')}")
+            voice_states = list(self.voice_states.values()) if channel["id"] == self.selected_channel_id else []
+            return ok({**channel, "voice_states": voice_states})
+
+        if cmd == "GET_SELECTED_VOICE_CHANNEL":
+            return ok(self._selected_channel())
+
+        if cmd == "GET_VOICE_SETTINGS":
+            return ok(self.voice_settings)
+
+        if cmd == "SET_VOICE_SETTINGS":
+            with self._lock:
+                for key, value in args.items():
+                    if isinstance(value, dict) and isinstance(self.voice_settings.get(key), dict):
+                        self.voice_settings[key] = {**self.voice_settings[key], **value}
+                    else:
+                        self.voice_settings[key] = value
+                settings = dict(self.voice_settings)
+            events.append(("VOICE_SETTINGS_UPDATE", settings, None))
+            return ok(settings)
+
+        if cmd == "SET_USER_VOICE_SETTINGS":
+            voice_state = self.voice_states.get(args.get("user_id"))
+            if voice_state is None:
+                return error(ERROR_INVALID_PAYLOAD, f"Invalid user id: {args.get('user_id')}")
+            with self._lock:
+                for key in ("volume", "mute", "pan"):
+                    if key in args:
+                        voice_state[key] = args[key]
+            return ok({"user_id": args["user_id"], "volume": voice_state["volume"],
+                       "mute": voice_state["mute"], "pan": voice_state["pan"]})
+
+        if cmd == "SELECT_VOICE_CHANNEL":
+            channel_id = args.get("channel_id")
+            if channel_id is not None and channel_id not in self.channels:
+                return error(ERROR_INVALID_CHANNEL, f"Invalid channel id: {channel_id}")
+            with self._lock:
+                self.selected_channel_id = channel_id
+            guild_id = self.channels[channel_id]["guild_id"] if channel_id else None
+            events.append(("VOICE_CHANNEL_SELECT", {"channel_id": channel_id, "guild_id": guild_id}, None))
+            return ok(self._selected_channel())
+
+        if cmd == "SET_ACTIVITY":
+            self.activity = args.get("activity")
+            return ok(self.activity)
+
+        if cmd == "SUBSCRIBE":
+            evt = payload.get("evt")
+            if not evt:
+                return error(ERROR_INVALID_PAYLOAD, "Missing evt")
+            conn.subscriptions.add((evt, args.get("channel_id")))
+            return ok({"evt": evt}, evt)
+
+        if cmd == "UNSUBSCRIBE":
+            evt = payload.get("evt")
+            conn.subscriptions.discard((evt, args.get("channel_id")))
+            return ok({"evt": evt}, evt)
+
+        return error(ERROR_INVALID_COMMAND, f"Invalid command: {cmd}")
+
+    # ==================== EVENTS ====================
+
+    def dispatch(self, evt: str, data: Dict[str, Any], channel_id: Optional[str] = None) -> int:
+        """
+        Send a DISPATCH event to every connection subscribed to it.
+
+        Subscriptions with a channel_id only receive events for that
+        channel; subscriptions without one receive all of them.
+
+        Args:
+            evt: Event name
+            data: Event data
+            channel_id: Channel the event belongs to
+
+        Returns:
+            Number of connections the event was sent to
+        """
+        frame = {"cmd": "DISPATCH", "evt": evt, "nonce": None, "data": data}
+
+        with self._lock:
+            targets = [
+                conn for conn in self._connections
+                if conn.authenticated and (
+                    (evt, None) in conn.subscriptions
+                    or (channel_id is not None and (evt, channel_id) in conn.subscriptions)
+                )
+            ]
+
+        sent = sum(1 for conn in targets if self._send(conn, OP_FRAME, frame))
+        with self._lock:
+            self.events_sent += sent
+        return sent
+
+    def add_member(self) -> Dict[str, Any]:
+        """Add a member to the selected channel and dispatch VOICE_STATE_CREATE."""
+        with self._lock:
+            voice_state = self._add_voice_state(len(self.voice_states) + 1000)
+        self.dispatch("VOICE_STATE_CREATE", voice_state, self.selected_channel_id)
+        return voice_state
+
+    def remove_member(self, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Remove a member (the last one by default) and dispatch VOICE_STATE_DELETE."""
+        with self._lock:
+            if user_id is None:
+                others = [uid for uid in self.voice_states if uid != self.user["id"]]
+                if not others:
+                    return None
+                user_id = others[-1]
+            voice_state = self.voice_states.pop(user_id, None)
+        if voice_state is not None:
+            self.dispatch("VOICE_STATE_DELETE", voice_state, self.selected_channel_id)
+        return voice_state
+
+    def storm(self, rate: float = 200.0, seconds: float = 1.0, background: bool = False) -> int:
+        """
+        Flood subscribers with speaking and voice state events.
+
+        Each tick picks a random member and sends SPEAKING_START,
+        SPEAKING_STOP or VOICE_STATE_UPDATE (mute toggled).
+
+        Args:
+            rate: Events per second
+            seconds: Storm duration
+            background: Run on a thread and return immediately
+
+        Returns:
+            Number of events generated (0 when run in the background)
+        """
+        if background:
+            self._spawn(self.storm, "fake-ipc-storm", rate, seconds)
+            return 0
+
+        interval = 1.0 / rate if rate > 0 else 0
+        deadline = time.monotonic() + seconds
+        count = 0
+
+        while self._running and time.monotonic() < deadline:
+            with self._lock:
+                user_ids = list(self.voice_states)
+            if not user_ids or self.selected_channel_id is None:
+                break
+
+            user_id = self._random.choice(user_ids)
+            kind = self._random.random()
+            channel_id = self.selected_channel_id
+
+            if kind < 0.4:
+                self.dispatch("SPEAKING_START", {"channel_id": channel_id, "user_id": user_id}, channel_id)
+            elif kind < 0.8:
+                self.dispatch("SPEAKING_STOP", {"channel_id": channel_id, "user_id": user_id}, channel_id)
+            else:
+                with self._lock:
+                    voice_state = self.voice_states.get(user_id)
+                    if voice_state is None:
+                        continue
+                    inner = voice_state["voice_state"]
+                    inner["self_mute"] = not inner["self_mute"]
+                self.dispatch("VOICE_STATE_UPDATE", voice_state, channel_id)
+
+            count += 1
+            if interval:
+                time.sleep(interval)
+
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get command and event counters."""
+        with self._lock:
+            return {
+                "connections": len(self._connections),
+                "commands": dict(self.commands),
+                "events_sent": self.events_sent,
+            }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake Discord IPC server")
+    parser.add_argument("--dir", default=None, help="Socket directory (default: new temp dir)")
+    parser.add_argument("--index", type=int, default=0, help="N in discord-ipc-N")
+    parser.add_argument("--guilds", type=int, default=1)
+    parser.add_argument("--channels", type=int, default=4, help="Channels per guild")
+    parser.add_argument("--members", type=int, default=2, help="Members in the selected voice channel")
+    parser.add_argument("--latency", type=float, default=0.0, help="Reply delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra reply delay in seconds")
+    parser.add_argument("--fragment", type=int, default=0, help="Write frames in chunks of N bytes")
+    parser.add_argument("--fragment-delay", type=float, default=0.0, help="Pause between chunks")
+    parser.add_argument("--token", action="append", help="Accepted access token (repeatable; default any)")
+    parser.add_argument("--storm", type=float, default=0.0, help="Events per second once a client subscribes")
+    parser.add_argument("--storm-seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    server = FakeDiscordServer(
+        args.dir, args.index,
+        guilds=args.guilds, channels=args.channels, members=args.members,
+        latency=args.latency, jitter=args.jitter,
+        fragment=args.fragment, fragment_delay=args.fragment_delay,
+        valid_tokens=args.token,
+    ).start()
+    print(f"Listening on {server.path}", flush=True)
+
+    try:
+        while True:
+            if args.storm and server.get_stats()["connections"]:
+                time.sleep(1)
+                print(f"Storm: {server.storm(args.storm, args.storm_seconds)} events", flush=True)
+                args.storm = 0
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
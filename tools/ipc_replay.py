@@ -0,0 +1,288 @@
+"""
+Replay a recorded IPC session through the fake Discord server.
+
+Recordings come from the plugin's start_ipc_recording/stop_ipc_recording
+callables (or DiscordRPCClient(recorder=FrameRecorder(path))). Replay
+serves the recorded replies and pushes the recorded DISPATCH events on
+their original schedule, scaled by --speed. A field workload (a huge
+account, a channel full of speaking events) can then be benchmarked or
+profiled on a desk, the same way every time.
+
+Modes:
+    drive (default)  A DiscordRPCClient re-issues the recorded commands
+                     on their recorded schedule and reports RPC metrics
+    --serve          Only serve; point the plugin or a benchmark at the
+                     printed socket path (Plugin.ipc_path)
+
+Usage:
+    python tools/ipc_replay.py discord-lite-ipc-20250101-120000.dlrec
+    python tools/ipc_replay.py session.dlrec --speed 10
+    python tools/ipc_replay.py session.dlrec --speed 0 --json   # as fast as possible
+    python tools/ipc_replay.py session.dlrec --serve
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from backend.discord_rpc.client import DiscordRPCClient  # noqa: E402
+from backend.discord_rpc.recorder import DIRECTION_RECEIVED, DIRECTION_SENT, read_recording  # noqa: E402
+from tools.fake_ipc_server import OP_FRAME, OP_HANDSHAKE, FakeDiscordServer  # noqa: E402
+
+# Token sent when re-authenticating (the recorded one is redacted)
+REPLAY_TOKEN = "replay-token"
+
+
+class Recording:
+    """A recorded session split into client commands, replies and events"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.client_id = "replay"
+        # (seconds, payload) of frames the plugin sent
+        self.commands: List[Tuple[float, Dict[str, Any]]] = []
+        # cmd -> recorded replies in order
+        self.replies: Dict[str, List[Dict[str, Any]]] = {}
+        # (seconds, payload) of DISPATCH events other than READY
+        self.events: List[Tuple[float, Dict[str, Any]]] = []
+        # Time of the first successful AUTHENTICATE reply (event timeline origin)
+        self.auth_time = 0.0
+
+        authenticated = False
+        for seconds, direction, opcode, payload in read_recording(path):
+            if not isinstance(payload, dict):
+                continue
+
+            if direction == DIRECTION_SENT:
+                if opcode == OP_HANDSHAKE:
+                    self.client_id = payload.get("client_id") or self.client_id
+                elif opcode == OP_FRAME:
+                    self.commands.append((seconds, payload))
+                continue
+
+            if direction != DIRECTION_RECEIVED or opcode != OP_FRAME:
+                continue
+
+            cmd = payload.get("cmd")
+            if cmd == "DISPATCH":
+                if payload.get("evt") != "READY":
+                    self.events.append((seconds, payload))
+                continue
+
+            self.replies.setdefault(cmd, []).append(payload)
+            if cmd == "AUTHENTICATE" and payload.get("evt") != "ERROR" and not authenticated:
+                authenticated = True
+                self.auth_time = seconds
+
+    def duration(self) -> float:
+        """Seconds from the first to the last recorded frame."""
+        times = [t for t, _ in self.commands] + [t for t, _ in self.events]
+        return max(times) - min(times) if times else 0.0
+
+
+class ReplayServer(FakeDiscordServer):
+    """
+    Fake server answering with recorded replies.
+
+    Each command gets the next recorded reply for that command (the last
+    one repeats once they run out), with the nonce of the live request.
+    Commands never seen in the recording fall back to the synthetic
+    FakeDiscordServer behaviour. Recorded events start playing when the
+    first client authenticates, unless play_events is False (the caller
+    then sends them with dispatch_recorded()).
+    """
+
+    def __init__(self, recording: Recording, directory: Optional[str] = None,
+                 speed: float = 1.0, play_events: bool = True, **kwargs):
+        """
+        Initialize replay server.
+
+        Args:
+            recording: Loaded recording
+            directory: Socket directory (a temporary one if None)
+            speed: Event timeline speed (1 = original, 0 = no delays)
+            play_events: Play recorded events on their own schedule
+            **kwargs: Passed to FakeDiscordServer (latency, fragment, ...)
+        """
+        super().__init__(directory, guilds=0, members=0, **kwargs)
+        self.recording = recording
+        self.speed = speed
+        self.play_events = play_events
+        self._replies: Dict[str, Deque[Dict[str, Any]]] = {
+            cmd: deque(replies) for cmd, replies in recording.replies.items()
+        }
+        self._timeline_started = threading.Event()
+        self.timeline_done = threading.Event()
+
+    def _handle(self, conn, payload: Dict[str, Any]):
+        cmd = payload.get("cmd")
+        queue = self._replies.get(cmd)
+
+        if cmd in ("SUBSCRIBE", "UNSUBSCRIBE") or not queue:
+            return super()._handle(conn, payload)
+
+        with self._lock:
+            self.commands[cmd] = self.commands.get(cmd, 0) + 1
+            recorded = queue.popleft() if len(queue) > 1 else queue[0]
+
+        reply = {**recorded, "nonce": payload.get("nonce")}
+
+        if cmd == "AUTHENTICATE" and reply.get("evt") != "ERROR":
+            conn.authenticated = True
+            if self.play_events:
+                self.start_timeline()
+
+        return reply, []
+
+    def timeline_started(self) -> bool:
+        """True once recorded events started playing."""
+        return self._timeline_started.is_set()
+
+    def start_timeline(self) -> None:
+        """Start pushing recorded events (once)."""
+        if self._timeline_started.is_set():
+            return
+        self._timeline_started.set()
+        self._spawn(self._play_events, "replay-events")
+
+    def _play_events(self) -> None:
+        start = time.monotonic()
+        origin = self.recording.auth_time
+
+        for seconds, payload in self.recording.events:
+            if not self._running:
+                break
+
+            if self.speed > 0:
+                delay = max(0.0, seconds - origin) / self.speed - (time.monotonic() - start)
+                if delay > 0:
+                    time.sleep(delay)
+
+            self.dispatch_recorded(payload)
+
+        self.timeline_done.set()
+
+    def dispatch_recorded(self, payload: Dict[str, Any]) -> int:
+        """Send one recorded DISPATCH event to its subscribers."""
+        data = payload.get("data") or {}
+        return self.dispatch(payload.get("evt"), data, data.get("channel_id") if isinstance(data, dict) else None)
+
+
+def drive(recording: Recording, server: ReplayServer, speed: float) -> Dict[str, Any]:
+    """
+    Re-issue the recorded commands against the replay server.
+
+    Between commands, waiting events are pumped the way the plugin's
+    event_pump job does. With speed 0 there is no schedule to follow, so
+    events are sent in their recorded order relative to the commands
+    (the server must be created with play_events=False).
+
+    Returns:
+        Dictionary with wall time, command count and the client's RPC metrics
+    """
+    client = DiscordRPCClient(recording.client_id, ipc_path=server.path)
+    if not client.connect():
+        raise RuntimeError(f"Could not connect to {server.path}")
+
+    start = time.monotonic()
+    origin = recording.commands[0][0] if recording.commands else 0.0
+    pending = deque(recording.events) if not server.play_events else deque()
+
+    for seconds, payload in recording.commands:
+        while pending and pending[0][0] <= seconds:
+            server.dispatch_recorded(pending.popleft()[1])
+
+        if speed > 0:
+            due = start + (seconds - origin) / speed
+            while time.monotonic() < due:
+                client.pump_events()
+                time.sleep(min(0.01, max(0.0, due - time.monotonic())))
+
+        cmd = payload.get("cmd")
+        args = payload.get("args")
+
+        if cmd == "SUBSCRIBE":
+            client.subscribe(payload.get("evt"), args)
+        elif cmd == "UNSUBSCRIBE":
+            client.unsubscribe(payload.get("evt"), args)
+        elif cmd == "AUTHENTICATE":
+            client.authenticate(REPLAY_TOKEN)
+        else:
+            client.send_command(cmd, args)
+
+        client.pump_events()
+
+    # Let the rest of the event timeline arrive
+    while pending:
+        server.dispatch_recorded(pending.popleft()[1])
+        client.pump_events()
+    while server.timeline_started() and not server.timeline_done.wait(0.01):
+        client.pump_events()
+    time.sleep(0.05)
+    client.pump_events(max_events=100000)
+
+    wall = time.monotonic() - start
+    client.disconnect()
+
+    # Counted by the client, including events that arrived inside a command
+    metrics = client.metrics.snapshot()
+
+    return {
+        "recording": recording.path,
+        "speed": speed,
+        "recorded_seconds": round(recording.duration(), 3),
+        "wall_seconds": round(wall, 3),
+        "commands": len(recording.commands),
+        "events_received": sum(metrics["events"].values()),
+        "rpc": metrics,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded Discord IPC session")
+    parser.add_argument("recording", help="Log written by start_ipc_recording (.dlrec)")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = original timing, 10 = 10x faster, 0 = no delays")
+    parser.add_argument("--serve", action="store_true", help="Only serve; do not drive a client")
+    parser.add_argument("--dir", default=None, help="Socket directory (default: new temp dir)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Extra reply delay in seconds")
+    parser.add_argument("--json", action="store_true", help="Print the drive report as JSON")
+    args = parser.parse_args()
+
+    recording = Recording(args.recording)
+    server = ReplayServer(recording, args.dir, speed=args.speed, play_events=args.serve or args.speed > 0,
+                          latency=args.latency).start()
+
+    try:
+        if args.serve:
+            print(f"Listening on {server.path}", flush=True)
+            print(f"Replaying {len(recording.replies)} command types, {len(recording.events)} events", flush=True)
+            while True:
+                time.sleep(0.5)
+
+        report = drive(recording, server, args.speed)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print(f"Replayed {report['commands']} commands and {report['events_received']} events "
+                  f"in {report['wall_seconds']}s (recorded {report['recorded_seconds']}s)")
+            for cmd, stats in sorted(report["rpc"]["commands"].items()):
+                latency = stats["latency"]
+                print(f"  {cmd:<28} n={stats['count']:<5} p50={latency['p50_ms']} p95={latency['p95_ms']} ms")
+
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
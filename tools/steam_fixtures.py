@@ -0,0 +1,275 @@
+"""
+Synthetic /proc trees and Steam libraries for game detector benchmarks.
+
+Builds directory trees that SteamGameDetector can be pointed at with its
+proc_root/home/media_root arguments:
+
+    <root>/proc/<pid>/cmdline          NUL-separated argv, like procfs
+    <root>/home/.local/share/Steam/steamapps/appmanifest_<appid>.acf
+    <root>/home/.local/share/Steam/userdata/<id>/config/shortcuts.vdf
+    <root>/media/<label>/steamapps/...  external libraries (SD card, USB)
+
+Process trees mimic a Deck in Game Mode: kernel threads (empty cmdline),
+desktop/session services, a pile of steamwebhelper processes, and for
+each running game the reaper wrapper (the only process carrying
+"SteamLaunch AppId=N"), the Steam Linux Runtime entry point,
+pressure-vessel, Proton, wineserver and the game's .exe.
+
+Usage:
+    python tools/steam_fixtures.py /tmp/steam-fixture --processes 2000 --manifests 5000
+"""
+
+import argparse
+import os
+import random
+import struct
+import tempfile
+from typing import Dict, List, Optional
+
+STEAM_DIR = "/home/deck/.local/share/Steam"
+COMMON_DIR = f"{STEAM_DIR}/steamapps/common"
+PROTON = f"{COMMON_DIR}/Proton - Experimental/proton"
+SNIPER_ENTRY = f"{COMMON_DIR}/SteamLinuxRuntime_sniper/_v2-entry-point"
+PRESSURE_VESSEL = f"{COMMON_DIR}/SteamLinuxRuntime_sniper/pressure-vessel/bin/pressure-vessel-wrap"
+
+# Long-running processes seen on a Deck besides games
+BACKGROUND_COMMANDS = [
+    ["/usr/lib/systemd/systemd", "--user"],
+    ["/usr/bin/gamescope", "--generate-drm-mode", "fixed", "--max-scale", "2"],
+    ["/usr/bin/pipewire"],
+    ["/usr/bin/wireplumber"],
+    ["/usr/lib/xdg-desktop-portal"],
+    ["/usr/bin/dbus-broker-launch", "--scope", "user"],
+    [f"{STEAM_DIR}/ubuntu12_32/steam", "-steamdeck", "-steamos3", "-gamepadui"],
+    ["python3", "/home/deck/homebrew/services/PluginLoader"],
+    ["bwrap", "--args", "41", "--", "discord", "--enable-features=UseOzonePlatform"],
+    ["/usr/bin/flatpak-session-helper"],
+]
+WEBHELPER = [f"{STEAM_DIR}/ubuntu12_64/steamwebhelper", "--type=renderer", "--lang=en-US",
+             "--enable-blink-features=ResizeObserver", "--buildid=1714853214"]
+
+
+def _write_cmdline(proc_root: str, pid: int, argv: List[str]) -> None:
+    path = os.path.join(proc_root, str(pid))
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "cmdline"), "wb") as f:
+        f.write(b"".join(arg.encode() + b"\0" for arg in argv))
+
+
+def game_process_tree(appid: str, exe: str = "Game.exe") -> List[List[str]]:
+    """
+    Command lines of one game launched through Proton.
+
+    Args:
+        appid: Steam app ID (or 64-bit shortcut game ID)
+        exe: Game executable name
+
+    Returns:
+        List of argv lists, reaper wrapper first
+    """
+    game_dir = f"{COMMON_DIR}/Game{appid}"
+    return [
+        [f"{STEAM_DIR}/ubuntu12_32/reaper", "SteamLaunch", f"AppId={appid}", "--",
+         f"{STEAM_DIR}/ubuntu12_32/steam-launch-wrapper", "--", SNIPER_ENTRY,
+         "--verb=waitforexitandrun", "--", PROTON, "waitforexitandrun", f"{game_dir}/{exe}"],
+        [SNIPER_ENTRY, "--verb=waitforexitandrun", "--", PROTON, "waitforexitandrun", f"{game_dir}/{exe}"],
+        [PRESSURE_VESSEL, "--batch", "--", PROTON, "waitforexitandrun", f"{game_dir}/{exe}"],
+        ["python3", PROTON, "waitforexitandrun", f"{game_dir}/{exe}"],
+        [f"{COMMON_DIR}/Proton - Experimental/files/bin/wineserver"],
+        ["C:\\windows\\system32\\services.exe"],
+        ["C:\\windows\\system32\\winedevice.exe"],
+        ["C:\\windows\\system32\\explorer.exe", "/desktop"],
+        [f"Z:{game_dir.replace('/', chr(92))}\\{exe}"],
+    ]
+
+
+def make_proc_tree(root: str, processes: int = 500, games: Optional[List[str]] = None,
+                   game_position: str = "end", seed: int = 0) -> str:
+    """
+    Build a fake procfs tree.
+
+    Args:
+        root: Directory to create the tree in (becomes proc_root)
+        processes: Total number of PIDs
+        games: App IDs of running games (each adds a Proton process tree)
+        game_position: "start", "end" or "random" placement of game PIDs
+        seed: Random seed
+
+    Returns:
+        proc_root path
+    """
+    rng = random.Random(seed)
+    games = games or []
+
+    game_trees = [argv for appid in games for argv in game_process_tree(appid)]
+    filler = max(0, processes - len(game_trees))
+
+    commands: List[List[str]] = []
+    for i in range(filler):
+        kind = rng.random()
+        if kind < 0.35:
+            commands.append([])  # Kernel thread: empty cmdline
+        elif kind < 0.75:
+            commands.append(WEBHELPER + [f"--renderer-client-id={i}"])
+        else:
+            commands.append(rng.choice(BACKGROUND_COMMANDS))
+
+    if game_position == "start":
+        commands = game_trees + commands
+    elif game_position == "random":
+        for argv in game_trees:
+            commands.insert(rng.randrange(len(commands) + 1), argv)
+    else:
+        commands = commands + game_trees
+
+    os.makedirs(root, exist_ok=True)
+    for pid, argv in enumerate(commands, start=1):
+        _write_cmdline(root, pid, argv)
+
+    # Non-PID entries the scan has to skip
+    for name in ("self", "sys", "net"):
+        os.makedirs(os.path.join(root, name), exist_ok=True)
+
+    return root
+
+
+def _manifest(appid: str, name: str) -> str:
+    return (
+        '"AppState"\n{\n'
+        f'\t"appid"\t\t"{appid}"\n'
+        '\t"universe"\t\t"1"\n'
+        f'\t"name"\t\t"{name}"\n'
+        '\t"StateFlags"\t\t"4"\n'
+        f'\t"installdir"\t\t"Game{appid}"\n'
+        '\t"SizeOnDisk"\t\t"1073741824"\n'
+        '\t"buildid"\t\t"12345678"\n'
+        '\t"InstalledDepots"\n\t{\n'
+        f'\t\t"{int(appid) + 1}"\n\t\t{{\n\t\t\t"manifest"\t\t"1234567890123456789"\n'
+        '\t\t\t"size"\t\t"1073741824"\n\t\t}\n\t}\n'
+        '}\n'
+    )
+
+
+def _shortcuts_vdf(shortcuts: Dict[int, str]) -> bytes:
+    """Binary shortcuts.vdf with appid/AppName/Exe per entry."""
+    out = bytearray(b"\x00shortcuts\x00")
+    for index, (appid, name) in enumerate(shortcuts.items()):
+        out += b"\x00" + str(index).encode() + b"\x00"
+        out += b"\x02appid\x00" + struct.pack("<i", appid - (1 << 32) if appid >= 1 << 31 else appid)
+        out += b"\x01AppName\x00" + name.encode() + b"\x00"
+        out += b"\x01Exe\x00" + f'"/usr/bin/{name.lower().replace(" ", "-")}"'.encode() + b"\x00"
+        out += b"\x08"
+    out += b"\x08\x08"
+    return bytes(out)
+
+
+def make_steam_home(home: str, manifests: int = 100, libraries: int = 1,
+                    media_root: Optional[str] = None, shortcuts: int = 0,
+                    first_appid: int = 10000) -> Dict[str, List[str]]:
+    """
+    Build Steam libraries and userdata under a fake home directory.
+
+    Manifests are spread round-robin over the internal library and
+    libraries - 1 external ones under media_root.
+
+    Args:
+        home: Fake home directory (becomes the detector's home)
+        manifests: Total number of appmanifest files
+        libraries: Number of libraries (1 = internal only)
+        media_root: Root for external libraries (required if libraries > 1)
+        shortcuts: Number of non-Steam shortcuts
+        first_appid: First app ID (IDs are consecutive)
+
+    Returns:
+        Dictionary with "appids" (installed) and "shortcut_appids"
+    """
+    library_dirs = [os.path.join(home, ".local/share/Steam/steamapps")]
+    for i in range(1, libraries):
+        if media_root is None:
+            raise ValueError("media_root is required for external libraries")
+        library_dirs.append(os.path.join(media_root, f"card{i}", "steamapps"))
+
+    for path in library_dirs:
+        os.makedirs(path, exist_ok=True)
+
+    appids = []
+    for i in range(manifests):
+        appid = str(first_appid + i)
+        path = os.path.join(library_dirs[i % len(library_dirs)], f"appmanifest_{appid}.acf")
+        with open(path, "w") as f:
+            f.write(_manifest(appid, f"Synthetic Game {appid}"))
+        appids.append(appid)
+
+    shortcut_appids = []
+    if shortcuts:
+        entries = {0x80000000 + i: f"Shortcut {i}" for i in range(shortcuts)}
+        config = os.path.join(home, ".local/share/Steam/userdata/12345678/config")
+        os.makedirs(config, exist_ok=True)
+        with open(os.path.join(config, "shortcuts.vdf"), "wb") as f:
+            f.write(_shortcuts_vdf(entries))
+        shortcut_appids = [str(appid) for appid in entries]
+
+    return {"appids": appids, "shortcut_appids": shortcut_appids}
+
+
+def make_fixture(root: Optional[str] = None, processes: int = 500, manifests: int = 100,
+                 libraries: int = 1, shortcuts: int = 0, games: Optional[List[str]] = None,
+                 game_position: str = "end", seed: int = 0) -> Dict[str, object]:
+    """
+    Build a complete fixture (proc tree, home, media root).
+
+    Args:
+        root: Base directory (a temporary one if None)
+        processes: Total number of PIDs
+        manifests: Total number of appmanifest files
+        libraries: Number of Steam libraries
+        shortcuts: Number of non-Steam shortcuts
+        games: App IDs of running games (None = first installed app ID)
+        game_position: Placement of game PIDs in the proc tree
+        seed: Random seed
+
+    Returns:
+        Dictionary with proc_root, home, media_root, appids and shortcut_appids
+        (pass the first three straight to SteamGameDetector)
+    """
+    root = root or tempfile.mkdtemp(prefix="steam-fixture-")
+    home = os.path.join(root, "home")
+    media_root = os.path.join(root, "media")
+    os.makedirs(media_root, exist_ok=True)
+
+    installed = make_steam_home(home, manifests, libraries, media_root, shortcuts)
+    if games is None:
+        games = installed["appids"][:1]
+
+    proc_root = make_proc_tree(os.path.join(root, "proc"), processes, games, game_position, seed)
+
+    return {
+        "proc_root": proc_root,
+        "home": home,
+        "media_root": media_root,
+        **installed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic /proc and Steam library tree")
+    parser.add_argument("root", nargs="?", default=None, help="Output directory (default: new temp dir)")
+    parser.add_argument("--processes", type=int, default=500)
+    parser.add_argument("--manifests", type=int, default=100)
+    parser.add_argument("--libraries", type=int, default=1)
+    parser.add_argument("--shortcuts", type=int, default=0)
+    parser.add_argument("--game", action="append", help="Running game app ID (repeatable; default first manifest)")
+    parser.add_argument("--idle", action="store_true", help="No running game")
+    parser.add_argument("--game-position", choices=("start", "end", "random"), default="end")
+    args = parser.parse_args()
+
+    fixture = make_fixture(
+        args.root, args.processes, args.manifests, args.libraries, args.shortcuts,
+        [] if args.idle else args.game, args.game_position,
+    )
+    for key in ("proc_root", "home", "media_root"):
+        print(f"{key}={fixture[key]}")
+
+
+if __name__ == "__main__":
+    main()
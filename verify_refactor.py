@@ -25,12 +25,34 @@ def test_imports():
         ("backend.voice.volume", "perceptual_to_amplitude"),
         ("backend.voice.controller", "VoiceController"),
         ("backend.voice.members", "MemberTracker"),
+        ("backend.voice.state", "VoiceSnapshot"),
+        ("backend.voice.event_coalescer", "MemberEventCoalescer"),
+        ("backend.voice.speaking_stream", "SpeakingStream"),
         ("backend.steam.game_detector", "SteamGameDetector"),
         ("backend.steam.activity_sync", "ActivitySyncManager"),
+        ("backend.steam.library_watcher", "SteamLibraryWatcher"),
+        ("backend.steam.shortcuts", "ShortcutIndex"),
         ("backend.polling.voice_poller", "VoicePoller"),
+        ("backend.polling.scheduler", "JobScheduler"),
+        ("backend.polling.event_log", "EventLog"),
+        ("backend.polling.policy", "PolicyEngine"),
+        ("backend.polling.priority", "apply_thread_priority"),
         ("backend.utils.cache", "LRUCache"),
         ("backend.utils.settings", "SettingsManager"),
         ("backend.utils.socket_finder", "find_discord_ipc_socket"),
+        ("backend.utils.socket_finder", "IPCSocketFinder"),
+        ("backend.utils.inotify", "InotifyWatcher"),
+        ("backend.utils.single_flight", "SingleFlight"),
+        ("backend.utils.response_cache", "ResponseCache"),
+        ("backend.utils.histogram", "Histogram"),
+        ("backend.utils.log", "PluginLogger"),
+        ("backend.utils.tracing", "Tracer"),
+        ("backend.utils.profiler", "StackSampler"),
+        ("backend.utils.profiler", "MemoryProfiler"),
+        ("backend.discord_rpc.metrics", "RPCMetrics"),
+        ("backend.discord_rpc.recorder", "FrameRecorder"),
+        ("backend.utils.lazy", "LazyRegistry"),
+        ("backend.utils.ssl_context", "get_ssl_context"),
     ]
 
     passed = 0